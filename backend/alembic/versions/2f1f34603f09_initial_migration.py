@@ -20,13 +20,42 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.create_table(
+        'customers',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Customer unique identifier'),
+        sa.Column('first_name', sa.String(length=100), nullable=False, comment="Customer's first name"),
+        sa.Column('last_name', sa.String(length=100), nullable=False, comment="Customer's last name"),
+        sa.Column('email', sa.String(length=255), nullable=False, comment="Customer's email address (unique)"),
+        sa.Column('phone', sa.String(length=20), nullable=True, comment="Customer's phone number"),
+        sa.Column('address', sa.String(length=500), nullable=True, comment="Customer's address"),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='Record creation timestamp'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Record last update timestamp'),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_customers_email', 'customers', ['email'], unique=True, if_not_exists=True)
+
+    op.create_table(
+        'loan_offers',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Loan offer unique identifier'),
+        sa.Column('customer_id', sa.Integer(), nullable=False, comment='Reference to customer'),
+        sa.Column('loan_amount', sa.Numeric(precision=12, scale=2), nullable=False, comment='Principal loan amount in EUR'),
+        sa.Column('interest_rate', sa.Numeric(precision=5, scale=2), nullable=False, comment='Annual interest rate as percentage (e.g., 5.50)'),
+        sa.Column('term_months', sa.Integer(), nullable=False, comment='Loan term in months'),
+        sa.Column('monthly_payment', sa.Numeric(precision=12, scale=2), nullable=False, comment='Calculated monthly payment'),
+        sa.Column('total_payment', sa.Numeric(precision=12, scale=2), nullable=False, comment='Total amount to be paid'),
+        sa.Column('total_interest', sa.Numeric(precision=12, scale=2), nullable=False, comment='Total interest to be paid'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='Record creation timestamp'),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_loan_offers_customer_id', 'loan_offers', ['customer_id'], unique=False, if_not_exists=True)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.drop_index('ix_loan_offers_customer_id', table_name='loan_offers')
+    op.drop_table('loan_offers')
+    op.drop_index('ix_customers_email', table_name='customers')
+    op.drop_table('customers')
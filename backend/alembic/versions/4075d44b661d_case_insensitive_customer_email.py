@@ -0,0 +1,49 @@
+"""Case-insensitive customer email uniqueness
+
+Revision ID: 4075d44b661d
+Revises: 2f1f34603f09
+Create Date: 2026-10-18 09:12:40.118203
+
+Emails are normalized (trimmed, lowercased) and the plain unique
+index on email is replaced by a unique index on lower(email).
+Fails if existing emails differ only by case; merge those first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4075d44b661d'
+down_revision: Union[str, Sequence[str], None] = '2f1f34603f09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE customers SET email = lower(trim(email)) "
+        "WHERE email <> lower(trim(email))"
+    )
+    op.create_index(
+        'uq_customers_email_lower',
+        'customers',
+        [sa.text('lower(email)')],
+        unique=True,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_customers_email', table_name='customers', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_customers_email',
+        'customers',
+        ['email'],
+        unique=True,
+        if_not_exists=True,
+    )
+    op.drop_index('uq_customers_email_lower', table_name='customers', if_exists=True)
@@ -0,0 +1,75 @@
+"""Composite indexes for the listing queries
+
+Revision ID: b3e8d1c2a9f4
+Revises: 4075d44b661d
+Create Date: 2026-10-18 10:05:31.402977
+
+Listings order by (created_at DESC, id DESC) and page with keyset
+conditions on the same columns. Matching composite indexes let the
+planner read a page straight from the index instead of sorting.
+The loan offer index also covers customer_id lookups (and the FK
+cascade), so the single-column index is dropped.
+
+Indexes are built CONCURRENTLY (outside a transaction), so the
+migration can run against a live database.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d1c2a9f4'
+down_revision: Union[str, Sequence[str], None] = '4075d44b661d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_customers_created_at_id',
+            'customers',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_loan_offers_customer_id_created_at_id',
+            'loan_offers',
+            ['customer_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_loan_offers_customer_id',
+            table_name='loan_offers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_loan_offers_customer_id',
+            'loan_offers',
+            ['customer_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_loan_offers_customer_id_created_at_id',
+            table_name='loan_offers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_customers_created_at_id',
+            table_name='customers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
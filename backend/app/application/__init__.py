@@ -3,22 +3,49 @@ from .dtos import (
     CustomerUpdateDTO,
     CustomerResponseDTO,
     CustomerWithLoanOffersDTO,
+    CustomerBulkDeleteDTO,
+    CustomerBulkDeleteResponseDTO,
+    CustomerImportErrorDTO,
+    CustomerImportResultDTO,
     LoanOfferCreateDTO,
+    LoanOfferBulkCreateDTO,
     LoanOfferResponseDTO,
     LoanCalculationDTO,
     LoanCalculationResponseDTO,
+    LoanCalculationBatchDTO,
+    LoanCalculationBatchItemDTO,
+    LoanOfferScheduleBatchDTO,
+    MaxPrincipalCalculationDTO,
+    MinTermCalculationDTO,
+    ImpliedRateCalculationDTO,
+    LoanSolutionResponseDTO,
+    LoanPaymentGridDTO,
+    LoanPaymentGridResponseDTO,
 )
 
 from .use_cases import (
     CreateCustomerUseCase,
+    UpsertCustomerUseCase,
     GetCustomerUseCase,
+    GetCustomerWithLoanOffersUseCase,
     ListCustomersUseCase,
     UpdateCustomerUseCase,
     DeleteCustomerUseCase,
+    DeleteCustomersUseCase,
+    ImportCustomersUseCase,
     CreateLoanOfferUseCase,
+    CreateLoanOffersUseCase,
     CalculateLoanUseCase,
+    CalculateLoanBatchUseCase,
     GetLoanOfferUseCase,
     ListCustomerLoanOffersUseCase,
+    CalculatePaymentGridUseCase,
+    CalculateMaxPrincipalUseCase,
+    CalculateMinTermUseCase,
+    CalculateImpliedRateUseCase,
+    CalculateLoanScheduleUseCase,
+    GetLoanOfferScheduleUseCase,
+    GetLoanOfferSchedulesUseCase,
 )
 
 from .interfaces import (
@@ -41,20 +68,47 @@ __all__ = [
     'CustomerUpdateDTO',
     'CustomerResponseDTO',
     'CustomerWithLoanOffersDTO',
+    'CustomerBulkDeleteDTO',
+    'CustomerBulkDeleteResponseDTO',
+    'CustomerImportErrorDTO',
+    'CustomerImportResultDTO',
     'LoanOfferCreateDTO',
+    'LoanOfferBulkCreateDTO',
     'LoanOfferResponseDTO',
     'LoanCalculationDTO',
     'LoanCalculationResponseDTO',
+    'LoanCalculationBatchDTO',
+    'LoanCalculationBatchItemDTO',
+    'LoanOfferScheduleBatchDTO',
+    'MaxPrincipalCalculationDTO',
+    'MinTermCalculationDTO',
+    'ImpliedRateCalculationDTO',
+    'LoanSolutionResponseDTO',
+    'LoanPaymentGridDTO',
+    'LoanPaymentGridResponseDTO',
     # Use Cases
     'CreateCustomerUseCase',
+    'UpsertCustomerUseCase',
     'GetCustomerUseCase',
+    'GetCustomerWithLoanOffersUseCase',
     'ListCustomersUseCase',
     'UpdateCustomerUseCase',
     'DeleteCustomerUseCase',
+    'DeleteCustomersUseCase',
+    'ImportCustomersUseCase',
     'CreateLoanOfferUseCase',
+    'CreateLoanOffersUseCase',
     'CalculateLoanUseCase',
+    'CalculateLoanBatchUseCase',
     'GetLoanOfferUseCase',
     'ListCustomerLoanOffersUseCase',
+    'CalculatePaymentGridUseCase',
+    'CalculateMaxPrincipalUseCase',
+    'CalculateMinTermUseCase',
+    'CalculateImpliedRateUseCase',
+    'CalculateLoanScheduleUseCase',
+    'GetLoanOfferScheduleUseCase',
+    'GetLoanOfferSchedulesUseCase',
     # Interfaces
     'ICustomerRepository',
     'ILoanOfferRepository',
@@ -2,13 +2,27 @@ from .customer_dto import (
     CustomerCreateDTO,
     CustomerUpdateDTO,
     CustomerResponseDTO,
-    CustomerWithLoanOffersDTO
+    CustomerWithLoanOffersDTO,
+    CustomerBulkDeleteDTO,
+    CustomerBulkDeleteResponseDTO,
+    CustomerImportErrorDTO,
+    CustomerImportResultDTO,
 )
 from .loan_offer_dto import (
     LoanOfferCreateDTO,
+    LoanOfferBulkCreateDTO,
     LoanOfferResponseDTO,
     LoanCalculationDTO,
     LoanCalculationResponseDTO,
+    LoanCalculationBatchDTO,
+    LoanCalculationBatchItemDTO,
+    LoanOfferScheduleBatchDTO,
+    MaxPrincipalCalculationDTO,
+    MinTermCalculationDTO,
+    ImpliedRateCalculationDTO,
+    LoanSolutionResponseDTO,
+    LoanPaymentGridDTO,
+    LoanPaymentGridResponseDTO,
 )
 
 __all__ = [
@@ -16,8 +30,22 @@ __all__ = [
     'CustomerUpdateDTO',
     'CustomerResponseDTO',
     'CustomerWithLoanOffersDTO',
+    'CustomerBulkDeleteDTO',
+    'CustomerBulkDeleteResponseDTO',
+    'CustomerImportErrorDTO',
+    'CustomerImportResultDTO',
     'LoanOfferCreateDTO',
+    'LoanOfferBulkCreateDTO',
     'LoanOfferResponseDTO',
     'LoanCalculationDTO',
     'LoanCalculationResponseDTO',
+    'LoanCalculationBatchDTO',
+    'LoanCalculationBatchItemDTO',
+    'LoanOfferScheduleBatchDTO',
+    'MaxPrincipalCalculationDTO',
+    'MinTermCalculationDTO',
+    'ImpliedRateCalculationDTO',
+    'LoanSolutionResponseDTO',
+    'LoanPaymentGridDTO',
+    'LoanPaymentGridResponseDTO',
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from .loan_offer_dto import LoanOfferResponseDTO
 
@@ -59,6 +59,49 @@ class CustomerUpdateDTO(BaseModel):
     address: Optional[str] = Field(None, max_length=500)
 
 
+class CustomerBulkDeleteDTO(BaseModel):
+    """
+    DTO for deleting many customers at once
+    """
+    customer_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Customer IDs (max 1,000)"
+    )
+
+
+class CustomerBulkDeleteResponseDTO(BaseModel):
+    """
+    Result of a bulk delete
+    """
+    deleted: List[int] = Field(..., description="IDs of deleted customers")
+    not_found: List[int] = Field(..., description="IDs that did not exist")
+
+
+class CustomerImportErrorDTO(BaseModel):
+    """
+    A rejected row of a customer import
+    """
+    line: int = Field(..., description="Line number in the uploaded file")
+    email: Optional[str] = None
+    error: str
+
+
+class CustomerImportResultDTO(BaseModel):
+    """
+    Result of a customer import
+    """
+    received: int = Field(..., description="Data rows read from the file")
+    imported: int
+    failed: int
+    errors: List[CustomerImportErrorDTO] = Field(
+        ...,
+        description="Rejected rows (capped, see errors_truncated)"
+    )
+    errors_truncated: bool = False
+
+
 class CustomerResponseDTO(BaseModel):
     """
     DTO for customer responses
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 
 class LoanOfferCreateDTO(BaseModel):
@@ -57,6 +57,18 @@ class LoanOfferCreateDTO(BaseModel):
     )
 
 
+class LoanOfferBulkCreateDTO(BaseModel):
+    """
+    DTO for creating many loan offers at once (all or nothing)
+    """
+    offers: List[LoanOfferCreateDTO] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Loan offers to create (max 5,000)"
+    )
+
+
 class LoanOfferResponseDTO(BaseModel):
     """
     Complete loan offer response
@@ -71,6 +83,10 @@ class LoanOfferResponseDTO(BaseModel):
     monthly_payment: Decimal
     total_payment: Decimal
     total_interest: Decimal
+    effective_annual_rate: Decimal = Field(
+        ...,
+        description="Effective annual rate (APR) in percent, monthly compounding"
+    )
     created_at: datetime
 
 
@@ -103,4 +119,180 @@ class LoanCalculationResponseDTO(BaseModel):
                 "total_interest": 272.84
             }
         }
-    )
\ No newline at end of file
+    )
+
+
+class MaxPrincipalCalculationDTO(BaseModel):
+    """
+    DTO for "how much can the customer borrow at X per month"
+    """
+    monthly_payment: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    interest_rate: Decimal = Field(..., ge=0, le=100)
+    term_months: int = Field(..., gt=0, le=360)
+    
+    @field_validator('monthly_payment', 'interest_rate')
+    @classmethod
+    def round_to_two_decimals(cls, v: Decimal) -> Decimal:
+        from decimal import ROUND_HALF_UP
+        return v.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+class MinTermCalculationDTO(BaseModel):
+    """
+    DTO for "how long does it take to repay at X per month"
+    """
+    loan_amount: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    interest_rate: Decimal = Field(..., ge=0, le=100)
+    monthly_payment: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    
+    @field_validator('loan_amount', 'interest_rate', 'monthly_payment')
+    @classmethod
+    def round_to_two_decimals(cls, v: Decimal) -> Decimal:
+        from decimal import ROUND_HALF_UP
+        return v.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+class ImpliedRateCalculationDTO(BaseModel):
+    """
+    DTO for "which rate makes this payment work"
+    """
+    loan_amount: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    monthly_payment: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    term_months: int = Field(..., gt=0, le=360)
+    
+    @field_validator('loan_amount', 'monthly_payment')
+    @classmethod
+    def round_to_two_decimals(cls, v: Decimal) -> Decimal:
+        from decimal import ROUND_HALF_UP
+        return v.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+class LoanSolutionResponseDTO(BaseModel):
+    """
+    Solved loan: the computed parameter plus the resulting payments
+    """
+    loan_amount: Decimal
+    interest_rate: Decimal
+    term_months: int
+    monthly_payment: Decimal
+    total_payment: Decimal
+    total_interest: Decimal
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "loan_amount": 10000.00,
+                "interest_rate": 5.5,
+                "term_months": 12,
+                "monthly_payment": 858.37,
+                "total_payment": 10300.44,
+                "total_interest": 300.44
+            }
+        }
+    )
+
+
+class LoanPaymentGridDTO(BaseModel):
+    """
+    DTO for a rate x term payment grid (calculator heatmap)
+    """
+    loan_amount: Decimal = Field(..., gt=0, le=Decimal('1000000'))
+    rate_min: Decimal = Field(..., ge=0, le=100, description="First interest rate (%)")
+    rate_max: Decimal = Field(..., ge=0, le=100, description="Last interest rate (%)")
+    rate_step: Decimal = Field(Decimal('0.25'), gt=0, le=100)
+    term_min: int = Field(..., gt=0, le=360, description="First term (months)")
+    term_max: int = Field(..., gt=0, le=360, description="Last term (months)")
+    term_step: int = Field(12, gt=0, le=360)
+    
+    @field_validator('loan_amount', 'rate_min', 'rate_max', 'rate_step')
+    @classmethod
+    def round_to_two_decimals(cls, v: Decimal) -> Decimal:
+        from decimal import ROUND_HALF_UP
+        return v.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    
+    @model_validator(mode='after')
+    def validate_axes(self) -> 'LoanPaymentGridDTO':
+        if self.rate_step == 0:
+            raise ValueError('rate_step must be at least 0.01')
+        if self.rate_min > self.rate_max:
+            raise ValueError('rate_min must not exceed rate_max')
+        if self.term_min > self.term_max:
+            raise ValueError('term_min must not exceed term_max')
+        cells = len(self.interest_rates()) * len(self.term_months())
+        if cells > 10000:
+            raise ValueError(f'Grid has {cells} cells, maximum is 10,000')
+        return self
+    
+    def interest_rates(self) -> List[Decimal]:
+        """Rate axis, rate_min to rate_max inclusive"""
+        count = int((self.rate_max - self.rate_min) / self.rate_step) + 1
+        return [self.rate_min + i * self.rate_step for i in range(count)]
+    
+    def term_months(self) -> List[int]:
+        """Term axis, term_min to term_max inclusive"""
+        return list(range(self.term_min, self.term_max + 1, self.term_step))
+
+
+class LoanPaymentGridResponseDTO(BaseModel):
+    """
+    Columnar payment grid
+    
+    monthly_payments is a flat row-major matrix:
+    monthly_payments[i * len(term_months) + j] is the payment
+    for interest_rates[i] and term_months[j]
+    """
+    loan_amount: Decimal
+    interest_rates: List[Decimal]
+    term_months: List[int]
+    monthly_payments: List[Decimal]
+
+
+class LoanCalculationBatchDTO(BaseModel):
+    """
+    DTO for batch calculation
+    
+    Items that aren't valid LoanCalculationDTOs are kept as they were
+    sent, so that they are reported in their result instead of failing
+    the whole batch
+    """
+    items: List[
+        Annotated[
+            Union[LoanCalculationDTO, Dict[str, Any]],
+            Field(union_mode='left_to_right')
+        ]
+    ] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Loans to calculate (max 5,000)"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {"loan_amount": 10000.00, "interest_rate": 5.5, "term_months": 12},
+                    {"loan_amount": 25000.00, "interest_rate": 3.9, "term_months": 60}
+                ]
+            }
+        }
+    )
+
+
+class LoanCalculationBatchItemDTO(BaseModel):
+    """Result of one batch item (same position as in the request)"""
+    index: int
+    result: Optional[LoanCalculationResponseDTO] = None
+    error: Optional[str] = None
+
+
+class LoanOfferScheduleBatchDTO(BaseModel):
+    """
+    DTO for streaming the schedules of many offers (reporting)
+    """
+    offer_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Loan offer IDs (max 1,000)"
+    )
@@ -1,8 +1,9 @@
 from .repositories import ICustomerRepository, ILoanOfferRepository
-from .unit_of_work import IUnitOfWork
+from .unit_of_work import IUnitOfWork, TransactionMode
 
 __all__ = [
     'ICustomerRepository',
     'ILoanOfferRepository',
     'IUnitOfWork',
+    'TransactionMode',
 ]
\ No newline at end of file
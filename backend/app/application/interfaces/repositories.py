@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
 from ..dtos.customer_dto import CustomerCreateDTO, CustomerUpdateDTO
 from ...domain.entities.customer import Customer
 from ...domain.entities.loan_offer import LoanOffer
@@ -20,6 +21,32 @@ class ICustomerRepository(ABC):
         
         Returns:
             Customer domain entity with generated ID
+        
+        Raises:
+            CustomerAlreadyExistsError: If the email is taken
+        """
+        pass
+    
+    @abstractmethod
+    async def upsert(self, customer_data: CustomerCreateDTO) -> Tuple[Customer, bool]:
+        """
+        Create a customer, or merge the data into the customer with
+        the same email
+        
+        Returns:
+            (customer, created)
+        """
+        pass
+    
+    @abstractmethod
+    async def create_many(self, customers: List[CustomerCreateDTO]) -> List[Customer]:
+        """
+        Create many customers in one statement
+        
+        Rows whose email already exists are skipped.
+        
+        Returns:
+            Created customers
         """
         pass
     
@@ -33,6 +60,13 @@ class ICustomerRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_existing_ids(self, customer_ids: List[int]) -> Set[int]:
+        """
+        Get which of the given customer IDs exist (one query)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[Customer]:
         """
@@ -52,6 +86,43 @@ class ICustomerRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_all_after(
+        self,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 100
+    ) -> List[Customer]:
+        """
+        Get customers with keyset pagination
+        
+        Args:
+            after: (created_at, id) of the last row of the previous page,
+                None for the first page
+            limit: Maximum number of records to return
+        """
+        pass
+    
+    @abstractmethod
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_count: bool = True
+    ) -> Tuple[List[Customer], Optional[int]]:
+        """
+        Get one page of customers and the total count in one query
+        
+        Args:
+            skip: Offset, ignored when after is given
+            after: Keyset position (see get_all_after)
+            with_count: Count all customers alongside the page
+        
+        Returns:
+            (customers, total), total is None without with_count
+        """
+        pass
+    
     @abstractmethod
     async def get_all_count(self) -> int:
         """
@@ -59,6 +130,14 @@ class ICustomerRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_all_count_estimate(self) -> int:
+        """
+        Get approximate count of customers from planner statistics
+        (falls back to the exact count when no statistics exist)
+        """
+        pass
+    
     @abstractmethod
     async def update(
         self,
@@ -70,6 +149,9 @@ class ICustomerRepository(ABC):
         
         Returns:
             Updated customer if found, None otherwise
+        
+        Raises:
+            CustomerAlreadyExistsError: If the new email is taken
         """
         pass
     
@@ -83,6 +165,16 @@ class ICustomerRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_many(self, customer_ids: List[int]) -> List[int]:
+        """
+        Delete customers in one statement (loan offers cascade)
+        
+        Returns:
+            IDs that were deleted (missing IDs are skipped)
+        """
+        pass
+    
     @abstractmethod
     async def exists_by_email(self, email: str) -> bool:
         """
@@ -101,11 +193,28 @@ class ILoanOfferRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def create_many(self, loan_offers: List[LoanOffer]) -> List[LoanOffer]:
+        """
+        Create many loan offers in one statement
+        
+        Returns:
+            Created offers with IDs, in input order
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, offer_id: int) -> Optional[LoanOffer]:
         """Get loan offer by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, offer_ids: List[int]) -> List[LoanOffer]:
+        """
+        Get loan offers by IDs (missing IDs are skipped)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_customer_id(
         self,
@@ -119,11 +228,54 @@ class ILoanOfferRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_by_customer_id_after(
+        self,
+        customer_id: int,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 100
+    ) -> List[LoanOffer]:
+        """
+        Get loan offers for a customer with keyset pagination
+        
+        Args:
+            after: (created_at, id) of the last row of the previous page,
+                None for the first page
+        """
+        pass
+    
+    @abstractmethod
+    async def get_page_by_customer_id(
+        self,
+        customer_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_count: bool = True
+    ) -> Optional[Tuple[List[LoanOffer], Optional[int]]]:
+        """
+        Get one page of a customer's loan offers, the total count and
+        the customer existence check in one query
+        
+        Returns:
+            (offers, total), total is None without with_count;
+            None if the customer doesn't exist
+        """
+        pass
+    
     @abstractmethod
     async def get_by_customer_id_count(self, customer_id: int) -> int:
         """Get count of loan offers for customer"""
         pass
     
+    @abstractmethod
+    async def get_by_customer_id_count_estimate(self, customer_id: int) -> int:
+        """
+        Get approximate count of loan offers for customer from planner
+        statistics (falls back to the exact count when unavailable)
+        """
+        pass
+    
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[LoanOffer]:
         """Get all loan offers with pagination"""
@@ -1,7 +1,25 @@
 from abc import ABC, abstractmethod
+from enum import Enum
 from .repositories import ICustomerRepository, ILoanOfferRepository
 
 
+class TransactionMode(str, Enum):
+    """
+    How a unit of work talks to the database
+    
+    - read_write: one transaction, made durable by commit
+    - read_only: no transaction (autocommit), each query sees the
+      latest data; for use cases that run a single query
+    - snapshot: one read-only REPEATABLE READ transaction, all
+      queries see the same data; for use cases that read several times
+    
+    Read-only units must not write and can't be committed.
+    """
+    READ_WRITE = "read_write"
+    READ_ONLY = "read_only"
+    SNAPSHOT = "snapshot"
+
+
 class IUnitOfWork(ABC):
     """
     Unit of Work interface
@@ -9,6 +27,7 @@ class IUnitOfWork(ABC):
 
     customers: ICustomerRepository
     loan_offers: ILoanOfferRepository
+    mode: TransactionMode = TransactionMode.READ_WRITE
 
     @abstractmethod
     async def __aenter__(self):
@@ -0,0 +1,168 @@
+"""
+Pagination helpers shared by listing use cases
+
+Keyset (cursor) pagination orders by (created_at DESC, id DESC) and
+continues strictly after the last row of the previous page, so deep
+pages cost the same as the first one. The cursor is opaque to clients.
+"""
+import base64
+import binascii
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from .exceptions import ValidationError
+
+T = TypeVar('T')
+
+# Position of the last row of a page: (created_at, id)
+CursorPosition = Tuple[datetime, int]
+
+
+class CountMode(str, Enum):
+    """
+    How a listing fills its total count
+    
+    - exact: SELECT count(*)
+    - estimated: database planner statistics (approximate, no table scan)
+    - cached: exact count reused for a TTL (may lag behind writes)
+    - none: no count query, total is null (use has_more)
+    """
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a listing"""
+    items: List[T]
+    total: Optional[int]
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+class CountCache:
+    """
+    Process-local TTL cache for listing counts
+    
+    Bounded: there is one entry per listing (e.g. per customer), so
+    expired entries are dropped on every set and the oldest entries
+    are evicted beyond maxsize. All entries share the TTL, so the
+    oldest entry is always the next to expire.
+    """
+    
+    def __init__(self, ttl_seconds: float = 30, maxsize: int = 10000):
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be positive, got {maxsize}")
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, count = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return count
+    
+    def set(self, key: Hashable, count: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + self._ttl, count)
+            self._entries.move_to_end(key)
+            while self._entries:
+                oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+                if expires_at >= now and len(self._entries) <= self._maxsize:
+                    break
+                del self._entries[oldest_key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TotalCount:
+    """
+    Total count of one listing request according to the count mode
+    
+    Exact counts are computed by the page query itself (inline), so
+    an exact listing still costs a single database round trip.
+    """
+    
+    def __init__(
+        self,
+        mode: CountMode,
+        cache: Optional[CountCache] = None,
+        cache_key: Hashable = None
+    ):
+        self.mode = mode
+        self._cache = cache
+        self._cache_key = cache_key
+        self._cached = (
+            cache.get(cache_key)
+            if mode == CountMode.CACHED and cache is not None
+            else None
+        )
+    
+    @property
+    def inline(self) -> bool:
+        """Whether the page query has to count the rows"""
+        return self.mode == CountMode.EXACT or (
+            self.mode == CountMode.CACHED and self._cached is None
+        )
+    
+    async def resolve(
+        self,
+        inline_total: Optional[int],
+        known_total: Optional[int],
+        estimated: Callable[[], Awaitable[int]]
+    ) -> Optional[int]:
+        """
+        Args:
+            inline_total: Count returned by the page query, if requested
+            known_total: Total derived from the page itself (last page)
+            estimated: Planner estimate, only awaited in estimated mode
+        """
+        if inline_total is not None:
+            if self.mode == CountMode.CACHED and self._cache is not None:
+                self._cache.set(self._cache_key, inline_total)
+            return inline_total
+        if self._cached is not None:
+            return self._cached
+        if known_total is not None:
+            return known_total
+        if self.mode == CountMode.ESTIMATED:
+            return await estimated()
+        return None
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Opaque cursor pointing after the given row"""
+    payload = json.dumps([created_at.isoformat(), id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """
+    Decode a cursor produced by encode_cursor
+    
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise ValidationError("Invalid pagination cursor")
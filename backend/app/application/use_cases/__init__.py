@@ -1,25 +1,51 @@
 from .customer import (
     CreateCustomerUseCase,
+    UpsertCustomerUseCase,
     GetCustomerUseCase,
+    GetCustomerWithLoanOffersUseCase,
     ListCustomersUseCase,
     UpdateCustomerUseCase,
     DeleteCustomerUseCase,
+    DeleteCustomersUseCase,
+    ImportCustomersUseCase,
 )
 from .loan_offer import (
     CreateLoanOfferUseCase,
+    CreateLoanOffersUseCase,
     CalculateLoanUseCase,
+    CalculateLoanBatchUseCase,
     GetLoanOfferUseCase,
     ListCustomerLoanOffersUseCase,
+    CalculatePaymentGridUseCase,
+    CalculateMaxPrincipalUseCase,
+    CalculateMinTermUseCase,
+    CalculateImpliedRateUseCase,
+    CalculateLoanScheduleUseCase,
+    GetLoanOfferScheduleUseCase,
+    GetLoanOfferSchedulesUseCase,
 )
 
 __all__ = [
     'CreateCustomerUseCase',
+    'UpsertCustomerUseCase',
     'GetCustomerUseCase',
+    'GetCustomerWithLoanOffersUseCase',
     'ListCustomersUseCase',
     'UpdateCustomerUseCase',
     'DeleteCustomerUseCase',
+    'DeleteCustomersUseCase',
+    'ImportCustomersUseCase',
     'CreateLoanOfferUseCase',
+    'CreateLoanOffersUseCase',
     'CalculateLoanUseCase',
+    'CalculateLoanBatchUseCase',
     'GetLoanOfferUseCase',
     'ListCustomerLoanOffersUseCase',
+    'CalculatePaymentGridUseCase',
+    'CalculateMaxPrincipalUseCase',
+    'CalculateMinTermUseCase',
+    'CalculateImpliedRateUseCase',
+    'CalculateLoanScheduleUseCase',
+    'GetLoanOfferScheduleUseCase',
+    'GetLoanOfferSchedulesUseCase',
 ]
\ No newline at end of file
@@ -1,13 +1,19 @@
-from .create_customer import CreateCustomerUseCase
-from .get_customer import GetCustomerUseCase
+from .create_customer import CreateCustomerUseCase, UpsertCustomerUseCase
+from .get_customer import GetCustomerUseCase, GetCustomerWithLoanOffersUseCase
 from .list_customers import ListCustomersUseCase
 from .update_customer import UpdateCustomerUseCase
-from .delete_customer import DeleteCustomerUseCase
+from .delete_customer import DeleteCustomerUseCase, DeleteCustomersUseCase
+from .import_customers import ImportCustomersUseCase, ImportRow
 
 __all__ = [
     'CreateCustomerUseCase',
+    'UpsertCustomerUseCase',
     'GetCustomerUseCase',
+    'GetCustomerWithLoanOffersUseCase',
     'ListCustomersUseCase',
     'UpdateCustomerUseCase',
     'DeleteCustomerUseCase',
+    'DeleteCustomersUseCase',
+    'ImportCustomersUseCase',
+    'ImportRow',
 ]
\ No newline at end of file
@@ -1,7 +1,23 @@
 from dataclasses import dataclass
+from typing import Tuple
+
+from ....domain.entities.customer import Customer
 from ...dtos.customer_dto import CustomerCreateDTO, CustomerResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
-from ...exceptions import CustomerAlreadyExistsError
+
+
+def _customer_to_dto(customer: Customer) -> CustomerResponseDTO:
+    """Helper to convert domain entity to DTO"""
+    return CustomerResponseDTO(
+        id=customer.id,
+        first_name=customer.first_name,
+        last_name=customer.last_name,
+        email=str(customer.email),
+        phone=customer.phone,
+        address=customer.address,
+        created_at=customer.created_at,
+        updated_at=customer.updated_at
+    )
 
 
 @dataclass
@@ -16,25 +32,36 @@ class CreateCustomerUseCase:
     async def execute(self, data: CustomerCreateDTO) -> CustomerResponseDTO:
         """
         Execute the use case        
-        """
-        exists = await self.uow.customers.exists_by_email(data.email)
         
-        if exists:
-            raise CustomerAlreadyExistsError(
-                f"Customer with email {data.email} already exists"
-            )
+        Email uniqueness is enforced by the unique index in the same
+        statement (no check-then-insert race).
         
+        Raises:
+            CustomerAlreadyExistsError: If the email is taken
+        """
         customer = await self.uow.customers.create(data)
         
         await self.uow.commit()
         
-        return CustomerResponseDTO(
-            id=customer.id,
-            first_name=customer.first_name,
-            last_name=customer.last_name,
-            email=str(customer.email),
-            phone=customer.phone,
-            address=customer.address,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at
-        )
\ No newline at end of file
+        return _customer_to_dto(customer)
+
+
+@dataclass
+class UpsertCustomerUseCase:
+    """
+    Use case for creating a customer or updating the one with the same email
+    """
+    uow: IUnitOfWork
+    
+    async def execute(self, data: CustomerCreateDTO) -> Tuple[CustomerResponseDTO, bool]:
+        """
+        Create or merge customer by email (one statement)
+        
+        Returns:
+            (customer, created)
+        """
+        customer, created = await self.uow.customers.upsert(data)
+        
+        await self.uow.commit()
+        
+        return _customer_to_dto(customer), created
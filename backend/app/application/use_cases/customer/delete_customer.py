@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from ...dtos.customer_dto import CustomerBulkDeleteDTO, CustomerBulkDeleteResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
 from ...exceptions import CustomerNotFoundError
 
@@ -20,4 +21,27 @@ class DeleteCustomerUseCase:
                 f"Customer with ID {customer_id} not found"
             )
             
-        await self.uow.commit()
\ No newline at end of file
+        await self.uow.commit()
+
+
+@dataclass
+class DeleteCustomersUseCase:
+    """Use case for deleting many customers at once"""
+    uow: IUnitOfWork
+    
+    async def execute(self, data: CustomerBulkDeleteDTO) -> CustomerBulkDeleteResponseDTO:
+        """
+        Delete the given customers in one statement
+        
+        Missing IDs are reported instead of failing the request.
+        """
+        customer_ids = list(dict.fromkeys(data.customer_ids))
+        
+        deleted = set(await self.uow.customers.delete_many(customer_ids))
+        
+        await self.uow.commit()
+        
+        return CustomerBulkDeleteResponseDTO(
+            deleted=[i for i in customer_ids if i in deleted],
+            not_found=[i for i in customer_ids if i not in deleted]
+        )
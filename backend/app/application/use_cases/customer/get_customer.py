@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import Optional
 
 from ....domain.entities.customer import Customer
+from ....domain.entities.loan_offer import LoanOffer
+from ....domain.services.loan_calculator import LoanCalculator
 from ...dtos.customer_dto import CustomerResponseDTO, CustomerWithLoanOffersDTO
+from ...dtos.loan_offer_dto import LoanOfferResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
 from ...exceptions import CustomerNotFoundError
 
@@ -20,6 +24,25 @@ def _customer_to_dto(customer: Customer) -> CustomerResponseDTO:
     )
 
 
+def _loan_offer_to_dto(
+    offer: LoanOffer,
+    effective_annual_rate: Decimal
+) -> LoanOfferResponseDTO:
+    """Helper to convert domain entity to DTO"""
+    return LoanOfferResponseDTO(
+        id=offer.id,
+        customer_id=offer.customer_id,
+        loan_amount=offer.principal.amount,
+        interest_rate=offer.interest_rate.value,
+        term_months=offer.term_months,
+        monthly_payment=offer.monthly_payment.amount,
+        total_payment=offer.total_payment.amount,
+        total_interest=offer.total_interest.amount,
+        effective_annual_rate=effective_annual_rate,
+        created_at=offer.created_at
+    )
+
+
 @dataclass
 class GetCustomerUseCase:
     """Use case for getting a single customer"""
@@ -45,4 +68,46 @@ class GetCustomerUseCase:
                 f"Customer with ID {customer_id} not found"
             )
             
-        return _customer_to_dto(customer)
\ No newline at end of file
+        return _customer_to_dto(customer)
+
+
+@dataclass
+class GetCustomerWithLoanOffersUseCase:
+    """Use case for a customer together with their loan offers"""
+    uow: IUnitOfWork
+    max_loan_offers: int = 100
+    
+    async def execute(
+        self,
+        customer_id: int,
+        limit: int = 50
+    ) -> CustomerWithLoanOffersDTO:
+        """
+        Get customer by ID with their most recent loan offers
+        
+        Raises:
+            CustomerNotFoundError: If customer doesn't exist
+        """
+        customer = await self.uow.customers.get_by_id(customer_id)
+        
+        if not customer:
+            raise CustomerNotFoundError(
+                f"Customer with ID {customer_id} not found"
+            )
+        
+        offers = await self.uow.loan_offers.get_by_customer_id(
+            customer_id,
+            0,
+            min(limit, self.max_loan_offers)
+        )
+        effective_rates = LoanCalculator.effective_annual_rates(
+            [o.interest_rate for o in offers]
+        )
+        
+        return CustomerWithLoanOffersDTO(
+            **_customer_to_dto(customer).model_dump(),
+            loan_offers=[
+                _loan_offer_to_dto(o, rate)
+                for o, rate in zip(offers, effective_rates)
+            ]
+        )
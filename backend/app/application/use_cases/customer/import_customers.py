@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ....domain.exceptions import DomainException
+from ....domain.value_objects.email import Email
+from ...dtos.customer_dto import (
+    CustomerCreateDTO,
+    CustomerImportErrorDTO,
+    CustomerImportResultDTO,
+)
+from ...interfaces.unit_of_work import IUnitOfWork
+
+# (line number, fields) or (line number, parse error message)
+ImportRow = Tuple[int, Union[Dict[str, Any], str]]
+
+
+def _validation_message(error: PydanticValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _reported_email(value: Any) -> Optional[str]:
+    """The row's email as text (NDJSON values may be of any JSON type)"""
+    return None if value is None else str(value)
+
+
+@dataclass
+class _ImportReport:
+    max_errors: int
+    received: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[CustomerImportErrorDTO] = field(default_factory=list)
+    
+    def reject(self, line: int, error: str, email: str | None = None) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(CustomerImportErrorDTO(line=line, email=email, error=error))
+
+
+@dataclass
+class ImportCustomersUseCase:
+    """
+    Use case for importing many customers from a file
+    
+    Rows are validated one by one and inserted in batches, each batch
+    with one multi-row INSERT and its own commit. Only one batch is
+    held in memory, so memory use doesn't grow with the file size.
+    """
+    uow: IUnitOfWork
+    batch_size: int = 1000
+    max_reported_errors: int = 1000
+    
+    async def execute(self, rows: AsyncIterable[ImportRow]) -> CustomerImportResultDTO:
+        """
+        Import customers
+        
+        Rows that fail validation, repeat an email of the same batch or
+        whose email already exists are reported (up to
+        max_reported_errors) and skipped; all other rows are imported.
+        """
+        report = _ImportReport(max_errors=self.max_reported_errors)
+        # email -> (line, customer), dict keeps file order
+        batch: Dict[str, Tuple[int, CustomerCreateDTO]] = {}
+        
+        async for line, fields in rows:
+            report.received += 1
+            
+            if isinstance(fields, str):
+                report.reject(line, fields)
+                continue
+            
+            try:
+                customer = CustomerCreateDTO(**fields)
+                email = Email(str(customer.email)).value
+            except PydanticValidationError as e:
+                report.reject(line, _validation_message(e), _reported_email(fields.get("email")))
+                continue
+            except DomainException as e:
+                report.reject(line, str(e), _reported_email(fields.get("email")))
+                continue
+            
+            if email in batch:
+                report.reject(
+                    line,
+                    f"Duplicate email (line {batch[email][0]})",
+                    email
+                )
+                continue
+            
+            batch[email] = (line, customer.model_copy(update={"email": email}))
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, report)
+        
+        await self._flush(batch, report)
+        
+        return CustomerImportResultDTO(
+            received=report.received,
+            imported=report.imported,
+            failed=report.failed,
+            errors=report.errors,
+            errors_truncated=report.failed > len(report.errors)
+        )
+    
+    async def _flush(
+        self,
+        batch: Dict[str, Tuple[int, CustomerCreateDTO]],
+        report: _ImportReport
+    ) -> None:
+        if not batch:
+            return
+        
+        created = await self.uow.customers.create_many(
+            [customer for _, customer in batch.values()]
+        )
+        await self.uow.commit()
+        
+        created_emails = {str(c.email) for c in created}
+        report.imported += len(created_emails)
+        for email, (line, _) in batch.items():
+            if email not in created_emails:
+                report.reject(line, "Customer with this email already exists", email)
+        
+        batch.clear()
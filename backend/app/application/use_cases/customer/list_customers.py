@@ -1,10 +1,18 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Optional
 
 from ....domain.entities.customer import Customer
 
 from ...dtos.customer_dto import CustomerResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
+from ...pagination import (
+    Page,
+    CountMode,
+    CountCache,
+    TotalCount,
+    encode_cursor,
+    decode_cursor,
+)
 
 def _customer_to_dto(customer: Customer) -> CustomerResponseDTO:
     """Helper to convert domain entity to DTO"""
@@ -28,22 +36,66 @@ class ListCustomersUseCase:
     """
     uow: IUnitOfWork
     max_limit: int = 100
+    count_mode: CountMode = CountMode.EXACT
+    count_cache: Optional[CountCache] = None
     
     async def execute(
         self,
         skip: int = 0,
-        limit: int = 50
-    ) -> tuple[List[CustomerResponseDTO], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: Optional[CountMode] = None
+    ) -> Page[CustomerResponseDTO]:
         """
         List customers with pagination
+        
+        With a cursor (keyset mode) skip is ignored and the page starts
+        right after the cursor position; otherwise offset mode is used.
+        count_mode overrides the configured default for this request.
         """
         # Enforce max limit (security - prevent loading millions)
         limit = min(limit, self.max_limit)
+        after = decode_cursor(cursor) if cursor is not None else None
+        total = TotalCount(
+            count_mode or self.count_mode,
+            self.count_cache,
+            ("customers",)
+        )
         
-        customers = await self.uow.customers.get_all(skip, limit)
-            
-        total_count = await self.uow.customers.get_all_count()
+        # Page and count in one query; one extra row tells whether
+        # another page exists
+        customers, inline_total = await self.uow.customers.get_page(
+            skip,
+            limit + 1,
+            after,
+            with_count=total.inline
+        )
+        
+        has_more = len(customers) > limit
+        customers = customers[:limit]
+        
+        # Last page in offset mode: the total is known without a query
+        known_total = (
+            skip + len(customers)
+            if after is None and not has_more and (customers or skip == 0)
+            else None
+        )
+        total_count = await total.resolve(
+            inline_total,
+            known_total,
+            estimated=self.uow.customers.get_all_count_estimate
+        )
             
         customer_dtos = [_customer_to_dto(c) for c in customers]
+        
+        next_cursor = (
+            encode_cursor(customers[-1].created_at, customers[-1].id)
+            if has_more else None
+        )
             
-        return customer_dtos, total_count
\ No newline at end of file
+        return Page(
+            items=customer_dtos,
+            total=total_count,
+            has_more=has_more,
+            next_cursor=next_cursor
+        )
\ No newline at end of file
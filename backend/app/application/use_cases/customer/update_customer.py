@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ....domain.entities.customer import Customer
 from ...dtos.customer_dto import CustomerUpdateDTO, CustomerResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
-from ...exceptions import CustomerNotFoundError, CustomerAlreadyExistsError
+from ...exceptions import CustomerNotFoundError
 
 def _customer_to_dto(customer: Customer) -> CustomerResponseDTO:
     """Helper to convert domain entity to DTO"""
@@ -31,22 +31,20 @@ class UpdateCustomerUseCase:
     ) -> CustomerResponseDTO:
         """
         Update customer
+        
+        One UPDATE statement: a missing customer returns no row and a
+        taken email is rejected by the unique index.
+        
+        Raises:
+            CustomerNotFoundError: If customer doesn't exist
+            CustomerAlreadyExistsError: If the new email is taken
         """
-      
-        existing = await self.uow.customers.get_by_id(customer_id)
-        if not existing:
+        updated_customer = await self.uow.customers.update(customer_id, data)
+        if not updated_customer:
             raise CustomerNotFoundError(
                 f"Customer with ID {customer_id} not found"
             )
             
-        if data.email and data.email != existing.email.value:
-            if await self.uow.customers.exists_by_email(data.email):
-                raise CustomerAlreadyExistsError(
-                    f"Customer with email {data.email} already exists"
-                )
-        
-        updated_customer = await self.uow.customers.update(customer_id, data)
-            
         await self.uow.commit()
             
         return _customer_to_dto(updated_customer)
\ No newline at end of file
@@ -1,11 +1,32 @@
-from .create_loan_offer import CreateLoanOfferUseCase
+from .create_loan_offer import CreateLoanOfferUseCase, CreateLoanOffersUseCase
 from .calculate_loan import CalculateLoanUseCase
+from .calculate_loan_batch import CalculateLoanBatchUseCase
 from .get_loan_offer import GetLoanOfferUseCase
 from .list_customer_loan_offers import ListCustomerLoanOffersUseCase
+from .calculate_payment_grid import CalculatePaymentGridUseCase
+from .solve_loan import (
+    CalculateMaxPrincipalUseCase,
+    CalculateMinTermUseCase,
+    CalculateImpliedRateUseCase,
+)
+from .amortization_schedule import (
+    CalculateLoanScheduleUseCase,
+    GetLoanOfferScheduleUseCase,
+    GetLoanOfferSchedulesUseCase,
+)
 
 __all__ = [
     'CreateLoanOfferUseCase',
+    'CreateLoanOffersUseCase',
     'CalculateLoanUseCase',
+    'CalculateLoanBatchUseCase',
     'GetLoanOfferUseCase',
     'ListCustomerLoanOffersUseCase',
+    'CalculatePaymentGridUseCase',
+    'CalculateMaxPrincipalUseCase',
+    'CalculateMinTermUseCase',
+    'CalculateImpliedRateUseCase',
+    'CalculateLoanScheduleUseCase',
+    'GetLoanOfferScheduleUseCase',
+    'GetLoanOfferSchedulesUseCase',
 ]
\ No newline at end of file
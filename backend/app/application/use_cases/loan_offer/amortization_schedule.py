@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from ...dtos.loan_offer_dto import LoanCalculationDTO
+from ...interfaces.unit_of_work import IUnitOfWork
+from ...exceptions import LoanOfferNotFoundError
+from ....domain.entities.loan_offer import LoanOffer
+from ....domain.services.loan_calculator import LoanCalculator, AmortizationPeriod
+from ....domain.value_objects.money import Money
+from ....domain.value_objects.percentage import Percentage
+from .get_loan_offer import GetLoanOfferUseCase
+
+
+@dataclass
+class CalculateLoanScheduleUseCase:
+    """
+    Use case for an ad-hoc amortization schedule (no persistence)
+    """
+
+    async def execute(self, data: LoanCalculationDTO) -> Iterator[AmortizationPeriod]:
+        """
+        Validate parameters and return a lazy schedule iterator
+        """
+        return LoanCalculator.amortization_schedule(
+            principal=Money(data.loan_amount, 'EUR'),
+            annual_interest_rate=Percentage(data.interest_rate),
+            term_months=data.term_months
+        )
+
+
+@dataclass
+class GetLoanOfferScheduleUseCase:
+    """
+    Use case for the amortization schedule of a persisted offer
+    """
+    uow: IUnitOfWork
+
+    async def execute(self, offer_id: int) -> Iterator[AmortizationPeriod]:
+        """
+        Load the offer, then return a lazy schedule iterator
+
+        The database is only used up front: rows are computed
+        while the caller iterates.
+
+        Raises:
+            LoanOfferNotFoundError: If offer doesn't exist
+        """
+        offer = await GetLoanOfferUseCase(self.uow).execute(offer_id)
+
+        return LoanCalculator.amortization_schedule(
+            principal=Money(offer.loan_amount, 'EUR'),
+            annual_interest_rate=Percentage(offer.interest_rate),
+            term_months=offer.term_months
+        )
+
+
+@dataclass
+class GetLoanOfferSchedulesUseCase:
+    """
+    Use case for the schedules of many offers (reporting)
+    """
+    uow: IUnitOfWork
+
+    async def execute(
+        self,
+        offer_ids: List[int]
+    ) -> Iterator[Tuple[int, AmortizationPeriod]]:
+        """
+        Load all offers in one query, then return a lazy iterator
+        of (offer_id, period) rows in the requested order
+
+        Raises:
+            LoanOfferNotFoundError: If any offer doesn't exist
+        """
+        offers = {
+            offer.id: offer
+            for offer in await self.uow.loan_offers.get_by_ids(offer_ids)
+        }
+
+        missing = [offer_id for offer_id in offer_ids if offer_id not in offers]
+        if missing:
+            raise LoanOfferNotFoundError(
+                f"Loan offers with IDs {missing} not found"
+            )
+
+        return self._iter_rows([offers[offer_id] for offer_id in offer_ids])
+
+    @staticmethod
+    def _iter_rows(offers: List[LoanOffer]) -> Iterator[Tuple[int, AmortizationPeriod]]:
+        for offer in offers:
+            for period in LoanCalculator.amortization_schedule(
+                principal=offer.principal,
+                annual_interest_rate=offer.interest_rate,
+                term_months=offer.term_months
+            ):
+                yield offer.id, period
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ...dtos.loan_offer_dto import (
+    LoanCalculationDTO,
+    LoanCalculationResponseDTO,
+    LoanCalculationBatchItemDTO,
+)
+from ....domain.exceptions import DomainException, InvalidLoanParametersError
+from ....domain.services.loan_calculator import LoanCalculator
+from ....domain.value_objects.money import Money
+from ....domain.value_objects.percentage import Percentage
+
+
+def _format_validation_error(exc: PydanticValidationError) -> str:
+    """Flatten pydantic errors into a single message"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def _validate_item(item: Union[LoanCalculationDTO, Dict[str, Any]]) -> LoanCalculationDTO:
+    """
+    Validate one item like the single calculation does
+
+    Raises:
+        PydanticValidationError: If the item doesn't match the DTO
+        DomainException: If the value objects reject it (e.g. an amount
+            that rounds to 0.00)
+    """
+    data = (
+        item if isinstance(item, LoanCalculationDTO)
+        else LoanCalculationDTO.model_validate(item)
+    )
+    principal = Money(data.loan_amount, 'EUR')
+    Percentage(data.interest_rate)
+    if principal.amount <= 0:
+        raise InvalidLoanParametersError("Principal must be positive")
+    return data
+
+
+@dataclass
+class CalculateLoanBatchUseCase:
+    """
+    Use case for calculating many loans in one request
+    """
+
+    async def execute(
+        self,
+        items: List[Union[LoanCalculationDTO, Dict[str, Any]]]
+    ) -> List[LoanCalculationBatchItemDTO]:
+        """
+        Validate every item, then calculate all valid items
+        in a single LoanCalculator pass
+
+        Results keep the order of the request; invalid items
+        carry an error message instead of a result
+        """
+        results: List[LoanCalculationBatchItemDTO] = []
+        valid: List[tuple[int, LoanCalculationDTO]] = []
+
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, _validate_item(item)))
+            except PydanticValidationError as exc:
+                results.append(
+                    LoanCalculationBatchItemDTO(
+                        index=index,
+                        error=_format_validation_error(exc)
+                    )
+                )
+            except DomainException as exc:
+                results.append(LoanCalculationBatchItemDTO(index=index, error=str(exc)))
+
+        calculations = LoanCalculator.calculate_all_batch(
+            principals=[data.loan_amount for _, data in valid],
+            annual_interest_rates=[data.interest_rate for _, data in valid],
+            term_months=[data.term_months for _, data in valid]
+        )
+
+        for row, (index, _) in enumerate(valid):
+            results.append(
+                LoanCalculationBatchItemDTO(
+                    index=index,
+                    result=LoanCalculationResponseDTO(
+                        monthly_payment=calculations['monthly_payment'][row],
+                        total_payment=calculations['total_payment'][row],
+                        total_interest=calculations['total_interest'][row]
+                    )
+                )
+            )
+
+        results.sort(key=lambda result: result.index)
+        return results
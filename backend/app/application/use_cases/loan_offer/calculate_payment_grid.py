@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from ...dtos.loan_offer_dto import (
+    LoanPaymentGridDTO,
+    LoanPaymentGridResponseDTO,
+)
+from ....domain.services.loan_calculator import LoanCalculator
+
+
+@dataclass
+class CalculatePaymentGridUseCase:
+    """
+    Use case for a rate x term grid of monthly payments
+    """
+    
+    async def execute(self, data: LoanPaymentGridDTO) -> LoanPaymentGridResponseDTO:
+        """
+        Calculate every cell in a single batch pass (row-major by rate)
+        """
+        rates = data.interest_rates()
+        terms = data.term_months()
+        
+        calculations = LoanCalculator.calculate_all_batch(
+            principals=[data.loan_amount] * (len(rates) * len(terms)),
+            annual_interest_rates=[rate for rate in rates for _ in terms],
+            term_months=terms * len(rates)
+        )
+        
+        return LoanPaymentGridResponseDTO(
+            loan_amount=data.loan_amount,
+            interest_rates=rates,
+            term_months=terms,
+            monthly_payments=calculations['monthly_payment']
+        )
@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from ...dtos.loan_offer_dto import LoanOfferCreateDTO, LoanOfferResponseDTO
+from typing import List
+from ...dtos.loan_offer_dto import (
+    LoanOfferCreateDTO,
+    LoanOfferBulkCreateDTO,
+    LoanOfferResponseDTO,
+)
 from ...interfaces.unit_of_work import IUnitOfWork
 from ....domain.services.loan_calculator import LoanCalculator
 from ....domain.value_objects.money import Money
@@ -9,7 +14,12 @@ from ....domain.entities.loan_offer import LoanOffer
 from ...exceptions import CustomerNotFoundError
 
 
-def _loan_offer_to_dto(offer: LoanOffer) -> LoanOfferResponseDTO:
+def _loan_offer_to_dto(
+    offer: LoanOffer,
+    effective_annual_rate: Decimal | None = None
+) -> LoanOfferResponseDTO:
+    if effective_annual_rate is None:
+        effective_annual_rate = offer.effective_annual_rate()
     return LoanOfferResponseDTO(
         id=offer.id,
         customer_id=offer.customer_id,
@@ -19,6 +29,7 @@ def _loan_offer_to_dto(offer: LoanOffer) -> LoanOfferResponseDTO:
         monthly_payment=offer.monthly_payment.amount,
         total_payment=offer.total_payment.amount,
         total_interest=offer.total_interest.amount,
+        effective_annual_rate=effective_annual_rate,
         created_at=offer.created_at
     )
 
@@ -64,4 +75,74 @@ class CreateLoanOfferUseCase:
         await self.uow.commit()
         
         # 6. Return DTO
-        return _loan_offer_to_dto(created_offer)
\ No newline at end of file
+        return _loan_offer_to_dto(created_offer)
+
+
+@dataclass
+class CreateLoanOffersUseCase:
+    """
+    Use case for creating many loan offers in one transaction
+    """
+    uow: IUnitOfWork
+    
+    async def execute(self, data: LoanOfferBulkCreateDTO) -> List[LoanOfferResponseDTO]:
+        """
+        Create all offers or none
+        
+        One query checks every referenced customer, one calculator
+        pass prices all offers, one INSERT stores them and the
+        transaction is committed once.
+        
+        Raises:
+            CustomerNotFoundError: If any referenced customer doesn't exist
+        """
+        items = data.offers
+        
+        # 1. Verify all customers exist
+        customer_ids = list(dict.fromkeys(item.customer_id for item in items))
+        existing = await self.uow.customers.get_existing_ids(customer_ids)
+        missing = [i for i in customer_ids if i not in existing]
+        if missing:
+            raise CustomerNotFoundError(
+                f"Customers with IDs {missing} not found"
+            )
+        
+        # 2. Calculate all payments in one pass
+        calculations = LoanCalculator.calculate_all_batch(
+            principals=[item.loan_amount for item in items],
+            annual_interest_rates=[item.interest_rate for item in items],
+            term_months=[item.term_months for item in items]
+        )
+        
+        # 3. Create domain entities
+        loan_offers = [
+            LoanOffer.create(
+                customer_id=item.customer_id,
+                principal=Money(item.loan_amount, 'EUR'),
+                interest_rate=Percentage(item.interest_rate),
+                term_months=item.term_months,
+                monthly_payment=Money.trusted(monthly_payment, 'EUR'),
+                total_payment=Money.trusted(total_payment, 'EUR'),
+                total_interest=Money.trusted(total_interest, 'EUR')
+            )
+            for item, monthly_payment, total_payment, total_interest in zip(
+                items,
+                calculations['monthly_payment'],
+                calculations['total_payment'],
+                calculations['total_interest']
+            )
+        ]
+        
+        # 4. Persist all offers, commit once
+        created_offers = await self.uow.loan_offers.create_many(loan_offers)
+        
+        await self.uow.commit()
+        
+        # 5. Return DTOs (APR for all offers in one pass)
+        effective_rates = LoanCalculator.effective_annual_rates(
+            [o.interest_rate for o in created_offers]
+        )
+        return [
+            _loan_offer_to_dto(o, rate)
+            for o, rate in zip(created_offers, effective_rates)
+        ]
@@ -16,6 +16,7 @@ def _loan_offer_to_dto(offer: LoanOffer) -> LoanOfferResponseDTO:
         monthly_payment=offer.monthly_payment.amount, 
         total_payment=offer.total_payment.amount,
         total_interest=offer.total_interest.amount,
+        effective_annual_rate=offer.effective_annual_rate(),
         created_at=offer.created_at
     )
 
@@ -1,12 +1,25 @@
 from dataclasses import dataclass
-from typing import List
+from decimal import Decimal
+from typing import Optional
 
 from ....domain.entities.loan_offer import LoanOffer
+from ....domain.services.loan_calculator import LoanCalculator
 from ...dtos.loan_offer_dto import LoanOfferResponseDTO
 from ...interfaces.unit_of_work import IUnitOfWork
 from ...exceptions import CustomerNotFoundError
+from ...pagination import (
+    Page,
+    CountMode,
+    CountCache,
+    TotalCount,
+    encode_cursor,
+    decode_cursor,
+)
 
-def _loan_offer_to_dto(offer: LoanOffer) -> LoanOfferResponseDTO:
+def _loan_offer_to_dto(
+    offer: LoanOffer,
+    effective_annual_rate: Decimal
+) -> LoanOfferResponseDTO:
     """Helper to convert domain entity to DTO"""
     return LoanOfferResponseDTO(
         id=offer.id,
@@ -17,6 +30,7 @@ def _loan_offer_to_dto(offer: LoanOffer) -> LoanOfferResponseDTO:
         monthly_payment=offer.monthly_payment.amount, 
         total_payment=offer.total_payment.amount,
         total_interest=offer.total_interest.amount,
+        effective_annual_rate=effective_annual_rate,
         created_at=offer.created_at
     )
 
@@ -25,38 +39,83 @@ class ListCustomerLoanOffersUseCase:
     """Use case for listing loan offers for a customer"""
     uow: IUnitOfWork
     max_limit: int = 100
+    count_mode: CountMode = CountMode.EXACT
+    count_cache: Optional[CountCache] = None
     
     async def execute(
         self,
         customer_id: int,
         skip: int = 0,
-        limit: int = 50
-    ) -> tuple[List[LoanOfferResponseDTO], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: Optional[CountMode] = None
+    ) -> Page[LoanOfferResponseDTO]:
         """
         Get all loan offers for a customer
+        
+        With a cursor (keyset mode) skip is ignored and the page starts
+        right after the cursor position; otherwise offset mode is used.
+        count_mode overrides the configured default for this request.
         """
         limit = min(limit, self.max_limit)
+        after = decode_cursor(cursor) if cursor is not None else None
+        total = TotalCount(
+            count_mode or self.count_mode,
+            self.count_cache,
+            ("loan_offers", customer_id)
+        )
         
-        # Verify customer exists
-        customer = await self.uow.customers.get_by_id(customer_id)
-        if not customer:
+        # Customer check, page and count in one query; one extra row
+        # tells whether another page exists
+        page = await self.uow.loan_offers.get_page_by_customer_id(
+            customer_id,
+            skip,
+            limit + 1,
+            after,
+            with_count=total.inline
+        )
+        if page is None:
             raise CustomerNotFoundError(
                 f"Customer with ID {customer_id} not found"
             )
+        offers, inline_total = page
+        
+        has_more = len(offers) > limit
+        offers = offers[:limit]
             
-        # Get loan offers
-        offers = await self.uow.loan_offers.get_by_customer_id(
-            customer_id,
-            skip,
-            limit
+        # Get count (last page in offset mode: known without a query)
+        known_total = (
+            skip + len(offers)
+            if after is None and not has_more and (offers or skip == 0)
+            else None
         )
-            
-        # Get count
-        total_count = await self.uow.loan_offers.get_by_customer_id_count(
-            customer_id
+        total_count = await total.resolve(
+            inline_total,
+            known_total,
+            estimated=lambda: self.uow.loan_offers.get_by_customer_id_count_estimate(
+                customer_id
+            )
         )
             
+        # APR for the whole page in one pass
+        effective_rates = LoanCalculator.effective_annual_rates(
+            [o.interest_rate for o in offers]
+        )
+        
         # Convert to DTOs
-        offer_dtos = [_loan_offer_to_dto(o) for o in offers]
+        offer_dtos = [
+            _loan_offer_to_dto(o, rate)
+            for o, rate in zip(offers, effective_rates)
+        ]
+        
+        next_cursor = (
+            encode_cursor(offers[-1].created_at, offers[-1].id)
+            if has_more else None
+        )
                         
-        return offer_dtos, total_count
\ No newline at end of file
+        return Page(
+            items=offer_dtos,
+            total=total_count,
+            has_more=has_more,
+            next_cursor=next_cursor
+        )
\ No newline at end of file
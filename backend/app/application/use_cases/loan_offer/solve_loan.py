@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from ...dtos.loan_offer_dto import (
+    MaxPrincipalCalculationDTO,
+    MinTermCalculationDTO,
+    ImpliedRateCalculationDTO,
+    LoanSolutionResponseDTO,
+)
+from ....domain.services.loan_calculator import LoanCalculator
+from ....domain.value_objects.money import Money
+from ....domain.value_objects.percentage import Percentage
+
+
+def _solution_to_dto(
+    principal: Money,
+    rate: Percentage,
+    term_months: int
+) -> LoanSolutionResponseDTO:
+    """Recalculate the solved loan so the response is self-consistent"""
+    calculations = LoanCalculator.calculate_all(
+        principal=principal,
+        annual_interest_rate=rate,
+        term_months=term_months
+    )
+    return LoanSolutionResponseDTO(
+        loan_amount=principal.amount,
+        interest_rate=rate.value,
+        term_months=term_months,
+        monthly_payment=calculations['monthly_payment'].amount,
+        total_payment=calculations['total_payment'].amount,
+        total_interest=calculations['total_interest'].amount
+    )
+
+
+@dataclass
+class CalculateMaxPrincipalUseCase:
+    """
+    Use case for the maximum affordable principal at a given payment
+    """
+
+    async def execute(self, data: MaxPrincipalCalculationDTO) -> LoanSolutionResponseDTO:
+        rate = Percentage(data.interest_rate)
+        principal = LoanCalculator.max_principal_for_payment(
+            monthly_payment=Money(data.monthly_payment, 'EUR'),
+            annual_interest_rate=rate,
+            term_months=data.term_months
+        )
+        return _solution_to_dto(principal, rate, data.term_months)
+
+
+@dataclass
+class CalculateMinTermUseCase:
+    """
+    Use case for the shortest term that fits a given payment
+    """
+
+    async def execute(self, data: MinTermCalculationDTO) -> LoanSolutionResponseDTO:
+        principal = Money(data.loan_amount, 'EUR')
+        rate = Percentage(data.interest_rate)
+        term_months = LoanCalculator.min_term_for_payment(
+            principal=principal,
+            annual_interest_rate=rate,
+            monthly_payment=Money(data.monthly_payment, 'EUR')
+        )
+        return _solution_to_dto(principal, rate, term_months)
+
+
+@dataclass
+class CalculateImpliedRateUseCase:
+    """
+    Use case for the highest interest rate that fits a given payment
+    """
+
+    async def execute(self, data: ImpliedRateCalculationDTO) -> LoanSolutionResponseDTO:
+        principal = Money(data.loan_amount, 'EUR')
+        rate = LoanCalculator.implied_interest_rate(
+            principal=principal,
+            monthly_payment=Money(data.monthly_payment, 'EUR'),
+            term_months=data.term_months
+        )
+        return _solution_to_dto(principal, rate, data.term_months)
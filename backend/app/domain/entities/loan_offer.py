@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 from ..value_objects.money import Money
 from ..value_objects.percentage import Percentage
@@ -65,14 +66,14 @@ class LoanOffer:
         """Check if loan has 0% interest"""
         return self.interest_rate.value == 0
     
-    def effective_annual_rate(self) -> Percentage:
+    def effective_annual_rate(self) -> Decimal:
         """
         Calculate effective annual rate (APR)
         
-        Note: For simplicity, returning nominal rate
-        In production, would calculate compound rate
+        Nominal rate compounded monthly, as a percentage (e.g. 5.64)
         """
-        return self.interest_rate
+        from ..services.loan_calculator import LoanCalculator
+        return LoanCalculator.effective_annual_rate(self.interest_rate)
     
     def __eq__(self, other) -> bool:
         """Entities compared by ID"""
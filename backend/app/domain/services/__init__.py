@@ -1,3 +1,5 @@
-from .loan_calculator import LoanCalculator
+from .loan_calculator import LoanCalculator, AmortizationPeriod
+from .annuity_factor_cache import AnnuityFactorCache
+from .annuity_factor_table import AnnuityFactorTable
 
-__all__ = ['LoanCalculator']
\ No newline at end of file
+__all__ = ['LoanCalculator', 'AmortizationPeriod', 'AnnuityFactorCache', 'AnnuityFactorTable']
\ No newline at end of file
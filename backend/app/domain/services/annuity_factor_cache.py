@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from decimal import Decimal
+from threading import Lock
+from typing import Callable, Dict, Tuple
+
+FactorKey = Tuple[Decimal, int]
+
+
+class AnnuityFactorCache:
+    """
+    Bounded LRU cache for annuity factors keyed by (rate, term)
+
+    Thread-safe: the calculator is shared by all requests of a worker,
+    including sync endpoints running in the threadpool.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[FactorKey, Decimal]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get_or_compute(
+        self,
+        key: FactorKey,
+        compute: Callable[[], Decimal]
+    ) -> Decimal:
+        """
+        Return cached factor, computing and storing it on a miss
+        """
+        with self._lock:
+            factor = self._entries.get(key)
+            if factor is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return factor
+            self._misses += 1
+
+        # Compute outside the lock, a concurrent miss only costs a duplicate
+        factor = compute()
+        self.put(key, factor)
+        return factor
+
+    def put(self, key: FactorKey, factor: Decimal) -> None:
+        """Store factor, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = factor
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of cache counters"""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._entries),
+                'maxsize': self._maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
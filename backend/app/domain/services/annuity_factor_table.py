@@ -0,0 +1,198 @@
+"""
+Precomputed annuity factor table, memory-mapped read-only
+
+The full grid (rate 0.00-100.00 in 0.01 steps x term 1-360 months)
+is written once to a binary file. Every uvicorn worker maps the same
+file, so the operating system shares its pages between processes.
+
+Each record stores the exact Decimal produced by the formula
+(coefficient + exponent), so lookups are identical to the computed value.
+
+Build / verify (from backend/):
+    python scripts/annuity_factor_table.py build data/annuity_factors.bin
+    python scripts/annuity_factor_table.py verify data/annuity_factors.bin
+"""
+import mmap
+import os
+import random
+import struct
+from decimal import Decimal, getcontext
+from pathlib import Path
+from typing import Optional
+
+MAGIC = b"ANNF"
+VERSION = 1
+RATE_STEPS = 10_000          # 0.00 .. 100.00 in 0.01 steps
+MAX_TERM_MONTHS = 360
+COEFFICIENT_BYTES = 12       # 28 significant digits < 2**96
+RECORD_SIZE = COEFFICIENT_BYTES + 1  # + signed exponent byte
+
+# magic, version, decimal precision, rate steps, max term, record size
+_HEADER = struct.Struct("<4sHHIHH")
+
+
+class AnnuityFactorTable:
+    """
+    Read-only view over a memory-mapped annuity factor file
+    """
+
+    def __init__(self, path: Path, mapped: mmap.mmap):
+        self.path = path
+        self._mmap = mapped
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> Optional["AnnuityFactorTable"]:
+        """
+        Map the table file
+
+        Returns None when the file is missing or was built for
+        another layout or Decimal precision (factors would not match).
+        """
+        path = Path(path)
+        if not path.is_file():
+            return None
+
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        expected_size = _HEADER.size + (RATE_STEPS + 1) * MAX_TERM_MONTHS * RECORD_SIZE
+        if len(mapped) != expected_size:
+            mapped.close()
+            return None
+
+        magic, version, precision, rate_steps, max_term, record_size = (
+            _HEADER.unpack_from(mapped, 0)
+        )
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or precision != getcontext().prec
+            or rate_steps != RATE_STEPS
+            or max_term != MAX_TERM_MONTHS
+            or record_size != RECORD_SIZE
+        ):
+            mapped.close()
+            return None
+
+        return cls(path, mapped)
+
+    def lookup(self, rate: Decimal, term_months: int) -> Optional[Decimal]:
+        """
+        Get the factor for an annual rate (percent) and term
+
+        Returns None for off-grid input (rate not a multiple of 0.01,
+        0% rate, or term outside 1-360 months).
+        """
+        if not 1 <= term_months <= MAX_TERM_MONTHS:
+            return None
+
+        basis_points = rate * 100
+        if basis_points != basis_points.to_integral_value():
+            return None
+        rate_index = int(basis_points)
+        if not 0 < rate_index <= RATE_STEPS:
+            return None
+
+        offset = _record_offset(rate_index, term_months)
+        coefficient = int.from_bytes(
+            self._mmap[offset:offset + COEFFICIENT_BYTES], "little"
+        )
+        exponent = struct.unpack_from("<b", self._mmap, offset + COEFFICIENT_BYTES)[0]
+        return Decimal(coefficient).scaleb(exponent)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def _record_offset(rate_index: int, term_months: int) -> int:
+    return _HEADER.size + (
+        rate_index * MAX_TERM_MONTHS + (term_months - 1)
+    ) * RECORD_SIZE
+
+
+def _encode(factor: Decimal) -> bytes:
+    sign, digits, exponent = factor.as_tuple()
+    coefficient = int("".join(map(str, digits)))
+    return coefficient.to_bytes(COEFFICIENT_BYTES, "little") + struct.pack("<b", exponent)
+
+
+def build(path: str | os.PathLike) -> Path:
+    """
+    Compute the full grid and write it atomically to path
+    """
+    from ..value_objects.percentage import Percentage
+    from .loan_calculator import LoanCalculator
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    empty_row = bytes(RECORD_SIZE * MAX_TERM_MONTHS)
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(
+            MAGIC,
+            VERSION,
+            getcontext().prec,
+            RATE_STEPS,
+            MAX_TERM_MONTHS,
+            RECORD_SIZE,
+        ))
+        # 0% has no annuity factor (payment is a plain division)
+        file.write(empty_row)
+        for rate_index in range(1, RATE_STEPS + 1):
+            rate = Percentage(Decimal(rate_index).scaleb(-2))
+            file.write(b"".join(
+                _encode(LoanCalculator._compute_annuity_factor(rate, term))
+                for term in range(1, MAX_TERM_MONTHS + 1)
+            ))
+
+    # Rename is atomic: running workers never see a partial file
+    os.replace(tmp_path, path)
+    return path
+
+
+def verify(path: str | os.PathLike, samples: Optional[int] = None) -> int:
+    """
+    Compare table lookups with the Decimal formula
+
+    Checks every entry, or a random sample when samples is given.
+
+    Returns:
+        Number of entries checked
+    """
+    from ..value_objects.percentage import Percentage
+    from .loan_calculator import LoanCalculator
+
+    table = AnnuityFactorTable.open(path)
+    if table is None:
+        raise ValueError(f"Not a valid annuity factor table: {path}")
+
+    if samples is None:
+        grid = (
+            (rate_index, term)
+            for rate_index in range(1, RATE_STEPS + 1)
+            for term in range(1, MAX_TERM_MONTHS + 1)
+        )
+    else:
+        rng = random.Random(samples)
+        grid = (
+            (rng.randint(1, RATE_STEPS), rng.randint(1, MAX_TERM_MONTHS))
+            for _ in range(samples)
+        )
+
+    checked = 0
+    try:
+        for rate_index, term in grid:
+            rate = Percentage(Decimal(rate_index).scaleb(-2))
+            expected = LoanCalculator._compute_annuity_factor(rate, term)
+            actual = table.lookup(rate.value, term)
+            if actual != expected or actual.as_tuple() != expected.as_tuple():
+                raise ValueError(
+                    f"Mismatch for rate {rate} and term {term}: "
+                    f"{actual} != {expected}"
+                )
+            checked += 1
+    finally:
+        table.close()
+    return checked
+
@@ -1,8 +1,36 @@
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict
+from dataclasses import dataclass
+from functools import lru_cache
+from decimal import Decimal, ROUND_HALF_UP, ROUND_FLOOR, ROUND_CEILING
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 from ..value_objects.money import Money
 from ..value_objects.percentage import Percentage
-from ..exceptions import InvalidLoanParametersError
+from ..exceptions import InvalidLoanParametersError, InvalidMoneyError
+from .annuity_factor_cache import AnnuityFactorCache
+from .annuity_factor_table import AnnuityFactorTable
+
+# Most requested loan conditions, preloaded into the factor cache
+COMMON_TERMS_MONTHS = (6, 12, 18, 24, 36, 48, 60, 72, 84, 96, 120, 180, 240, 300, 360)
+COMMON_INTEREST_RATES = tuple(
+    Decimal(basis_points).scaleb(-2) for basis_points in range(25, 1501, 25)
+)  # 0.25% .. 15.00%
+
+MAX_TERM_MONTHS = 360
+
+# Iteration bounds for the inverse solvers
+MAX_CENT_ADJUSTMENTS = 10
+MAX_NEWTON_ITERATIONS = 50
+
+
+@dataclass(frozen=True)
+class AmortizationPeriod:
+    """
+    One row of an amortization schedule
+    """
+    period: int
+    payment: Money
+    interest: Money
+    principal: Money
+    remaining_balance: Money
 
 
 class LoanCalculator:
@@ -10,6 +38,11 @@ class LoanCalculator:
     Domain Service for loan calculations
     """
     
+    # Shared by all requests of the worker process
+    _factor_cache: AnnuityFactorCache = AnnuityFactorCache()
+    # Optional memory-mapped grid shared by all worker processes
+    _factor_table: Optional[AnnuityFactorTable] = None
+    
     @staticmethod
     def calculate_monthly_payment(
         principal: Money,
@@ -48,11 +81,57 @@ class LoanCalculator:
             monthly_amount = principal.amount / Decimal(term_months)
             return Money(monthly_amount, principal.currency)
         
+        # Calculate monthly payment: P * [r(1+r)^n / ((1+r)^n - 1)]
+        factor = LoanCalculator.annuity_factor(annual_interest_rate, term_months)
+        monthly_amount = principal.amount * factor
+        
+        # Round to 2 decimal places (cents)
+        monthly_amount = monthly_amount.quantize(
+            Decimal('0.01'),
+            rounding=ROUND_HALF_UP
+        )
+        
+        return Money.trusted(monthly_amount, principal.currency)
+    
+    @staticmethod
+    def annuity_factor(
+        annual_interest_rate: Percentage,
+        term_months: int
+    ) -> Decimal:
+        """
+        Calculate the annuity factor r(1+r)^n / [(1+r)^n - 1]
+        
+        Monthly payment = principal * factor (before rounding to cents).
+        The factor only depends on rate and term: it is read from the
+        precomputed table when loaded, otherwise memoized in a bounded
+        LRU cache shared by every loan with the same conditions.
+        """
+        if LoanCalculator._factor_table is not None:
+            factor = LoanCalculator._factor_table.lookup(
+                annual_interest_rate.value,
+                term_months
+            )
+            if factor is not None:
+                return factor
+        
+        return LoanCalculator._factor_cache.get_or_compute(
+            (annual_interest_rate.value, term_months),
+            lambda: LoanCalculator._compute_annuity_factor(
+                annual_interest_rate,
+                term_months
+            )
+        )
+    
+    @staticmethod
+    def _compute_annuity_factor(
+        annual_interest_rate: Percentage,
+        term_months: int
+    ) -> Decimal:
+        """Uncached annuity factor (Decimal formula)"""
         # Convert annual percentage to monthly decimal rate
         # Example: 6% annual = Decimal('6') -> 0.06/12 = 0.005
         monthly_rate = annual_interest_rate.to_monthly_rate()
         
-        # Apply amortization formula     
         # Calculate (1 + r)^n
         one_plus_r = Decimal('1') + monthly_rate
         power_term = one_plus_r ** term_months
@@ -63,16 +142,75 @@ class LoanCalculator:
         # Calculate denominator: (1+r)^n - 1
         denominator = power_term - Decimal('1')
         
-        # Calculate monthly payment: P * [numerator / denominator]
-        monthly_amount = principal.amount * (numerator / denominator)
+        return numerator / denominator
+    
+    @classmethod
+    def load_factor_table(cls, path: str) -> bool:
+        """
+        Memory-map the precomputed factor table
         
-        # Round to 2 decimal places (cents)
-        monthly_amount = monthly_amount.quantize(
-            Decimal('0.01'),
-            rounding=ROUND_HALF_UP
-        )
+        Returns:
+            True if loaded, False if the file is missing or incompatible
+            (the Decimal formula is used instead)
+        """
+        table = AnnuityFactorTable.open(path)
+        if table is None:
+            return False
+        if cls._factor_table is not None:
+            cls._factor_table.close()
+        cls._factor_table = table
+        return True
+    
+    @classmethod
+    def unload_factor_table(cls) -> None:
+        """Close the factor table, falling back to the formula"""
+        if cls._factor_table is not None:
+            cls._factor_table.close()
+            cls._factor_table = None
+    
+    @classmethod
+    def configure_factor_cache(cls, maxsize: int) -> None:
+        """Replace the factor cache with an empty one of the given size"""
+        cls._factor_cache = AnnuityFactorCache(maxsize)
+    
+    @classmethod
+    def warm_up_factor_cache(
+        cls,
+        interest_rates: Optional[Iterable[Decimal]] = None,
+        terms_months: Optional[Iterable[int]] = None
+    ) -> int:
+        """
+        Preload annuity factors for common rate/term combinations
+        
+        Warm-up entries are stored directly and not counted as misses.
+        
+        Returns:
+            Number of factors loaded
+        """
+        rates = [
+            Percentage(rate)
+            for rate in (interest_rates or COMMON_INTEREST_RATES)
+        ]
+        terms = list(terms_months or COMMON_TERMS_MONTHS)
         
-        return Money(monthly_amount, principal.currency)
+        loaded = 0
+        for rate in rates:
+            if rate.value == 0:
+                continue
+            for term in terms:
+                if loaded >= cls._factor_cache.maxsize:
+                    return loaded
+                cls._factor_cache.put(
+                    (rate.value, term),
+                    cls._compute_annuity_factor(rate, term)
+                )
+                loaded += 1
+        return loaded
+    
+    @classmethod
+    def factor_cache_stats(cls) -> Dict[str, int]:
+        """Hit/miss/eviction counters of the factor cache"""
+        return cls._factor_cache.stats()
     
     @staticmethod
     def calculate_total_payment(
@@ -86,8 +224,9 @@ class LoanCalculator:
         if term_months <= 0:
             raise InvalidLoanParametersError("Term must be positive")
         
+        # Cents times an integer stays in cents
         total_amount = monthly_payment.amount * Decimal(term_months)
-        return Money(total_amount, monthly_payment.currency)
+        return Money.trusted(total_amount, monthly_payment.currency)
     
     @staticmethod
     def calculate_total_interest(
@@ -105,7 +244,7 @@ class LoanCalculator:
             )
         
         interest_amount = total_payment.amount - principal.amount
-        return Money(interest_amount, principal.currency)
+        return Money.trusted(interest_amount, principal.currency)
     
     @staticmethod
     def calculate_all(
@@ -145,4 +284,433 @@ class LoanCalculator:
             'monthly_payment': monthly_payment,
             'total_payment': total_payment,
             'total_interest': total_interest
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def calculate_all_batch(
+        principals: Sequence[Decimal],
+        annual_interest_rates: Sequence[Decimal],
+        term_months: Sequence[int]
+    ) -> Dict[str, List[Decimal]]:
+        """
+        Calculate all loan metrics for many loans in one pass
+        
+        Columnar counterpart of calculate_all: the i-th element of each
+        input sequence describes one loan. Annuity factors are computed
+        once per distinct (rate, term) pair and no Money objects are
+        built per row, while the arithmetic and ROUND_HALF_UP rounding
+        stay identical to the scalar path (cent for cent).
+        
+        Returns:
+            Dictionary with columns (same order as the input):
+            - 'monthly_payment': Monthly payment amounts
+            - 'total_payment': Total amounts paid over term
+            - 'total_interest': Total interest amounts
+        """
+        if not (len(principals) == len(annual_interest_rates) == len(term_months)):
+            raise InvalidLoanParametersError(
+                "Principals, rates and terms must have the same length"
+            )
+        
+        cent = Decimal('0.01')
+        factors: Dict[tuple, Decimal] = {}
+        
+        monthly_payments: List[Decimal] = []
+        total_payments: List[Decimal] = []
+        total_interests: List[Decimal] = []
+        
+        for index, (amount, rate, term) in enumerate(
+            zip(principals, annual_interest_rates, term_months)
+        ):
+            if term <= 0:
+                raise InvalidLoanParametersError(
+                    f"Row {index}: Term must be positive, got {term}"
+                )
+            
+            # Same validation and rounding as Money(amount)
+            if not isinstance(amount, Decimal):
+                raise InvalidMoneyError(
+                    f"Row {index}: Amount must be Decimal, got {type(amount).__name__}"
+                )
+            principal = amount.quantize(cent, rounding=ROUND_HALF_UP)
+            if principal <= 0:
+                raise InvalidLoanParametersError(
+                    f"Row {index}: Principal must be positive"
+                )
+            
+            key = (rate, term)
+            factor = factors.get(key)
+            if factor is None:
+                percentage = Percentage(rate)
+                # Zero factor marks the 0% interest special case
+                factor = (
+                    LoanCalculator.annuity_factor(percentage, term)
+                    if percentage.value != 0 else Decimal('0')
+                )
+                factors[key] = factor
+            
+            if factor:
+                monthly_amount = (principal * factor).quantize(
+                    cent,
+                    rounding=ROUND_HALF_UP
+                )
+            else:
+                monthly_amount = (principal / Decimal(term)).quantize(
+                    cent,
+                    rounding=ROUND_HALF_UP
+                )
+            
+            total_amount = monthly_amount * Decimal(term)
+            
+            monthly_payments.append(monthly_amount)
+            total_payments.append(total_amount)
+            total_interests.append(total_amount - principal)
+        
+        return {
+            'monthly_payment': monthly_payments,
+            'total_payment': total_payments,
+            'total_interest': total_interests
+        }
+    
+    @staticmethod
+    def amortization_schedule(
+        principal: Money,
+        annual_interest_rate: Percentage,
+        term_months: int
+    ) -> Iterator[AmortizationPeriod]:
+        """
+        Amortization schedule, yielded lazily one period at a time
+        
+        Every period pays the monthly payment from calculate_monthly_payment,
+        so the schedule's totals are exactly calculate_all's. Principal is
+        repaid along the exact (unrounded) annuity:
+        
+        Repaid after k periods = P * [(1+r)^k - 1] / [(1+r)^n - 1]
+        
+        rounded to cents; the rest of each payment is interest. That books
+        the payment's rounding (under half a cent) in every period instead
+        of compounding it into the last one: each period's interest stays
+        within two cents of remaining balance * monthly rate, so it can
+        only dip below zero where that is under a cent. At 0% interest
+        the payment is all principal; the last period repays the rest and
+        its interest is the (possibly negative) rounding remainder of P / n.
+        
+        The schedule ends once the balance is paid off. If a rounded-up
+        payment clears it before the last period (0% loans, extreme
+        rates), that period also collects the payments still due.
+        
+        Inputs are validated immediately, rows are computed on iteration.
+        """
+        monthly_payment = LoanCalculator.calculate_monthly_payment(
+            principal,
+            annual_interest_rate,
+            term_months
+        )
+        return LoanCalculator._iter_schedule(
+            principal,
+            annual_interest_rate,
+            term_months,
+            monthly_payment
+        )
+    
+    @staticmethod
+    def _iter_schedule(
+        principal: Money,
+        annual_interest_rate: Percentage,
+        term_months: int,
+        monthly_payment: Money
+    ) -> Iterator[AmortizationPeriod]:
+        """Generator behind amortization_schedule"""
+        currency = principal.currency
+        monthly_rate = annual_interest_rate.to_monthly_rate()
+        payment = monthly_payment.amount
+        total_payment = payment * Decimal(term_months)
+        amount = principal.amount
+        
+        growth = Decimal('1') + monthly_rate
+        denominator = growth ** term_months - Decimal('1')
+        compounded = Decimal('1')
+        repaid = Decimal('0')
+        paid = Decimal('0')
+        
+        for period in range(1, term_months + 1):
+            if period == term_months:
+                repaid_now = amount
+            elif monthly_rate == 0:
+                repaid_now = min(payment * period, amount)
+            else:
+                compounded *= growth
+                repaid_now = (amount * (compounded - 1) / denominator).quantize(
+                    Decimal('0.01'),
+                    rounding=ROUND_HALF_UP
+                )
+            
+            principal_part = repaid_now - repaid
+            repaid = repaid_now
+            balance = amount - repaid
+            # The last period collects whatever is still due
+            period_payment = payment if balance else total_payment - paid
+            paid += period_payment
+            
+            # All amounts are cent sums/differences, no re-validation needed
+            yield AmortizationPeriod(
+                period=period,
+                payment=Money.trusted(period_payment, currency),
+                interest=Money.trusted(period_payment - principal_part, currency),
+                principal=Money.trusted(principal_part, currency),
+                remaining_balance=Money.trusted(balance, currency)
+            )
+            
+            if balance == 0:
+                return
+    
+    @staticmethod
+    def _payment_amount(
+        principal_amount: Decimal,
+        annual_interest_rate: Percentage,
+        term_months: int
+    ) -> Decimal:
+        """Monthly payment in cents, same rounding as calculate_monthly_payment"""
+        if annual_interest_rate.value == 0:
+            amount = principal_amount / Decimal(term_months)
+        else:
+            amount = principal_amount * LoanCalculator.annuity_factor(
+                annual_interest_rate,
+                term_months
+            )
+        return amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    
+    @staticmethod
+    def max_principal_for_payment(
+        monthly_payment: Money,
+        annual_interest_rate: Percentage,
+        term_months: int
+    ) -> Money:
+        """
+        Largest principal whose monthly payment does not exceed monthly_payment
+        
+        Closed form: P = M / factor, using M + 0.005 as the upper bound
+        of amounts that still round to M. A few cent steps then correct
+        for rounding.
+        """
+        if term_months <= 0:
+            raise InvalidLoanParametersError(
+                f"Term must be positive, got {term_months}"
+            )
+        if monthly_payment.amount <= 0:
+            raise InvalidLoanParametersError("Monthly payment must be positive")
+        
+        cent = Decimal('0.01')
+        target = monthly_payment.amount
+        upper_bound = target + Decimal('0.005')
+        
+        if annual_interest_rate.value == 0:
+            candidate = upper_bound * Decimal(term_months)
+        else:
+            candidate = upper_bound / LoanCalculator.annuity_factor(
+                annual_interest_rate,
+                term_months
+            )
+        candidate = candidate.quantize(cent, rounding=ROUND_FLOOR)
+        
+        for _ in range(MAX_CENT_ADJUSTMENTS):
+            if candidate > 0 and LoanCalculator._payment_amount(
+                candidate, annual_interest_rate, term_months
+            ) > target:
+                candidate -= cent
+            elif LoanCalculator._payment_amount(
+                candidate + cent, annual_interest_rate, term_months
+            ) <= target:
+                candidate += cent
+            else:
+                break
+        
+        if candidate <= 0:
+            raise InvalidLoanParametersError(
+                "Monthly payment is too low for any principal"
+            )
+        
+        return Money(candidate, monthly_payment.currency)
+    
+    @staticmethod
+    def min_term_for_payment(
+        principal: Money,
+        annual_interest_rate: Percentage,
+        monthly_payment: Money,
+        max_term_months: int = MAX_TERM_MONTHS
+    ) -> int:
+        """
+        Shortest term whose monthly payment does not exceed monthly_payment
+        
+        Closed form: n = -ln(1 - rP/M) / ln(1 + r), then adjusted by
+        single months for payment rounding.
+        """
+        if principal.amount <= 0:
+            raise InvalidLoanParametersError("Principal must be positive")
+        if monthly_payment.amount <= 0:
+            raise InvalidLoanParametersError("Monthly payment must be positive")
+        if principal.currency != monthly_payment.currency:
+            raise InvalidLoanParametersError(
+                "Principal and monthly payment must be in same currency"
+            )
+        
+        target = monthly_payment.amount
+        
+        def payment(term: int) -> Decimal:
+            return LoanCalculator._payment_amount(
+                principal.amount,
+                annual_interest_rate,
+                term
+            )
+        
+        if payment(max_term_months) > target:
+            raise InvalidLoanParametersError(
+                f"Monthly payment is too low to repay the loan "
+                f"within {max_term_months} months"
+            )
+        
+        if annual_interest_rate.value == 0:
+            estimate = principal.amount / target
+        else:
+            monthly_rate = annual_interest_rate.to_monthly_rate()
+            # payment(max_term) <= target guarantees rP < M here
+            estimate = (
+                -(Decimal('1') - monthly_rate * principal.amount / target).ln()
+                / (Decimal('1') + monthly_rate).ln()
+            )
+        
+        term = int(estimate.to_integral_value(rounding=ROUND_CEILING))
+        term = min(max(term, 1), max_term_months)
+        
+        for _ in range(MAX_CENT_ADJUSTMENTS):
+            if payment(term) > target:
+                term += 1
+            elif term > 1 and payment(term - 1) <= target:
+                term -= 1
+            else:
+                break
+        
+        return term
+    
+    @staticmethod
+    def implied_interest_rate(
+        principal: Money,
+        monthly_payment: Money,
+        term_months: int
+    ) -> Percentage:
+        """
+        Highest annual rate (0.01 steps) whose monthly payment does not
+        exceed monthly_payment
+        
+        Solves P * r / (1 - (1+r)^-n) = M for the monthly rate r with
+        Newton's method, safeguarded by bisection on [0, 100%/12].
+        """
+        if term_months <= 0:
+            raise InvalidLoanParametersError(
+                f"Term must be positive, got {term_months}"
+            )
+        if principal.amount <= 0:
+            raise InvalidLoanParametersError("Principal must be positive")
+        if monthly_payment.amount <= 0:
+            raise InvalidLoanParametersError("Monthly payment must be positive")
+        if principal.currency != monthly_payment.currency:
+            raise InvalidLoanParametersError(
+                "Principal and monthly payment must be in same currency"
+            )
+        
+        amount = principal.amount
+        target = monthly_payment.amount
+        zero = Percentage(Decimal('0'))
+        maximum = Percentage(Decimal('100'))
+        
+        def payment(rate: Percentage) -> Decimal:
+            return LoanCalculator._payment_amount(amount, rate, term_months)
+        
+        if payment(zero) > target:
+            raise InvalidLoanParametersError(
+                "Monthly payment is too low to repay the principal"
+            )
+        if payment(maximum) <= target:
+            return maximum
+        
+        one = Decimal('1')
+        n = Decimal(term_months)
+        low = Decimal('0')
+        high = maximum.to_monthly_rate()
+        # Interest ~ P * r * (n + 1) / 2 gives a close first guess
+        rate = 2 * (target * n - amount) / (amount * (n + 1))
+        if not low < rate < high:
+            rate = high / 2
+        
+        for _ in range(MAX_NEWTON_ITERATIONS):
+            discount = (one + rate) ** -term_months
+            annuity = one - discount
+            value = amount * rate / annuity - target
+            
+            if value > 0:
+                high = rate
+            else:
+                low = rate
+            
+            derivative = amount * (
+                annuity - rate * n * discount / (one + rate)
+            ) / (annuity * annuity)
+            next_rate = rate - value / derivative if derivative else low
+            if not low < next_rate < high:
+                next_rate = (low + high) / 2
+            
+            if abs(next_rate - rate) < Decimal('1e-15'):
+                rate = next_rate
+                break
+            rate = next_rate
+        
+        annual = (rate * 1200).quantize(Decimal('0.01'), rounding=ROUND_FLOOR)
+        step = Decimal('0.01')
+        
+        # Snap to the 0.01 grid: highest rate that still fits the payment
+        for _ in range(MAX_CENT_ADJUSTMENTS):
+            if annual > 0 and payment(Percentage(annual)) > target:
+                annual -= step
+            elif annual < 100 and payment(Percentage(annual + step)) <= target:
+                annual += step
+            else:
+                break
+        
+        return Percentage(annual)
+    
+    @staticmethod
+    def effective_annual_rate(annual_interest_rate: Percentage) -> Decimal:
+        """
+        Effective annual rate (APR) of a nominal rate compounded monthly
+        
+        Formula: EAR = (1 + r/12)^12 - 1, as a percentage rounded to 0.01
+        
+        Returns a Decimal rather than a Percentage: high nominal rates
+        compound to more than 100%.
+        """
+        return _effective_annual_rate(annual_interest_rate.value)
+    
+    @staticmethod
+    def effective_annual_rates(
+        annual_interest_rates: Sequence[Percentage]
+    ) -> List[Decimal]:
+        """
+        Effective annual rates for many loans (same order as input)
+        
+        Rates are quantized to 0.01, so listings share a small set of
+        distinct values that are computed once.
+        """
+        return [
+            _effective_annual_rate(rate.value)
+            for rate in annual_interest_rates
+        ]
+
+
+@lru_cache(maxsize=10_001)  # every 0.01 step between 0% and 100%
+def _effective_annual_rate(nominal_rate: Decimal) -> Decimal:
+    monthly_rate = nominal_rate / Decimal('1200')
+    effective = (Decimal('1') + monthly_rate) ** 12 - Decimal('1')
+    return (effective * Decimal('100')).quantize(
+        Decimal('0.01'),
+        rounding=ROUND_HALF_UP
+    )
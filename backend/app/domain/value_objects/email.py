@@ -15,10 +15,11 @@ class Email:
         if not self.value or not isinstance(self.value, str):
             raise InvalidEmailError("Email cannot be empty")
         
-        if not self.EMAIL_REGEX.match(self.value):
+        value = self.value.strip().lower()
+        if not self.EMAIL_REGEX.match(value):
             raise InvalidEmailError(f"Invalid email format: {self.value}")
         
-        object.__setattr__(self, 'value', self.value.lower().strip())
+        object.__setattr__(self, 'value', value)
     
     def __str__(self) -> str:
         return self.value
@@ -3,7 +3,11 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Union
 from ..exceptions import InvalidMoneyError
 
-@dataclass(frozen=True)
+VALID_CURRENCIES = ('EUR', 'USD', 'GBP')
+_CENT = Decimal('0.01')
+
+
+@dataclass(frozen=True, slots=True)
 class Money:
     """
     Value Object for Money
@@ -17,31 +21,45 @@ class Money:
                 f"Amount must be Decimal, got {type(self.amount).__name__}"
             )
         
-        valid_currencies = ['EUR', 'USD', 'GBP']
-        if self.currency not in valid_currencies:
+        if self.currency not in VALID_CURRENCIES:
             raise InvalidMoneyError(
-                f"Invalid currency: {self.currency}. Must be one of {valid_currencies}"
+                f"Invalid currency: {self.currency}. Must be one of {list(VALID_CURRENCIES)}"
             )
         
         object.__setattr__(
             self, 
             'amount', 
-            self.amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            self.amount.quantize(_CENT, rounding=ROUND_HALF_UP)
         )
 
+    @classmethod
+    def trusted(cls, amount: Decimal, currency: str = "EUR") -> 'Money':
+        """
+        Build Money from values already known to be valid, skipping validation
+        
+        Only for amounts that are Decimals with exactly 2 decimal places
+        (e.g. NUMERIC(12, 2) columns, results of Money arithmetic) and
+        a valid currency. Anything else must go through Money(...).
+        """
+        money = object.__new__(cls)
+        object.__setattr__(money, 'amount', amount)
+        object.__setattr__(money, 'currency', currency)
+        return money
+
     def add(self, other: 'Money') -> 'Money':
         if self.currency != other.currency:
             raise InvalidMoneyError(
                 f"Cannot add different currencies: {self.currency} and {other.currency}"
             )
-        return Money(self.amount + other.amount, self.currency) 
+        # Sum of two cent amounts is already in cents
+        return Money.trusted(self.amount + other.amount, self.currency)
     
     def subtract(self, other: 'Money') -> 'Money':
         if self.currency != other.currency:
             raise InvalidMoneyError(
                 f"Cannot subtract different currencies: {self.currency} and {other.currency}"
             )
-        return Money(self.amount - other.amount, self.currency)
+        return Money.trusted(self.amount - other.amount, self.currency)
     
     def multiply(self, factor: Union[Decimal, int, float]) -> 'Money':
         if isinstance(factor, float):
@@ -49,7 +67,10 @@ class Money:
         elif isinstance(factor, int):
             factor = Decimal(factor)
         
-        return Money(self.amount * factor, self.currency)
+        return Money.trusted(
+            (self.amount * factor).quantize(_CENT, rounding=ROUND_HALF_UP),
+            self.currency
+        )
     
     def divide(self, divisor: Union[Decimal, int, float]) -> 'Money':
         if isinstance(divisor, float):
@@ -60,7 +81,10 @@ class Money:
         if divisor == 0:
             raise InvalidMoneyError("Cannot divide by zero")
         
-        return Money(self.amount / divisor, self.currency)
+        return Money.trusted(
+            (self.amount / divisor).quantize(_CENT, rounding=ROUND_HALF_UP),
+            self.currency
+        )
     
     def __str__(self) -> str:
         return f"{self.currency} {self.amount:.2f}"
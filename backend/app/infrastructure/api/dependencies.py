@@ -1,32 +1,54 @@
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request
 from typing import AsyncGenerator
 
-from ..database.connection import get_session
+from ..database.connection import DatabaseConnection
 from ..database.unit_of_work import UnitOfWork
-from ...application.interfaces.unit_of_work import IUnitOfWork
+from ...application.interfaces.unit_of_work import IUnitOfWork, TransactionMode
 from ...application.use_cases.customer import (
     CreateCustomerUseCase,
+    UpsertCustomerUseCase,
     GetCustomerUseCase,
+    GetCustomerWithLoanOffersUseCase,
     ListCustomersUseCase,
     UpdateCustomerUseCase,
     DeleteCustomerUseCase,
+    DeleteCustomersUseCase,
+    ImportCustomersUseCase,
 )
 from ...application.use_cases.loan_offer import (
     CreateLoanOfferUseCase,
+    CreateLoanOffersUseCase,
     CalculateLoanUseCase,
+    CalculateLoanBatchUseCase,
     GetLoanOfferUseCase,
     ListCustomerLoanOffersUseCase,
+    CalculatePaymentGridUseCase,
+    CalculateMaxPrincipalUseCase,
+    CalculateMinTermUseCase,
+    CalculateImpliedRateUseCase,
+    CalculateLoanScheduleUseCase,
+    GetLoanOfferScheduleUseCase,
+    GetLoanOfferSchedulesUseCase,
 )
+from ...application.pagination import CountMode, CountCache
 from ...config import settings
+from .read_your_writes import mark_write, reads_from_primary
+
+# Shared by all requests of this worker
+_count_cache = CountCache(
+    ttl_seconds=settings.PAGINATION_COUNT_CACHE_TTL,
+    maxsize=settings.PAGINATION_COUNT_CACHE_SIZE
+)
 
 
 async def get_uow(
-    session: AsyncSession = Depends(get_session)
+    request: Request
 ) -> AsyncGenerator[IUnitOfWork, None]:
     """
     Dependency for Unit of Work
     
+    No connection is taken from the pool until a repository is used.
+    
     Usage:
     @router.post("/customers")
     async def create_customer(
@@ -34,11 +56,54 @@ async def get_uow(
     ):
         ...
     """
-    uow = UnitOfWork(session)
+    mark_write(request)
+    uow = UnitOfWork(DatabaseConnection.get_sessionmaker())
     try:
         yield uow
     finally:
-        pass
+        await uow.close()
+
+
+async def _read_uow(
+    request: Request,
+    mode: TransactionMode
+) -> AsyncGenerator[IUnitOfWork, None]:
+    sessionmaker = (
+        DatabaseConnection.get_sessionmaker(mode)
+        if reads_from_primary(request)
+        else DatabaseConnection.get_read_sessionmaker(mode)
+    )
+    uow = UnitOfWork(sessionmaker, mode)
+    try:
+        yield uow
+    finally:
+        await uow.close()
+
+
+async def get_read_uow(
+    request: Request
+) -> AsyncGenerator[IUnitOfWork, None]:
+    """
+    Dependency for Unit of Work of single-query read use cases
+    
+    Runs without a transaction. Reads go to a replica, or to the
+    primary right after the client's write. Must not be used by use
+    cases that write.
+    """
+    async for uow in _read_uow(request, TransactionMode.READ_ONLY):
+        yield uow
+
+
+async def get_snapshot_uow(
+    request: Request
+) -> AsyncGenerator[IUnitOfWork, None]:
+    """
+    Dependency for Unit of Work of read use cases with several queries
+    
+    Like get_read_uow, in one read-only snapshot transaction.
+    """
+    async for uow in _read_uow(request, TransactionMode.SNAPSHOT):
+        yield uow
 
 
 # Customer Use Case Dependencies
@@ -51,16 +116,33 @@ def get_create_customer_use_case(
     return CreateCustomerUseCase(uow)
 
 
-def get_get_customer_use_case(
+def get_upsert_customer_use_case(
     uow: IUnitOfWork = Depends(get_uow)
+) -> UpsertCustomerUseCase:
+    return UpsertCustomerUseCase(uow)
+
+
+def get_get_customer_use_case(
+    uow: IUnitOfWork = Depends(get_read_uow)
 ) -> GetCustomerUseCase:
     return GetCustomerUseCase(uow)
 
 
+def get_get_customer_with_loan_offers_use_case(
+    uow: IUnitOfWork = Depends(get_snapshot_uow)
+) -> GetCustomerWithLoanOffersUseCase:
+    return GetCustomerWithLoanOffersUseCase(uow, max_loan_offers=settings.MAX_PAGE_SIZE)
+
+
 def get_list_customers_use_case(
-    uow: IUnitOfWork = Depends(get_uow)
+    uow: IUnitOfWork = Depends(get_read_uow)
 ) -> ListCustomersUseCase:
-    return ListCustomersUseCase(uow, max_limit=settings.MAX_PAGE_SIZE)
+    return ListCustomersUseCase(
+        uow,
+        max_limit=settings.MAX_PAGE_SIZE,
+        count_mode=CountMode(settings.PAGINATION_COUNT_MODE),
+        count_cache=_count_cache,
+    )
 
 
 def get_update_customer_use_case(
@@ -75,6 +157,22 @@ def get_delete_customer_use_case(
     return DeleteCustomerUseCase(uow)
 
 
+def get_delete_customers_use_case(
+    uow: IUnitOfWork = Depends(get_uow)
+) -> DeleteCustomersUseCase:
+    return DeleteCustomersUseCase(uow)
+
+
+def get_import_customers_use_case(
+    uow: IUnitOfWork = Depends(get_uow)
+) -> ImportCustomersUseCase:
+    return ImportCustomersUseCase(
+        uow,
+        batch_size=settings.CUSTOMER_IMPORT_BATCH_SIZE,
+        max_reported_errors=settings.CUSTOMER_IMPORT_MAX_REPORTED_ERRORS,
+    )
+
+
 # Loan Offer Use Case Dependencies
 def get_create_loan_offer_use_case(
     uow: IUnitOfWork = Depends(get_uow)
@@ -82,6 +180,12 @@ def get_create_loan_offer_use_case(
     return CreateLoanOfferUseCase(uow)
 
 
+def get_create_loan_offers_use_case(
+    uow: IUnitOfWork = Depends(get_uow)
+) -> CreateLoanOffersUseCase:
+    return CreateLoanOffersUseCase(uow)
+
+
 def get_calculate_loan_use_case() -> CalculateLoanUseCase:
     """
     No database needed for calculation
@@ -89,13 +193,54 @@ def get_calculate_loan_use_case() -> CalculateLoanUseCase:
     return CalculateLoanUseCase()
 
 
+def get_calculate_loan_batch_use_case() -> CalculateLoanBatchUseCase:
+    return CalculateLoanBatchUseCase()
+
+
+def get_calculate_payment_grid_use_case() -> CalculatePaymentGridUseCase:
+    return CalculatePaymentGridUseCase()
+
+
+def get_calculate_max_principal_use_case() -> CalculateMaxPrincipalUseCase:
+    return CalculateMaxPrincipalUseCase()
+
+
+def get_calculate_min_term_use_case() -> CalculateMinTermUseCase:
+    return CalculateMinTermUseCase()
+
+
+def get_calculate_implied_rate_use_case() -> CalculateImpliedRateUseCase:
+    return CalculateImpliedRateUseCase()
+
+
 def get_get_loan_offer_use_case(
-    uow: IUnitOfWork = Depends(get_uow)
+    uow: IUnitOfWork = Depends(get_read_uow)
 ) -> GetLoanOfferUseCase:
     return GetLoanOfferUseCase(uow)
 
 
 def get_list_customer_loan_offers_use_case(
-    uow: IUnitOfWork = Depends(get_uow)
+    uow: IUnitOfWork = Depends(get_read_uow)
 ) -> ListCustomerLoanOffersUseCase:
-    return ListCustomerLoanOffersUseCase(uow, max_limit=settings.MAX_PAGE_SIZE)
\ No newline at end of file
+    return ListCustomerLoanOffersUseCase(
+        uow,
+        max_limit=settings.MAX_PAGE_SIZE,
+        count_mode=CountMode(settings.PAGINATION_COUNT_MODE),
+        count_cache=_count_cache,
+    )
+
+
+def get_calculate_loan_schedule_use_case() -> CalculateLoanScheduleUseCase:
+    return CalculateLoanScheduleUseCase()
+
+
+def get_loan_offer_schedule_use_case(
+    uow: IUnitOfWork = Depends(get_read_uow)
+) -> GetLoanOfferScheduleUseCase:
+    return GetLoanOfferScheduleUseCase(uow)
+
+
+def get_loan_offer_schedules_use_case(
+    uow: IUnitOfWork = Depends(get_read_uow)
+) -> GetLoanOfferSchedulesUseCase:
+    return GetLoanOfferSchedulesUseCase(uow)
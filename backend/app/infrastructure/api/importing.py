@@ -0,0 +1,85 @@
+"""
+Incremental parsing of uploaded customer files (CSV / NDJSON)
+
+The request body is consumed chunk by chunk and split into lines, so
+an upload is never held in memory as a whole. Each line becomes one
+ImportRow: the parsed fields, or an error message for that line.
+"""
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Literal, Optional
+
+from ...application.exceptions import ValidationError
+from ...application.use_cases.customer import ImportRow
+
+ImportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# Longest accepted line; protects against a body without newlines
+MAX_LINE_CHARS = 64 * 1024
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(pending) > MAX_LINE_CHARS:
+            raise ValidationError(f"Line longer than {MAX_LINE_CHARS} characters")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _csv_fields(header: List[str], line: str) -> Dict[str, Optional[str]] | str:
+    try:
+        values = next(csv.reader([line]))
+    except csv.Error as e:
+        return f"Invalid CSV: {e}"
+    if len(values) != len(header):
+        return f"Expected {len(header)} columns, got {len(values)}"
+    # Empty cells are missing values
+    return {name: value or None for name, value in zip(header, values)}
+
+
+def _ndjson_fields(line: str) -> Dict | str:
+    try:
+        fields = json.loads(line)
+    except json.JSONDecodeError as e:
+        return f"Invalid JSON: {e.msg}"
+    if not isinstance(fields, dict):
+        return "Expected a JSON object"
+    return fields
+
+
+async def parse_import(
+    chunks: AsyncIterator[bytes],
+    format: ImportFormat
+) -> AsyncIterator[ImportRow]:
+    """
+    Parse an uploaded file into (line number, fields) rows
+
+    CSV needs a header line with the field names; quoted values may
+    not span lines. Blank lines are skipped.
+    """
+    header: Optional[List[str]] = None
+    line_number = 0
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if format == "ndjson":
+            yield line_number, _ndjson_fields(line)
+        elif header is None:
+            header = [name.strip() for name in next(csv.reader([line]))]
+        else:
+            yield line_number, _csv_fields(header, line)
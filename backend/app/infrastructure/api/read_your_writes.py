@@ -0,0 +1,48 @@
+"""
+Read-your-writes routing for read replicas
+
+Replicas apply the primary's changes with some lag, so a client that
+just wrote could read stale data from them. After a successful
+request that used the primary for writing, the client gets a
+short-lived cookie; while it is present, the
+client's reads go to the primary. The cookie keeps the routing
+stateless, so it works across workers and instances.
+"""
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from ...config import settings
+
+COOKIE_NAME = "read_primary"
+
+
+def mark_write(request: Request) -> None:
+    """Record that this request writes to the primary"""
+    request.state.wrote = True
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether this client wrote recently"""
+    return COOKIE_NAME in request.cookies
+
+
+async def read_your_writes_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Set the cookie on responses to successful writes"""
+    response = await call_next(request)
+    if (
+        settings.DATABASE_READ_REPLICA_URLS
+        and getattr(request.state, "wrote", False)
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            COOKIE_NAME,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
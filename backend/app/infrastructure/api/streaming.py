@@ -0,0 +1,105 @@
+"""
+Streaming (chunked) responses for amortization schedules
+
+Rows are encoded lazily in small chunks, so a schedule is never
+built as one document in memory. Starlette cancels the response
+when the client disconnects; the encoder yields control after
+every chunk so that cancellation takes effect promptly.
+"""
+import asyncio
+import csv
+import io
+import json
+from typing import AsyncIterator, Iterable, Iterator, List, Literal, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from ...domain.services.loan_calculator import AmortizationPeriod
+
+ScheduleFormat = Literal["ndjson", "csv"]
+
+SCHEDULE_FIELDS = ["period", "payment", "interest", "principal", "remaining_balance"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Rows per chunk written to the socket
+CHUNK_ROWS = 120
+
+
+def _period_values(period: AmortizationPeriod) -> List:
+    return [
+        period.period,
+        str(period.payment.amount),
+        str(period.interest.amount),
+        str(period.principal.amount),
+        str(period.remaining_balance.amount),
+    ]
+
+
+def _chunked(rows: Iterable[List], size: int) -> Iterator[List[List]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _encode(
+    rows: Iterable[List],
+    fieldnames: Sequence[str],
+    format: ScheduleFormat
+) -> AsyncIterator[str]:
+    if format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        yield buffer.getvalue()
+
+    for chunk in _chunked(rows, CHUNK_ROWS):
+        if format == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(chunk)
+            yield buffer.getvalue()
+        else:
+            yield "".join(
+                json.dumps(dict(zip(fieldnames, row))) + "\n"
+                for row in chunk
+            )
+        # Let Starlette observe a client disconnect between chunks
+        await asyncio.sleep(0)
+
+
+def schedule_response(
+    periods: Iterator[AmortizationPeriod],
+    format: ScheduleFormat,
+    filename: str
+) -> StreamingResponse:
+    """Stream a single schedule"""
+    return StreamingResponse(
+        _encode(map(_period_values, periods), SCHEDULE_FIELDS, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'inline; filename="{filename}.{format}"'},
+    )
+
+
+def offer_schedules_response(
+    rows: Iterator[Tuple[int, AmortizationPeriod]],
+    format: ScheduleFormat,
+    filename: str
+) -> StreamingResponse:
+    """Stream schedules of many offers, each row prefixed with offer_id"""
+    return StreamingResponse(
+        _encode(
+            ([offer_id] + _period_values(period) for offer_id, period in rows),
+            ["offer_id"] + SCHEDULE_FIELDS,
+            format,
+        ),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'inline; filename="{filename}.{format}"'},
+    )
@@ -1,26 +1,40 @@
-from fastapi import APIRouter, Depends, Query, status
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from typing import List, Optional
 
 from ....application.dtos.customer_dto import (
     CustomerCreateDTO,
     CustomerUpdateDTO,
     CustomerResponseDTO,
+    CustomerWithLoanOffersDTO,
+    CustomerBulkDeleteDTO,
+    CustomerBulkDeleteResponseDTO,
+    CustomerImportResultDTO,
 )
 from ....application.use_cases.customer import (
     CreateCustomerUseCase,
+    UpsertCustomerUseCase,
     GetCustomerUseCase,
+    GetCustomerWithLoanOffersUseCase,
     ListCustomersUseCase,
     UpdateCustomerUseCase,
     DeleteCustomerUseCase,
+    DeleteCustomersUseCase,
+    ImportCustomersUseCase,
 )
+from ....application.pagination import CountMode
 from ....shared.response_models import SuccessResponse, PaginatedResponse
 from ..dependencies import (
     get_create_customer_use_case,
+    get_upsert_customer_use_case,
     get_get_customer_use_case,
+    get_get_customer_with_loan_offers_use_case,
     get_list_customers_use_case,
     get_update_customer_use_case,
     get_delete_customer_use_case,
+    get_delete_customers_use_case,
+    get_import_customers_use_case,
 )
+from ..importing import ImportFormat, MEDIA_TYPES, parse_import
 
 router = APIRouter(prefix="/customers", tags=["customers"])
 
@@ -30,8 +44,12 @@ router = APIRouter(prefix="/customers", tags=["customers"])
     response_model=SuccessResponse[CustomerResponseDTO],
     status_code=status.HTTP_201_CREATED,
     summary="Create a new customer",
-    description="Create a new customer with the provided information. Email must be unique.",
+    description=(
+        "Create a new customer with the provided information. Email must be unique. "
+        "With upsert=true an existing customer with the same email is updated instead."
+    ),
     responses={
+        200: {"description": "Existing customer updated (upsert)"},
         201: {"description": "Customer created successfully"},
         409: {"description": "Customer with this email already exists"},
         422: {"description": "Invalid request data"},
@@ -39,18 +57,68 @@ router = APIRouter(prefix="/customers", tags=["customers"])
 )
 async def create_customer(
     customer_data: CustomerCreateDTO,
-    use_case: CreateCustomerUseCase = Depends(get_create_customer_use_case)
+    response: Response,
+    upsert: bool = Query(False, description="Update the customer with the same email instead of failing"),
+    use_case: CreateCustomerUseCase = Depends(get_create_customer_use_case),
+    upsert_use_case: UpsertCustomerUseCase = Depends(get_upsert_customer_use_case)
 ):
     """
     Create a new customer
     """
-    customer = await use_case.execute(customer_data)
+    if upsert:
+        customer, created = await upsert_use_case.execute(customer_data)
+        if not created:
+            response.status_code = status.HTTP_200_OK
+            return SuccessResponse(
+                data=customer,
+                message="Customer updated successfully"
+            )
+    else:
+        customer = await use_case.execute(customer_data)
     return SuccessResponse(
         data=customer,
         message="Customer created successfully"
     )
 
 
+@router.post(
+    "/import",
+    response_model=SuccessResponse[CustomerImportResultDTO],
+    summary="Import customers from a file",
+    description=(
+        "Stream a CSV (with header line) or NDJSON file of customers in the request body. "
+        "Rows are validated and inserted in batches; invalid rows, duplicate emails within "
+        "the file and existing emails are reported per line and skipped."
+    ),
+    responses={
+        200: {"description": "Import finished (see failed and errors)"},
+        400: {"description": "Unreadable file"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {"schema": {"type": "string", "format": "binary"}}
+                for media_type in MEDIA_TYPES.values()
+            },
+        }
+    },
+)
+async def import_customers(
+    request: Request,
+    format: ImportFormat = Query("csv", description="csv or ndjson"),
+    use_case: ImportCustomersUseCase = Depends(get_import_customers_use_case)
+):
+    """
+    Bulk import customers
+    """
+    result = await use_case.execute(parse_import(request.stream(), format))
+    return SuccessResponse(
+        data=result,
+        message=f"{result.imported} customers imported, {result.failed} rejected"
+    )
+
+
 @router.get(
     "/",
     response_model=PaginatedResponse[CustomerResponseDTO],
@@ -63,19 +131,22 @@ async def create_customer(
 async def list_customers(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return (max 100)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    count: Optional[CountMode] = Query(None, description="Total count mode: exact, estimated, cached or none (total is null)"),
     use_case: ListCustomersUseCase = Depends(get_list_customers_use_case)
 ):
     """
     List customers with pagination
     """
-    customers, total_count = await use_case.execute(skip, limit)
+    page = await use_case.execute(skip, limit, cursor, count)
     
     return PaginatedResponse(
-        data=customers,
-        total=total_count,
-        skip=skip,
+        data=page.items,
+        total=page.total,
+        skip=skip if cursor is None else 0,
         limit=limit,
-        has_more=(skip + limit) < total_count
+        has_more=page.has_more,
+        next_cursor=page.next_cursor
     )
 
 
@@ -100,6 +171,28 @@ async def get_customer(
     return SuccessResponse(data=customer)
 
 
+@router.get(
+    "/{customer_id}/details",
+    response_model=SuccessResponse[CustomerWithLoanOffersDTO],
+    summary="Get customer with loan offers",
+    description="Get a customer together with their most recent loan offers",
+    responses={
+        200: {"description": "Customer found"},
+        404: {"description": "Customer not found"},
+    }
+)
+async def get_customer_details(
+    customer_id: int,
+    limit: int = Query(50, ge=1, le=100, description="Number of loan offers to return (max 100)"),
+    use_case: GetCustomerWithLoanOffersUseCase = Depends(get_get_customer_with_loan_offers_use_case)
+):
+    """
+    Get customer with loan offers
+    """
+    customer = await use_case.execute(customer_id, limit)
+    return SuccessResponse(data=customer)
+
+
 @router.put(
     "/{customer_id}",
     response_model=SuccessResponse[CustomerResponseDTO],
@@ -144,3 +237,27 @@ async def delete_customer(
     Delete customer
     """
     await use_case.execute(customer_id)
+
+
+@router.post(
+    "/bulk-delete",
+    response_model=SuccessResponse[CustomerBulkDeleteResponseDTO],
+    summary="Delete many customers",
+    description="Delete up to 1,000 customers and all their loan offers in one statement. IDs that don't exist are reported in not_found.",
+    responses={
+        200: {"description": "Customers deleted"},
+        422: {"description": "Invalid request data"},
+    }
+)
+async def delete_customers(
+    data: CustomerBulkDeleteDTO,
+    use_case: DeleteCustomersUseCase = Depends(get_delete_customers_use_case)
+):
+    """
+    Delete many customers
+    """
+    result = await use_case.execute(data)
+    return SuccessResponse(
+        data=result,
+        message=f"{len(result.deleted)} customers deleted"
+    )
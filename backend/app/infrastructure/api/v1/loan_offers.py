@@ -1,23 +1,56 @@
-from fastapi import APIRouter, Depends, Query, status
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Annotated, List, Optional
+import hashlib
 
 from ....application.dtos.loan_offer_dto import (
     LoanOfferCreateDTO,
+    LoanOfferBulkCreateDTO,
     LoanOfferResponseDTO,
     LoanCalculationDTO,
     LoanCalculationResponseDTO,
+    LoanCalculationBatchDTO,
+    LoanCalculationBatchItemDTO,
+    LoanOfferScheduleBatchDTO,
+    MaxPrincipalCalculationDTO,
+    MinTermCalculationDTO,
+    ImpliedRateCalculationDTO,
+    LoanSolutionResponseDTO,
+    LoanPaymentGridDTO,
+    LoanPaymentGridResponseDTO,
 )
 from ....application.use_cases.loan_offer import (
     CreateLoanOfferUseCase,
+    CreateLoanOffersUseCase,
     CalculateLoanUseCase,
+    CalculateLoanBatchUseCase,
     ListCustomerLoanOffersUseCase,
+    CalculatePaymentGridUseCase,
+    CalculateMaxPrincipalUseCase,
+    CalculateMinTermUseCase,
+    CalculateImpliedRateUseCase,
+    CalculateLoanScheduleUseCase,
+    GetLoanOfferScheduleUseCase,
+    GetLoanOfferSchedulesUseCase,
 )
+from ....application.pagination import CountMode
 from ....shared.response_models import SuccessResponse, PaginatedResponse
 from ..dependencies import (
     get_create_loan_offer_use_case,
+    get_create_loan_offers_use_case,
     get_calculate_loan_use_case,
+    get_calculate_loan_batch_use_case,
     get_list_customer_loan_offers_use_case,
+    get_calculate_payment_grid_use_case,
+    get_calculate_max_principal_use_case,
+    get_calculate_min_term_use_case,
+    get_calculate_implied_rate_use_case,
+    get_calculate_loan_schedule_use_case,
+    get_loan_offer_schedule_use_case,
+    get_loan_offer_schedules_use_case,
 )
+from ..streaming import ScheduleFormat, schedule_response, offer_schedules_response
+from ....config import settings
 
 router = APIRouter(prefix="/loanoffers", tags=["loan-offers"])
 
@@ -46,6 +79,30 @@ async def create_loan_offer(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=SuccessResponse[List[LoanOfferResponseDTO]],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many loan offers",
+    description="Create up to 5,000 loan offers in one transaction (all or nothing). Offers are returned in request order.",
+    responses={
+        201: {"description": "Loan offers created successfully"},
+        404: {"description": "Customer not found"},
+        422: {"description": "Invalid loan parameters"},
+    }
+)
+async def create_loan_offers(
+    bulk_data: LoanOfferBulkCreateDTO,
+    use_case: CreateLoanOffersUseCase = Depends(get_create_loan_offers_use_case)
+):
+    """Create many loan offers"""
+    loan_offers = await use_case.execute(bulk_data)
+    return SuccessResponse(
+        data=loan_offers,
+        message=f"{len(loan_offers)} loan offers created successfully"
+    )
+
+
 @router.post(
     "/calculate",
     response_model=SuccessResponse[LoanCalculationResponseDTO],
@@ -65,6 +122,197 @@ async def calculate_loan(
     return SuccessResponse(data=result)
 
 
+@router.post(
+    "/calculate/batch",
+    response_model=SuccessResponse[List[LoanCalculationBatchItemDTO]],
+    summary="Calculate many loans at once",
+    description="Calculate up to 5,000 scenarios in one request. Results keep the request order; invalid items are reported per item.",
+    responses={
+        200: {"description": "Batch calculated (check per-item errors)"},
+        422: {"description": "Invalid batch (empty or too many items)"},
+    }
+)
+async def calculate_loan_batch(
+    batch_data: LoanCalculationBatchDTO,
+    use_case: CalculateLoanBatchUseCase = Depends(get_calculate_loan_batch_use_case)
+):
+    """Batch loan calculation for comparison pages and integrations"""
+    results = await use_case.execute(batch_data.items)
+    return SuccessResponse(data=results)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches the ETag
+    
+    The header is "*" or a comma-separated list of tags; weak tags
+    (W/"...") match their strong form (weak comparison, RFC 9110).
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+@router.get(
+    "/calculate/grid",
+    response_model=SuccessResponse[LoanPaymentGridResponseDTO],
+    summary="Calculate a rate x term payment grid",
+    description="Monthly payments for a fixed amount across a range of rates and terms (max 10,000 cells), "
+                "as axis arrays plus a flat row-major payment matrix. Supports ETag / If-None-Match.",
+    responses={
+        200: {"description": "Grid calculated"},
+        304: {"description": "Grid unchanged (ETag matched)"},
+        422: {"description": "Invalid parameters"},
+    }
+)
+async def calculate_payment_grid(
+    request: Request,
+    response: Response,
+    grid_data: Annotated[LoanPaymentGridDTO, Query()],
+    use_case: CalculatePaymentGridUseCase = Depends(get_calculate_payment_grid_use_case)
+):
+    """Payment heatmap for the calculator page"""
+    # The grid is a pure function of its (normalized) parameters
+    fingerprint = "|".join(
+        [settings.VERSION] + [str(value) for value in grid_data.model_dump().values()]
+    )
+    etag = f'"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    result = await use_case.execute(grid_data)
+    response.headers.update(cache_headers)
+    return SuccessResponse(data=result)
+
+
+@router.post(
+    "/calculate/max-principal",
+    response_model=SuccessResponse[LoanSolutionResponseDTO],
+    summary="Calculate affordable loan amount",
+    description="Largest loan amount whose monthly payment does not exceed the given payment.",
+    responses={
+        200: {"description": "Calculation successful"},
+        400: {"description": "No loan fits the payment"},
+        422: {"description": "Invalid parameters"},
+    }
+)
+async def calculate_max_principal(
+    calculation_data: MaxPrincipalCalculationDTO,
+    use_case: CalculateMaxPrincipalUseCase = Depends(get_calculate_max_principal_use_case)
+):
+    """How much can the customer borrow at a given monthly payment"""
+    result = await use_case.execute(calculation_data)
+    return SuccessResponse(data=result)
+
+
+@router.post(
+    "/calculate/min-term",
+    response_model=SuccessResponse[LoanSolutionResponseDTO],
+    summary="Calculate required loan term",
+    description="Shortest term (max 360 months) whose monthly payment does not exceed the given payment.",
+    responses={
+        200: {"description": "Calculation successful"},
+        400: {"description": "Payment too low to repay within 360 months"},
+        422: {"description": "Invalid parameters"},
+    }
+)
+async def calculate_min_term(
+    calculation_data: MinTermCalculationDTO,
+    use_case: CalculateMinTermUseCase = Depends(get_calculate_min_term_use_case)
+):
+    """How long does it take to repay at a given monthly payment"""
+    result = await use_case.execute(calculation_data)
+    return SuccessResponse(data=result)
+
+
+@router.post(
+    "/calculate/implied-rate",
+    response_model=SuccessResponse[LoanSolutionResponseDTO],
+    summary="Calculate implied interest rate",
+    description="Highest annual rate (0.01% steps) whose monthly payment does not exceed the given payment.",
+    responses={
+        200: {"description": "Calculation successful"},
+        400: {"description": "Payment too low to repay the principal"},
+        422: {"description": "Invalid parameters"},
+    }
+)
+async def calculate_implied_rate(
+    calculation_data: ImpliedRateCalculationDTO,
+    use_case: CalculateImpliedRateUseCase = Depends(get_calculate_implied_rate_use_case)
+):
+    """Which rate makes a given monthly payment work"""
+    result = await use_case.execute(calculation_data)
+    return SuccessResponse(data=result)
+
+
+@router.post(
+    "/calculate/schedule",
+    summary="Stream an amortization schedule",
+    description="Stream the month-by-month schedule of an ad-hoc calculation as NDJSON or CSV (chunked).",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "Schedule rows", "content": {"application/x-ndjson": {}, "text/csv": {}}},
+        422: {"description": "Invalid parameters"},
+    }
+)
+async def calculate_loan_schedule(
+    calculation_data: LoanCalculationDTO,
+    format: ScheduleFormat = Query("ndjson", description="ndjson or csv"),
+    use_case: CalculateLoanScheduleUseCase = Depends(get_calculate_loan_schedule_use_case)
+):
+    """Ad-hoc amortization schedule"""
+    periods = await use_case.execute(calculation_data)
+    return schedule_response(periods, format, "schedule")
+
+
+@router.post(
+    "/schedules",
+    summary="Stream schedules of many loan offers",
+    description="Stream the schedules of up to 1,000 offers as NDJSON or CSV rows prefixed with offer_id. Intended for reporting.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "Schedule rows", "content": {"application/x-ndjson": {}, "text/csv": {}}},
+        404: {"description": "Loan offer not found"},
+    }
+)
+async def get_loan_offer_schedules(
+    batch_data: LoanOfferScheduleBatchDTO,
+    format: ScheduleFormat = Query("ndjson", description="ndjson or csv"),
+    use_case: GetLoanOfferSchedulesUseCase = Depends(get_loan_offer_schedules_use_case)
+):
+    """Schedules for reporting"""
+    rows = await use_case.execute(batch_data.offer_ids)
+    return offer_schedules_response(rows, format, "schedules")
+
+
+@router.get(
+    "/{offer_id}/schedule",
+    summary="Stream a loan offer's amortization schedule",
+    description="Stream the month-by-month schedule of a loan offer as NDJSON or CSV (chunked).",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "Schedule rows", "content": {"application/x-ndjson": {}, "text/csv": {}}},
+        404: {"description": "Loan offer not found"},
+    }
+)
+async def get_loan_offer_schedule(
+    offer_id: int,
+    format: ScheduleFormat = Query("ndjson", description="ndjson or csv"),
+    use_case: GetLoanOfferScheduleUseCase = Depends(get_loan_offer_schedule_use_case)
+):
+    """Amortization schedule of a persisted offer"""
+    periods = await use_case.execute(offer_id)
+    return schedule_response(periods, format, f"loan-offer-{offer_id}-schedule")
+
+
 @router.get(
     "/customer/{customer_id}",
     response_model=PaginatedResponse[LoanOfferResponseDTO],
@@ -79,18 +327,21 @@ async def get_customer_loan_offers(
     customer_id: int,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    count: Optional[CountMode] = Query(None, description="Total count mode: exact, estimated, cached or none (total is null)"),
     use_case: ListCustomerLoanOffersUseCase = Depends(get_list_customer_loan_offers_use_case)
 ):
     """
     Get all loan offers for a customer
     
     """
-    offers, total_count = await use_case.execute(customer_id, skip, limit)
+    page = await use_case.execute(customer_id, skip, limit, cursor, count)
     
     return PaginatedResponse(
-        data=offers,
-        total=total_count,
-        skip=skip,
+        data=page.items,
+        total=page.total,
+        skip=skip if cursor is None else 0,
         limit=limit,
-        has_more=(skip + limit) < total_count
+        has_more=page.has_more,
+        next_cursor=page.next_cursor
     )
\ No newline at end of file
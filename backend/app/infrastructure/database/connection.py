@@ -1,3 +1,6 @@
+import asyncio
+
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -5,18 +8,104 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from itertools import cycle
+from pathlib import Path
+from typing import AsyncGenerator, Dict, Iterator, List
+from ...application.interfaces.unit_of_work import TransactionMode
 from ...config import settings
+from .pool import pool_options
 
 Base = declarative_base()
 
+# backend/alembic
+ALEMBIC_DIR = Path(__file__).resolve().parents[3] / "alembic"
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,  # Log SQL in debug mode
+        **pool_options(),
+    )
+
+
+async def _check_liveness(engine: AsyncEngine) -> None:
+    """
+    Ping the database once over an idle pooled connection
+    
+    A disconnect found by the ping invalidates every pooled connection.
+    When the database can't be reached at all, the pool is disposed so
+    that no stale connection is handed out once it is back.
+    
+    A pool without idle connections is skipped: its connections are in
+    use, and waiting for one (or opening an extra one) would report
+    pool starvation as a database failure.
+    """
+    pool = engine.pool
+    if pool.checkedout() and not pool.checkedin():
+        pool.stats.liveness_skips += 1
+        return
+    
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+    except exc.TimeoutError:
+        # Checkout timed out: the pool is busy, not the database down
+        pool.stats.liveness_skips += 1
+    except (exc.DBAPIError, OSError) as error:
+        print(f"Database liveness check failed ({engine.url.host}): {error}")
+        if isinstance(error, OSError) or error.connection_invalidated:
+            pool.stats.liveness_failures += 1
+            await engine.dispose()
+
+
+# Connection options per mode, reset when a connection returns to the pool
+_MODE_OPTIONS = {
+    TransactionMode.READ_WRITE: {},
+    # No BEGIN/ROLLBACK round trips
+    TransactionMode.READ_ONLY: {"isolation_level": "AUTOCOMMIT"},
+    # One snapshot for all queries; unlike SERIALIZABLE, allowed on hot
+    # standby replicas
+    TransactionMode.SNAPSHOT: {
+        "isolation_level": "REPEATABLE READ",
+        "postgresql_readonly": True,
+    },
+}
+
+
+def _create_sessionmaker(
+    engine: AsyncEngine,
+    mode: TransactionMode = TransactionMode.READ_WRITE
+) -> async_sessionmaker[AsyncSession]:
+    options = _MODE_OPTIONS[mode]
+    return async_sessionmaker(
+        # Shares the engine's pool
+        engine.execution_options(**options) if options else engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
 
 class DatabaseConnection:
     """
     Database connection manager
+    
+    Writes go to the primary (DATABASE_URL). Reads can be spread over
+    read replicas (DATABASE_READ_REPLICA_URLS), one engine per replica;
+    without replicas they use the primary as well.
     """
     _engine: AsyncEngine | None = None
-    _sessionmaker: async_sessionmaker[AsyncSession] | None = None
+    _sessionmakers: Dict[TransactionMode, async_sessionmaker[AsyncSession]] = {}
+    _replica_engines: List[AsyncEngine] | None = None
+    _replica_sessionmakers: Dict[
+        TransactionMode, Iterator[async_sessionmaker[AsyncSession]]
+    ] = {}
+    _liveness_task: asyncio.Task | None = None
     
     @classmethod
     def get_engine(cls) -> AsyncEngine:
@@ -24,32 +113,87 @@ class DatabaseConnection:
         Get or create database engine
         """
         if cls._engine is None:
-            cls._engine = create_async_engine(
-                settings.DATABASE_URL,
-                echo=settings.DEBUG,  # Log SQL in debug mode
-                pool_pre_ping=True,   # Verify connections
-                pool_size=10,         # Base connection pool
-                max_overflow=20,      # Additional connections
-                pool_recycle=3600,    # Recycle after 1 hour
-            )
+            cls._engine = _create_engine(settings.DATABASE_URL)
         return cls._engine
     
     @classmethod
-    def get_sessionmaker(cls) -> async_sessionmaker[AsyncSession]:
+    def get_sessionmaker(
+        cls,
+        mode: TransactionMode = TransactionMode.READ_WRITE
+    ) -> async_sessionmaker[AsyncSession]:
         """
-        Get or create session factory
+        Get or create session factory for the primary
 
         """
-        if cls._sessionmaker is None:
-            engine = cls.get_engine()
-            cls._sessionmaker = async_sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autocommit=False,
-                autoflush=False,
+        if mode not in cls._sessionmakers:
+            cls._sessionmakers[mode] = _create_sessionmaker(cls.get_engine(), mode)
+        return cls._sessionmakers[mode]
+    
+    @classmethod
+    def get_replica_engines(cls) -> List[AsyncEngine]:
+        """
+        Get or create read replica engines (empty without replicas)
+        """
+        if cls._replica_engines is None:
+            cls._replica_engines = [
+                _create_engine(url) for url in settings.DATABASE_READ_REPLICA_URLS
+            ]
+        return cls._replica_engines
+    
+    @classmethod
+    def get_read_sessionmaker(
+        cls,
+        mode: TransactionMode = TransactionMode.READ_ONLY
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Get a session factory for read-only work
+        
+        Replicas are picked round-robin; the primary is used when
+        none are configured. Replicas lag behind the primary, so
+        callers that must see their own writes use get_sessionmaker.
+        """
+        if mode not in cls._replica_sessionmakers:
+            engines = cls.get_replica_engines()
+            if not engines:
+                return cls.get_sessionmaker(mode)
+            cls._replica_sessionmakers[mode] = cycle(
+                [_create_sessionmaker(engine, mode) for engine in engines]
             )
-        return cls._sessionmaker
+        return next(cls._replica_sessionmakers[mode])
+    
+    @classmethod
+    def _engines(cls) -> List[AsyncEngine]:
+        """Engines created so far (primary first)"""
+        return ([cls._engine] if cls._engine else []) + (cls._replica_engines or [])
+    
+    @classmethod
+    def start_liveness_checks(cls, interval: float) -> None:
+        """
+        Ping every database in the background every interval seconds
+        
+        Replaces pre-ping on checkout: dead connections are found
+        between requests instead of costing each request a round trip.
+        """
+        if interval <= 0 or cls._liveness_task is not None:
+            return
+        
+        async def run():
+            while True:
+                await asyncio.sleep(interval)
+                for engine in cls._engines():
+                    await _check_liveness(engine)
+        
+        cls._liveness_task = asyncio.create_task(run())
+    
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """
+        Pool gauges of this worker (only for engines in use)
+        """
+        return {
+            "primary": cls._engine.pool.snapshot() if cls._engine else None,
+            "replicas": [engine.pool.snapshot() for engine in cls._replica_engines or []],
+        }
     
     @classmethod
     async def close(cls):
@@ -58,10 +202,18 @@ class DatabaseConnection:
         
         Called during application shutdown
         """
+        if cls._liveness_task is not None:
+            cls._liveness_task.cancel()
+            cls._liveness_task = None
         if cls._engine:
             await cls._engine.dispose()
             cls._engine = None
-            cls._sessionmaker = None
+        cls._sessionmakers = {}
+        if cls._replica_engines:
+            for engine in cls._replica_engines:
+                await engine.dispose()
+        cls._replica_engines = None
+        cls._replica_sessionmakers = {}
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -76,17 +228,35 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _migrations_head() -> str:
+    """Latest Alembic revision shipped with the code"""
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
 async def init_db():
     """
-    Initialize database (create tables)
+    Initialize database (verify the schema revision)
+    
+    The schema is owned by the Alembic migrations (alembic upgrade head
+    runs before the app starts); tables are not created from the models.
+    
+    Raises:
+        RuntimeError: If the database is not at the latest revision
     """
     engine = DatabaseConnection.get_engine()
-    async with engine.begin() as conn:
-        # Import models to register them
-        from .models import CustomerModel, LoanOfferModel
-        
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
+    async with engine.connect() as conn:
+        current = await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+        )
+    
+    head = _migrations_head()
+    if current != head:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, expected {head}. "
+            "Run 'alembic upgrade head'."
+        )
 
 
 async def drop_db():
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List
@@ -34,12 +34,11 @@ class CustomerModel(Base):
         comment="Customer's last name"
     )
     
+    # Stored normalized (see Email); unique via uq_customers_email_lower
     email: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
-        index=True,
         nullable=False,
-        comment="Customer's email address (unique)"
+        comment="Customer's email address (unique, case-insensitive)"
     )
     
     phone: Mapped[str | None] = mapped_column(
@@ -74,8 +73,29 @@ class CustomerModel(Base):
         "LoanOfferModel",
         back_populates="customer",
         cascade="all, delete-orphan",
-        lazy="selectin"  # Eager loading to prevent N+1
+        # Offers are deleted by the database (ON DELETE CASCADE),
+        # the ORM never loads them just to delete them
+        passive_deletes=True,
+        # Never loaded implicitly: queries that need the offers
+        # request them with a loader option (selectinload)
+        lazy="raise_on_sql"
     )
     
     def __repr__(self) -> str:
-        return f"<CustomerModel(id={self.id}, email='{self.email}')>"
\ No newline at end of file
+        return f"<CustomerModel(id={self.id}, email='{self.email}')>"
+
+
+# Case-insensitive uniqueness; also serves email lookups and
+# ON CONFLICT (lower(email))
+Index(
+    "uq_customers_email_lower",
+    func.lower(CustomerModel.email),
+    unique=True
+)
+
+# Listing order (created_at DESC, id DESC), offset and keyset pages
+Index(
+    "ix_customers_created_at_id",
+    CustomerModel.created_at.desc(),
+    CustomerModel.id.desc()
+)
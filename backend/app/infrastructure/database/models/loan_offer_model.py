@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Numeric, Integer, DateTime
+from sqlalchemy import ForeignKey, Numeric, Integer, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from decimal import Decimal
@@ -24,7 +24,6 @@ class LoanOfferModel(Base):
     customer_id: Mapped[int] = mapped_column(
         ForeignKey("customers.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to customer"
     )
     
@@ -81,4 +80,14 @@ class LoanOfferModel(Base):
     )
     
     def __repr__(self) -> str:
-        return f"<LoanOfferModel(id={self.id}, customer_id={self.customer_id}, amount={self.loan_amount})>"
\ No newline at end of file
+        return f"<LoanOfferModel(id={self.id}, customer_id={self.customer_id}, amount={self.loan_amount})>"
+
+
+# A customer's offers in listing order; also serves customer_id
+# lookups and the ON DELETE CASCADE from customers
+Index(
+    "ix_loan_offers_customer_id_created_at_id",
+    LoanOfferModel.customer_id,
+    LoanOfferModel.created_at.desc(),
+    LoanOfferModel.id.desc()
+)
@@ -0,0 +1,109 @@
+"""
+Connection pool with checkout metrics
+
+Pool gauges tell pool starvation apart from slow queries: requests
+waiting on a full pool show up as checkout wait time and timeouts,
+while slow queries only keep connections checked out for longer.
+"""
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ...config import settings
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters of one pool since it was created
+    """
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    liveness_failures: int = 0
+    # Pings skipped because every connection was in use
+    liveness_skips: int = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long checkouts wait
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            self.stats.record_wait(time.perf_counter() - started)
+            raise
+        self.stats.checkouts += 1
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "MeteredQueuePool":
+        # Keep counting across engine.dispose()
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def snapshot(self) -> dict:
+        """Current gauges and counters"""
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.stats.checkouts,
+            "timeouts": self.stats.timeouts,
+            "wait_seconds_total": round(self.stats.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.stats.wait_seconds_max, 6),
+            "liveness_failures": self.stats.liveness_failures,
+            "liveness_skips": self.stats.liveness_skips,
+        }
+
+
+def _per_worker(total: int) -> int:
+    """
+    Share of a server-wide connection budget for this worker
+
+    Rounded down, so the workers together stay within the budget, but
+    at least one (a budget smaller than the worker count is exceeded).
+    Zero and negative values keep their SQLAlchemy meaning (pool_size=0,
+    max_overflow=-1: no limit) and are not divided.
+    """
+    if total <= 0:
+        return total
+    workers = max(settings.WEB_CONCURRENCY, 1)
+    return max(total // workers, 1)
+
+
+def pool_options() -> dict:
+    """
+    Engine pool arguments from Settings
+
+    DB_POOL_SIZE and DB_MAX_OVERFLOW are budgets for the whole server;
+    each of the WEB_CONCURRENCY uvicorn workers gets its share
+    (DB_POOL_SIZE=0 / DB_MAX_OVERFLOW=-1 mean no limit).
+    """
+    return {
+        "poolclass": MeteredQueuePool,
+        "pool_size": _per_worker(settings.DB_POOL_SIZE),
+        "max_overflow": _per_worker(settings.DB_MAX_OVERFLOW),
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
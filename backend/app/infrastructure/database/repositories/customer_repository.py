@@ -1,15 +1,41 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy import select, update, delete, func, tuple_, text, true, any_, bindparam, literal_column, Integer
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from typing import List, Optional, Set, Tuple
 
 from ....application.interfaces.repositories import ICustomerRepository
 from ....application.dtos.customer_dto import CustomerCreateDTO, CustomerUpdateDTO
+from ....application.exceptions import CustomerAlreadyExistsError
 from ....domain.entities.customer import Customer
 from ....domain.value_objects.email import Email
 from ..models.customer_model import CustomerModel
 from datetime import datetime
 
+# Columns mapped by _to_domain. Reads select only these: no ORM
+# instances, identity map or relationship loading for plain lookups.
+_CUSTOMER_COLUMNS = (
+    CustomerModel.id,
+    CustomerModel.first_name,
+    CustomerModel.last_name,
+    CustomerModel.email,
+    CustomerModel.phone,
+    CustomerModel.address,
+    CustomerModel.created_at,
+    CustomerModel.updated_at,
+)
+
+# PostgreSQL SQLSTATE of a unique index violation
+UNIQUE_VIOLATION = "23505"
+
+# Matches the unique index uq_customers_email_lower
+_EMAIL_KEY = func.lower(CustomerModel.email)
+
+
+def _normalize_email(email: str) -> str:
+    """Emails are stored the way the Email value object normalizes them"""
+    return Email(email).value
+
 
 class CustomerRepository(ICustomerRepository):
     """
@@ -23,7 +49,8 @@ class CustomerRepository(ICustomerRepository):
     
     def _to_domain(self, model: CustomerModel) -> Customer:
         """
-        Map ORM model to domain entity
+        Map ORM model (or a projected row of _CUSTOMER_COLUMNS)
+        to domain entity
         """
         return Customer(
             id=model.id,
@@ -40,65 +67,220 @@ class CustomerRepository(ICustomerRepository):
         """
         Create customer from DTO
         """
-        # Create ORM model from DTO
-        model = CustomerModel(
-            first_name=customer_data.first_name,
-            last_name=customer_data.last_name,
-            email=customer_data.email,  
-            phone=customer_data.phone,
-            address=customer_data.address,
-        )        
-        # Add to session
-        self.session.add(model)
-        
-        # Flush to get ID (without committing transaction)
-        await self.session.flush()
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING: the unique index
+        # decides about duplicates, no row back means the email is taken
+        stmt = (
+            pg_insert(CustomerModel)
+            .values(
+                first_name=customer_data.first_name,
+                last_name=customer_data.last_name,
+                email=_normalize_email(customer_data.email),
+                phone=customer_data.phone,
+                address=customer_data.address,
+            )
+            .on_conflict_do_nothing(index_elements=[_EMAIL_KEY])
+            .returning(*_CUSTOMER_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
         
-        # Refresh to get all database-generated values
-        await self.session.refresh(model)
+        if row is None:
+            raise CustomerAlreadyExistsError(
+                f"Customer with email {customer_data.email} already exists"
+            )
         
         # Map to domain entity
-        return self._to_domain(model)
+        return self._to_domain(row)
+    
+    async def upsert(self, customer_data: CustomerCreateDTO) -> Tuple[Customer, bool]:
+        """
+        Create or merge customer by email
+        
+        INSERT ... ON CONFLICT (lower(email)) DO UPDATE overwrites the fields
+        the caller provided; xmax = 0 only for a freshly inserted row.
+        """
+        values = customer_data.model_dump(
+            include={"first_name", "last_name", "email"} | customer_data.model_fields_set
+        )
+        values["email"] = _normalize_email(values["email"])
+        stmt = pg_insert(CustomerModel).values(**values)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[_EMAIL_KEY],
+                set_={
+                    **{
+                        name: stmt.excluded[name]
+                        for name in values
+                        if name != "email"
+                    },
+                    "updated_at": datetime.utcnow(),
+                }
+            )
+            .returning(
+                *_CUSTOMER_COLUMNS,
+                (literal_column("xmax") == 0).label("created")
+            )
+        )
+        result = await self.session.execute(stmt)
+        row = result.one()
+        
+        return self._to_domain(row), row.created
+    
+    async def create_many(self, customers: List[CustomerCreateDTO]) -> List[Customer]:
+        """
+        Create customers with one multi-row INSERT
+        
+        ON CONFLICT (lower(email)) DO NOTHING skips existing emails; only
+        inserted rows are returned.
+        """
+        if not customers:
+            return []
+        
+        stmt = (
+            pg_insert(CustomerModel)
+            .values([
+                dict(
+                    first_name=c.first_name,
+                    last_name=c.last_name,
+                    email=_normalize_email(c.email),
+                    phone=c.phone,
+                    address=c.address,
+                )
+                for c in customers
+            ])
+            .on_conflict_do_nothing(index_elements=[_EMAIL_KEY])
+            .returning(*_CUSTOMER_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        
+        return [self._to_domain(row) for row in result.all()]
     
     async def get_by_id(self, customer_id: int) -> Optional[Customer]:
         """
         Get customer by ID
         """
-        # Build query
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id)
+        # Build query (customer columns only)
+        stmt = select(*_CUSTOMER_COLUMNS).where(CustomerModel.id == customer_id)
         
         # Execute query
         result = await self.session.execute(stmt)
         
         # Get result
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
         # Map to domain if found
-        return self._to_domain(model) if model else None
+        return self._to_domain(row) if row else None
+    
+    async def get_existing_ids(self, customer_ids: List[int]) -> Set[int]:
+        """
+        Get which of the given customer IDs exist
+        
+        id = ANY(:customer_ids) binds the IDs as one array parameter,
+        so the statement is the same for any number of IDs.
+        """
+        stmt = select(CustomerModel.id).where(
+            CustomerModel.id == any_(
+                bindparam("customer_ids", list(customer_ids), type_=ARRAY(Integer))
+            )
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
     
     async def get_by_email(self, email: str) -> Optional[Customer]:
         """Get customer by email"""
-        stmt = select(CustomerModel).where(CustomerModel.email == email)
+        stmt = select(*_CUSTOMER_COLUMNS).where(_EMAIL_KEY == _normalize_email(email))
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_domain(model) if model else None
+        row = result.one_or_none()
+        return self._to_domain(row) if row else None
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Customer]:
         """
         Get all customers with pagination
         """
         stmt = (
-            select(CustomerModel)
-            .order_by(CustomerModel.created_at.desc())
+            select(*_CUSTOMER_COLUMNS)
+            .order_by(CustomerModel.created_at.desc(), CustomerModel.id.desc())
             .offset(skip)
             .limit(limit)
         )
         
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        rows = result.all()
         
         # Map all to domain entities
-        return [self._to_domain(model) for model in models]
+        return [self._to_domain(row) for row in rows]
+    
+    async def get_all_after(
+        self,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 100
+    ) -> List[Customer]:
+        """
+        Get customers after a (created_at, id) position
+        """
+        stmt = (
+            select(*_CUSTOMER_COLUMNS)
+            .order_by(CustomerModel.created_at.desc(), CustomerModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            # Row comparison: seeks directly to the position, no OFFSET scan
+            stmt = stmt.where(
+                tuple_(CustomerModel.created_at, CustomerModel.id) < tuple_(*after)
+            )
+        
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        
+        return [self._to_domain(row) for row in rows]
+    
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_count: bool = True
+    ) -> Tuple[List[Customer], Optional[int]]:
+        """
+        Get one page of customers and the total count in one query
+        
+        The page is LEFT JOINed to a one-row count subquery, so the
+        total is returned even when the page itself is empty.
+        """
+        page = (
+            select(*_CUSTOMER_COLUMNS)
+            .order_by(CustomerModel.created_at.desc(), CustomerModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            page = page.where(
+                tuple_(CustomerModel.created_at, CustomerModel.id) < tuple_(*after)
+            )
+        else:
+            page = page.offset(skip)
+        
+        if not with_count:
+            result = await self.session.execute(page)
+            return [self._to_domain(row) for row in result.all()], None
+        
+        page_subquery = page.subquery()
+        total_subquery = (
+            select(func.count().label("total"))
+            .select_from(CustomerModel)
+            .subquery()
+        )
+        stmt = (
+            select(total_subquery.c.total, *page_subquery.c)
+            .select_from(total_subquery)
+            .outerjoin(page_subquery, true())
+            .order_by(page_subquery.c.created_at.desc(), page_subquery.c.id.desc())
+        )
+        
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        
+        total = rows[0].total
+        return [self._to_domain(row) for row in rows if row.id is not None], total
     
     async def get_all_count(self) -> int:
         """
@@ -108,6 +290,29 @@ class CustomerRepository(ICustomerRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one()
     
+    async def get_all_count_estimate(self) -> int:
+        """
+        Approximate customer count from pg_class.reltuples
+        
+        reltuples is maintained by VACUUM/ANALYZE; it is -1 (PostgreSQL 14+)
+        or 0 before the table was ever analyzed, then the exact count is used.
+        """
+        if self.session.bind.dialect.name != "postgresql":
+            return await self.get_all_count()
+        
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        )
+        result = await self.session.execute(
+            stmt,
+            {"table_name": CustomerModel.__tablename__}
+        )
+        estimate = result.scalar()
+        if estimate is None or estimate <= 0:
+            return await self.get_all_count()
+        return estimate
+    
     async def update(
         self,
         customer_id: int,
@@ -117,49 +322,73 @@ class CustomerRepository(ICustomerRepository):
         Update customer
 
         """
-        # Get existing customer
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        if not model:
-            return None
-        
         # Update only provided fields
         update_data = customer_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(model, field, value)
+        if update_data.get("email") is not None:
+            update_data["email"] = _normalize_email(update_data["email"])
         
         # Update timestamp
-        model.updated_at = datetime.utcnow()
+        update_data["updated_at"] = datetime.utcnow()
         
-        # Flush changes
-        await self.session.flush()
-        await self.session.refresh(model)
+        # UPDATE ... RETURNING: no row means the customer doesn't exist
+        stmt = (
+            update(CustomerModel)
+            .where(CustomerModel.id == customer_id)
+            .values(**update_data)
+            .returning(*_CUSTOMER_COLUMNS)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            # The unique email index rejects a taken email
+            if getattr(e.orig, "sqlstate", None) == UNIQUE_VIOLATION:
+                raise CustomerAlreadyExistsError(
+                    f"Customer with email {customer_data.email} already exists"
+                ) from e
+            raise
+        row = result.one_or_none()
         
-        return self._to_domain(model)
+        return self._to_domain(row) if row else None
     
     async def delete(self, customer_id: int) -> bool:
         """
         Delete customer
         
         Returns True if deleted, False if not found
+        
+        Loan offers are removed by the database (ON DELETE CASCADE).
         """
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id)
+        stmt = (
+            delete(CustomerModel)
+            .where(CustomerModel.id == customer_id)
+            .returning(CustomerModel.id)
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
         
-        if not model:
-            return False
+        return result.scalar_one_or_none() is not None
+    
+    async def delete_many(self, customer_ids: List[int]) -> List[int]:
+        """
+        Delete customers in one statement
         
-        await self.session.delete(model)
-        await self.session.flush()
+        Returns IDs that were deleted (loan offers cascade in the database)
+        """
+        stmt = (
+            delete(CustomerModel)
+            .where(CustomerModel.id.in_(customer_ids))
+            .returning(CustomerModel.id)
+        )
+        result = await self.session.execute(stmt)
         
-        return True
+        return list(result.scalars().all())
     
     async def exists_by_email(self, email: str) -> bool:
         """Check if customer with email exists"""
-        stmt = select(func.count()).select_from(CustomerModel).where(CustomerModel.email == email)
+        stmt = (
+            select(func.count())
+            .select_from(CustomerModel)
+            .where(_EMAIL_KEY == _normalize_email(email))
+        )
         result = await self.session.execute(stmt)
         count = result.scalar()
         return count > 0
\ No newline at end of file
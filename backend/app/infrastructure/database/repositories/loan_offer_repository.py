@@ -1,13 +1,29 @@
+import json
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import List, Optional
+from sqlalchemy import select, insert, delete, func, tuple_, text, true, null
+from sqlalchemy.orm import aliased
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from ....application.interfaces.repositories import ILoanOfferRepository
 from ....domain.entities.loan_offer import LoanOffer
 from ....domain.value_objects.money import Money
 from ....domain.value_objects.percentage import Percentage
+from ..models.customer_model import CustomerModel
 from ..models.loan_offer_model import LoanOfferModel
 
+# Columns mapped by _to_domain, returned by writes
+_LOAN_OFFER_COLUMNS = (
+    LoanOfferModel.id,
+    LoanOfferModel.customer_id,
+    LoanOfferModel.loan_amount,
+    LoanOfferModel.interest_rate,
+    LoanOfferModel.term_months,
+    LoanOfferModel.monthly_payment,
+    LoanOfferModel.total_payment,
+    LoanOfferModel.total_interest,
+    LoanOfferModel.created_at,
+)
 
 class LoanOfferRepository(ILoanOfferRepository):
     """
@@ -19,26 +35,28 @@ class LoanOfferRepository(ILoanOfferRepository):
     
     def _to_domain(self, model: LoanOfferModel) -> LoanOffer:
         """
-        Map ORM to domain
+        Map ORM (or a row of _LOAN_OFFER_COLUMNS) to domain
+        
+        NUMERIC(12, 2) columns are valid cent amounts, so Money
+        skips re-validation here
         """
         return LoanOffer(
             id=model.id,
             customer_id=model.customer_id,
-            principal=Money(model.loan_amount, 'EUR'),
+            principal=Money.trusted(model.loan_amount, 'EUR'),
             interest_rate=Percentage(model.interest_rate),
             term_months=model.term_months,
-            monthly_payment=Money(model.monthly_payment, 'EUR'),
-            total_payment=Money(model.total_payment, 'EUR'),
-            total_interest=Money(model.total_interest, 'EUR'),
+            monthly_payment=Money.trusted(model.monthly_payment, 'EUR'),
+            total_payment=Money.trusted(model.total_payment, 'EUR'),
+            total_interest=Money.trusted(model.total_interest, 'EUR'),
             created_at=model.created_at
         )
     
-    def _to_model(self, entity: LoanOffer) -> LoanOfferModel:
+    def _to_values(self, entity: LoanOffer) -> dict:
         """
-        Map domain to ORM
+        Map domain to column values (ID is generated by the database)
         """
-        return LoanOfferModel(
-            id=entity.id,
+        return dict(
             customer_id=entity.customer_id,
             loan_amount=entity.principal.amount,
             interest_rate=entity.interest_rate.value,
@@ -53,18 +71,37 @@ class LoanOfferRepository(ILoanOfferRepository):
         """
         Create loan offer from domain entity
         """
-        # Convert domain entity to ORM model
-        model = self._to_model(loan_offer)
+        # INSERT ... RETURNING: one round trip, the row comes back with its ID
+        stmt = (
+            insert(LoanOfferModel)
+            .values(**self._to_values(loan_offer))
+            .returning(*_LOAN_OFFER_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
         
-        # Add to session
-        self.session.add(model)
+        # Return domain entity with ID
+        return self._to_domain(result.one())
+    
+    async def create_many(self, loan_offers: List[LoanOffer]) -> List[LoanOffer]:
+        """
+        Create loan offers with multi-row INSERT ... RETURNING
         
-        # Flush to get ID
-        await self.session.flush()
-        await self.session.refresh(model)
+        Rows are sent as multi-row VALUES batches and come back in
+        input order (sort_by_parameter_order).
+        """
+        if not loan_offers:
+            return []
         
-        # Return domain entity with ID
-        return self._to_domain(model)
+        stmt = insert(LoanOfferModel).returning(
+            *_LOAN_OFFER_COLUMNS,
+            sort_by_parameter_order=True
+        )
+        result = await self.session.execute(
+            stmt,
+            [self._to_values(offer) for offer in loan_offers]
+        )
+        
+        return [self._to_domain(row) for row in result.all()]
     
     async def get_by_id(self, offer_id: int) -> Optional[LoanOffer]:
         """Get loan offer by ID"""
@@ -73,6 +110,13 @@ class LoanOfferRepository(ILoanOfferRepository):
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
     
+    async def get_by_ids(self, offer_ids: List[int]) -> List[LoanOffer]:
+        """Get loan offers by IDs in one query"""
+        stmt = select(LoanOfferModel).where(LoanOfferModel.id.in_(offer_ids))
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_domain(model) for model in models]
+    
     async def get_by_customer_id(
         self,
         customer_id: int,
@@ -85,7 +129,7 @@ class LoanOfferRepository(ILoanOfferRepository):
         stmt = (
             select(LoanOfferModel)
             .where(LoanOfferModel.customer_id == customer_id)
-            .order_by(LoanOfferModel.created_at.desc())
+            .order_by(LoanOfferModel.created_at.desc(), LoanOfferModel.id.desc())
             .offset(skip)
             .limit(limit)
         )
@@ -95,6 +139,98 @@ class LoanOfferRepository(ILoanOfferRepository):
         
         return [self._to_domain(model) for model in models]
     
+    async def get_by_customer_id_after(
+        self,
+        customer_id: int,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 100
+    ) -> List[LoanOffer]:
+        """
+        Get loan offers for a customer after a (created_at, id) position
+        """
+        stmt = (
+            select(LoanOfferModel)
+            .where(LoanOfferModel.customer_id == customer_id)
+            .order_by(LoanOfferModel.created_at.desc(), LoanOfferModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(LoanOfferModel.created_at, LoanOfferModel.id) < tuple_(*after)
+            )
+        
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        
+        return [self._to_domain(model) for model in models]
+    
+    async def get_page_by_customer_id(
+        self,
+        customer_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_count: bool = True
+    ) -> Optional[Tuple[List[LoanOffer], Optional[int]]]:
+        """
+        Get one page of a customer's loan offers in one query
+        
+        The customer row anchors the query (with the offer count when
+        requested) and the page is LEFT JOINed to it: no row at all
+        means the customer doesn't exist.
+        """
+        page = (
+            select(LoanOfferModel)
+            .where(LoanOfferModel.customer_id == customer_id)
+            .order_by(LoanOfferModel.created_at.desc(), LoanOfferModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            page = page.where(
+                tuple_(LoanOfferModel.created_at, LoanOfferModel.id) < tuple_(*after)
+            )
+        else:
+            page = page.offset(skip)
+        
+        if with_count:
+            anchor = (
+                select(
+                    CustomerModel.id.label("customer_id"),
+                    func.count(LoanOfferModel.id).label("total")
+                )
+                .outerjoin(LoanOfferModel, LoanOfferModel.customer_id == CustomerModel.id)
+                .where(CustomerModel.id == customer_id)
+                .group_by(CustomerModel.id)
+                .subquery()
+            )
+        else:
+            anchor = (
+                select(
+                    CustomerModel.id.label("customer_id"),
+                    null().label("total")
+                )
+                .where(CustomerModel.id == customer_id)
+                .subquery()
+            )
+        
+        page_subquery = page.subquery()
+        row = aliased(LoanOfferModel, page_subquery)
+        stmt = (
+            select(anchor.c.total, row)
+            .select_from(anchor)
+            .outerjoin(page_subquery, true())
+            .order_by(page_subquery.c.created_at.desc(), page_subquery.c.id.desc())
+        )
+        
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        
+        if not rows:
+            return None
+        
+        total = rows[0].total
+        return [self._to_domain(model) for _, model in rows if model is not None], total
+    
     async def get_by_customer_id_count(self, customer_id: int) -> int:
         """Get count of loan offers for customer"""
         stmt = (
@@ -105,6 +241,26 @@ class LoanOfferRepository(ILoanOfferRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one()
     
+    async def get_by_customer_id_count_estimate(self, customer_id: int) -> int:
+        """
+        Approximate count of a customer's loan offers
+        
+        Uses the planner's row estimate for the filtered query
+        (EXPLAIN, based on column statistics), no rows are read.
+        """
+        if self.session.bind.dialect.name != "postgresql":
+            return await self.get_by_customer_id_count(customer_id)
+        
+        stmt = text(
+            "EXPLAIN (FORMAT JSON) "
+            "SELECT 1 FROM loan_offers WHERE customer_id = :customer_id"
+        )
+        result = await self.session.execute(stmt, {"customer_id": customer_id})
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[LoanOffer]:
         """Get all loan offers with pagination"""
         stmt = (
@@ -121,14 +277,11 @@ class LoanOfferRepository(ILoanOfferRepository):
     
     async def delete(self, offer_id: int) -> bool:
         """Delete loan offer"""
-        stmt = select(LoanOfferModel).where(LoanOfferModel.id == offer_id)
+        stmt = (
+            delete(LoanOfferModel)
+            .where(LoanOfferModel.id == offer_id)
+            .returning(LoanOfferModel.id)
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        if not model:
-            return False
-        
-        await self.session.delete(model)
-        await self.session.flush()
         
-        return True
\ No newline at end of file
+        return result.scalar_one_or_none() is not None
\ No newline at end of file
@@ -1,6 +1,6 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from ...application.interfaces.unit_of_work import IUnitOfWork
+from ...application.interfaces.unit_of_work import IUnitOfWork, TransactionMode
 from ...application.interfaces.repositories import (
     ICustomerRepository,
     ILoanOfferRepository
@@ -12,18 +12,48 @@ from .repositories.loan_offer_repository import LoanOfferRepository
 class UnitOfWork(IUnitOfWork):
     """
     Unit of Work implementation
+
+    The session is opened on first repository access, so requests that
+    fail validation or never reach the database don't use the pool. It
+    is closed again after commit or rollback: the connection is only
+    held while the request talks to the database.
+
+    The mode must match the sessionmaker (DatabaseConnection creates
+    one per mode).
     """
-    
-    def __init__(self, session: AsyncSession):
-        self._session = session
-        
-        self.customers: ICustomerRepository = CustomerRepository(session)
-        self.loan_offers: ILoanOfferRepository = LoanOfferRepository(session)
-    
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        mode: TransactionMode = TransactionMode.READ_WRITE
+    ):
+        self._sessionmaker = sessionmaker
+        self.mode = mode
+        self._session: AsyncSession | None = None
+        self._customers: ICustomerRepository | None = None
+        self._loan_offers: ILoanOfferRepository | None = None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._sessionmaker()
+            self._customers = CustomerRepository(self._session)
+            self._loan_offers = LoanOfferRepository(self._session)
+        return self._session
+
+    @property
+    def customers(self) -> ICustomerRepository:
+        self._get_session()
+        return self._customers
+
+    @property
+    def loan_offers(self) -> ILoanOfferRepository:
+        self._get_session()
+        return self._loan_offers
+
     async def __aenter__(self):
 
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
         Exit async context manager
@@ -31,15 +61,41 @@ class UnitOfWork(IUnitOfWork):
         if exc_type is not None:
             await self.rollback()
         return False
-    
+
     async def commit(self):
         """
-        Commit transaction
+        Commit transaction and release the connection
+        
+        Raises:
+            RuntimeError: If the unit of work is read-only
         """
-        await self._session.commit()
-    
+        if self.mode != TransactionMode.READ_WRITE:
+            raise RuntimeError(f"Can't commit a {self.mode.value} unit of work")
+        if self._session is None:
+            return
+        try:
+            await self._session.commit()
+        finally:
+            await self.close()
+
     async def rollback(self):
         """
-        Rollback transaction
+        Rollback transaction and release the connection
+        """
+        if self._session is None:
+            return
+        try:
+            await self._session.rollback()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """
+        Release the session (rolls back an open transaction)
+
+        Repositories accessed afterwards start a new session.
         """
-        await self._session.rollback()
\ No newline at end of file
+        session, self._session = self._session, None
+        self._customers = self._loan_offers = None
+        if session is not None:
+            await session.close()
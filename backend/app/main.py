@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 from .config import settings
 from .infrastructure.database.connection import init_db, DatabaseConnection
 from .infrastructure.api.v1 import customers, loan_offers
+from .infrastructure.api.read_your_writes import read_your_writes_middleware
 from .infrastructure.api.error_handlers import (
     domain_exception_handler,
     customer_not_found_handler,
@@ -25,6 +26,7 @@ from .application.exceptions import (
     ApplicationException,
 )
 from .domain.exceptions import DomainException
+from .domain.services.loan_calculator import LoanCalculator
 
 
 @asynccontextmanager
@@ -35,13 +37,25 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting Bees & Bears Loan Platform...")
     await init_db()
-    print("Database initialized")
+    print("Database schema up to date")
+    DatabaseConnection.start_liveness_checks(settings.DB_POOL_LIVENESS_INTERVAL)
+    
+    table_loaded = LoanCalculator.load_factor_table(settings.ANNUITY_FACTOR_TABLE_PATH)
+    if table_loaded:
+        print(f"Annuity factor table mapped from {settings.ANNUITY_FACTOR_TABLE_PATH}")
+    
+    LoanCalculator.configure_factor_cache(settings.ANNUITY_FACTOR_CACHE_SIZE)
+    # The table already covers the common grid
+    if settings.ANNUITY_FACTOR_CACHE_WARM_UP and not table_loaded:
+        loaded = LoanCalculator.warm_up_factor_cache()
+        print(f"Annuity factor cache warmed up ({loaded} entries)")
     
     yield
     
     # Shutdown
     print("Shutting down...")
     await DatabaseConnection.close()
+    LoanCalculator.unload_factor_table()
     print("Database connections closed")
 
 
@@ -78,6 +92,9 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Reads of a client that just wrote go to the primary
+app.middleware("http")(read_your_writes_middleware)
+
 # Order matters: specific to general
 app.add_exception_handler(CustomerNotFoundError, customer_not_found_handler)
 app.add_exception_handler(CustomerAlreadyExistsError, customer_exists_handler)
@@ -115,6 +132,17 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """
+    Runtime metrics of this worker process
+    """
+    return {
+        "annuity_factor_cache": LoanCalculator.factor_cache_stats(),
+        "database_pools": DatabaseConnection.pool_stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -66,14 +66,21 @@ class PaginatedResponse(BaseModel, Generic[T]):
         "total": 150,
         "skip": 20,
         "limit": 10,
-        "has_more": true
+        "has_more": true,
+        "next_cursor": "WyIyMDI1LTAxLTE1VDEwOjMwOjAwIiw0Ml0"
     }
+    
+    next_cursor is an opaque keyset cursor for the next page
+    (pass it back as ?cursor=...), null on the last page.
+    total is approximate with ?count=estimated|cached and null
+    with ?count=none.
     """
     data: list[T]
-    total: int
+    total: Optional[int]
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
     
     class Config:
         json_schema_extra = {
@@ -82,6 +89,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
                 "total": 150,
                 "skip": 20,
                 "limit": 10,
-                "has_more": True
+                "has_more": True,
+                "next_cursor": "WyIyMDI1LTAxLTE1VDEwOjMwOjAwIiw0Ml0"
             }
         }
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Benchmark: LoanCalculator.calculate_all_batch vs a loop over calculate_all
+
+Usage (from backend/):
+    python -m benchmarks.loan_calculator_batch --rows 1000000
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from app.domain.services.loan_calculator import LoanCalculator
+from app.domain.value_objects.money import Money
+from app.domain.value_objects.percentage import Percentage
+
+
+def generate_rows(rows: int, seed: int):
+    """Random portfolio within the API limits (amount, rate, term)"""
+    rng = random.Random(seed)
+    principals = [
+        Decimal(rng.randint(100_000, 100_000_000)).scaleb(-2)
+        for _ in range(rows)
+    ]
+    rates = [Decimal(rng.randint(0, 1500)).scaleb(-2) for _ in range(rows)]
+    terms = [rng.choice(range(12, 361, 12)) for _ in range(rows)]
+    return principals, rates, terms
+
+
+def run_scalar(principals, rates, terms):
+    results = []
+    for amount, rate, term in zip(principals, rates, terms):
+        results.append(
+            LoanCalculator.calculate_all(Money(amount), Percentage(rate), term)
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    principals, rates, terms = generate_rows(args.rows, args.seed)
+    print(f"Rows: {args.rows:,}")
+
+    start = time.perf_counter()
+    scalar = run_scalar(principals, rates, terms)
+    scalar_seconds = time.perf_counter() - start
+    print(f"Scalar loop: {scalar_seconds:8.2f}s")
+
+    start = time.perf_counter()
+    batch = LoanCalculator.calculate_all_batch(principals, rates, terms)
+    batch_seconds = time.perf_counter() - start
+    print(f"Batch:       {batch_seconds:8.2f}s")
+    print(f"Speedup:     {scalar_seconds / batch_seconds:8.1f}x")
+
+    # Results must match cent for cent
+    for i, row in enumerate(scalar):
+        for key in ('monthly_payment', 'total_payment', 'total_interest'):
+            if row[key].amount != batch[key][i]:
+                raise SystemExit(
+                    f"Mismatch at row {i} ({key}): "
+                    f"{row[key].amount} != {batch[key][i]}"
+                )
+    print("Results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Build or verify the memory-mapped annuity factor table
+
+Usage (from backend/):
+    python scripts/annuity_factor_table.py build data/annuity_factors.bin
+    python scripts/annuity_factor_table.py verify data/annuity_factors.bin --samples 10000
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.domain.services.annuity_factor_table import build, verify
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Annuity factor table tools")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("path", nargs="?", default="data/annuity_factors.bin")
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=None,
+        help="verify a random sample instead of the full grid"
+    )
+    args = parser.parse_args()
+
+    if args.command == "build":
+        path = build(args.path)
+        print(f"Annuity factor table written to {path}")
+    else:
+        checked = verify(args.path, args.samples)
+        print(f"{checked} factors match the formula")
+
+
+if __name__ == "__main__":
+    main()
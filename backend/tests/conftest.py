@@ -0,0 +1,52 @@
+import asyncio
+import os
+
+# Before the app reads its settings
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("DEBUG", "false")
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.database import Base
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    SQLite database with the model schema
+
+    NullPool: every test step runs in its own event loop, so no
+    connection is reused across loops.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool,
+    )
+
+    async def create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def sessionmaker(engine):
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements sent to the database, in order"""
+    executed = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    return executed
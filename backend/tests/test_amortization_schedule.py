@@ -0,0 +1,91 @@
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from app.domain.services.loan_calculator import LoanCalculator
+from app.domain.value_objects.money import Money
+from app.domain.value_objects.percentage import Percentage
+
+
+def _schedule(amount: str, rate: str, term_months: int):
+    return list(LoanCalculator.amortization_schedule(
+        Money(Decimal(amount), 'EUR'),
+        Percentage(Decimal(rate)),
+        term_months
+    ))
+
+
+def _random_loans(count: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield (
+            str(Decimal(rng.randint(100_000, 100_000_000)).scaleb(-2)),
+            str(Decimal(rng.randint(0, 10_000)).scaleb(-2)),
+            rng.randint(1, 360),
+        )
+
+
+@pytest.mark.parametrize("amount, rate, term_months", list(_random_loans(500, seed=42)))
+def test_totals_equal_calculate_all(amount, rate, term_months):
+    totals = LoanCalculator.calculate_all(
+        Money(Decimal(amount), 'EUR'),
+        Percentage(Decimal(rate)),
+        term_months
+    )
+    rows = _schedule(amount, rate, term_months)
+
+    assert sum(row.payment.amount for row in rows) == totals['total_payment'].amount
+    assert sum(row.interest.amount for row in rows) == totals['total_interest'].amount
+    assert sum(row.principal.amount for row in rows) == Decimal(amount)
+
+
+@pytest.mark.parametrize("amount, rate, term_months", list(_random_loans(500, seed=7)))
+def test_rows_pay_the_balance_down_and_stop_at_zero(amount, rate, term_months):
+    rows = _schedule(amount, rate, term_months)
+
+    assert 1 <= len(rows) <= term_months
+    assert [row.period for row in rows] == list(range(1, len(rows) + 1))
+    for row in rows:
+        assert row.principal.amount >= 0
+        assert row.payment.amount == row.interest.amount + row.principal.amount
+    assert all(row.remaining_balance.amount > 0 for row in rows[:-1])
+    assert rows[-1].remaining_balance.amount == 0
+
+
+@pytest.mark.parametrize("amount, rate, term_months", [
+    loan for loan in _random_loans(500, seed=3) if Decimal(loan[1]) != 0
+])
+def test_interest_follows_the_remaining_balance(amount, rate, term_months):
+    monthly_rate = Percentage(Decimal(rate)).to_monthly_rate()
+    balance = Decimal(amount)
+
+    for row in _schedule(amount, rate, term_months):
+        expected = (balance * monthly_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        assert abs(row.interest.amount - expected) <= Decimal("0.02")
+        assert row.interest.amount >= 0
+        balance = row.remaining_balance.amount
+
+
+@pytest.mark.parametrize("amount, term_months", [
+    ("10000", 360), ("1234.56", 7), ("999999.99", 1), ("100", 3), ("200", 3),
+])
+def test_zero_rate_books_only_the_rounding_remainder_as_interest(amount, term_months):
+    totals = LoanCalculator.calculate_all(
+        Money(Decimal(amount), 'EUR'),
+        Percentage(Decimal("0")),
+        term_months
+    )
+    *rows, last = _schedule(amount, "0", term_months)
+
+    assert all(row.interest.amount == 0 for row in rows)
+    assert last.interest.amount == totals['total_interest'].amount
+
+
+def test_payment_that_clears_the_balance_early_ends_the_schedule():
+    # 0.02 / 3 rounds up to 0.01, so the balance is paid off after two periods
+    rows = _schedule("0.02", "0", 3)
+
+    assert [row.principal.amount for row in rows] == [Decimal("0.01"), Decimal("0.01")]
+    assert [row.payment.amount for row in rows] == [Decimal("0.01"), Decimal("0.02")]
+    assert rows[-1].remaining_balance.amount == 0
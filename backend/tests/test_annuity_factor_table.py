@@ -0,0 +1,108 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.services import annuity_factor_table
+from app.domain.services.annuity_factor_table import AnnuityFactorTable, build, verify
+from app.domain.services.loan_calculator import LoanCalculator
+from app.domain.value_objects.money import Money
+from app.domain.value_objects.percentage import Percentage
+
+# Small grid: 0.01 - 3.00% x 1 - 36 months
+RATE_STEPS = 300
+MAX_TERM_MONTHS = 36
+
+
+@pytest.fixture
+def table_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(annuity_factor_table, "RATE_STEPS", RATE_STEPS)
+    monkeypatch.setattr(annuity_factor_table, "MAX_TERM_MONTHS", MAX_TERM_MONTHS)
+    return build(tmp_path / "annuity_factors.bin")
+
+
+@pytest.fixture
+def loaded_table(table_path):
+    assert LoanCalculator.load_factor_table(str(table_path))
+    # Nothing may be answered from factors cached by other tests
+    LoanCalculator.configure_factor_cache(LoanCalculator._factor_cache.maxsize)
+    yield table_path
+    LoanCalculator.unload_factor_table()
+    LoanCalculator.configure_factor_cache(LoanCalculator._factor_cache.maxsize)
+
+
+def _grid():
+    for rate_index in range(1, RATE_STEPS + 1):
+        for term in range(1, MAX_TERM_MONTHS + 1):
+            yield Percentage(Decimal(rate_index).scaleb(-2)), term
+
+
+def test_every_lookup_equals_the_formula(loaded_table):
+    for rate, term in _grid():
+        expected = LoanCalculator._compute_annuity_factor(rate, term)
+        actual = LoanCalculator.annuity_factor(rate, term)
+
+        # Same value and same digits (exponent), not just numerically equal
+        assert actual.as_tuple() == expected.as_tuple(), (rate, term)
+
+    assert LoanCalculator.factor_cache_stats()['misses'] == 0
+
+
+def test_payments_match_with_and_without_the_table(table_path):
+    principal = Money(Decimal("123456.78"), 'EUR')
+    loans = [(rate, term) for rate, term in _grid() if term % 6 == 0]
+
+    without_table = [
+        LoanCalculator.calculate_monthly_payment(principal, rate, term) for rate, term in loans
+    ]
+    LoanCalculator.load_factor_table(str(table_path))
+    try:
+        with_table = [
+            LoanCalculator.calculate_monthly_payment(principal, rate, term) for rate, term in loans
+        ]
+    finally:
+        LoanCalculator.unload_factor_table()
+
+    assert with_table == without_table
+
+
+@pytest.mark.parametrize("rate, term", [
+    ("0", 12),        # No factor at 0%
+    ("2.505", 12),    # Between grid steps
+    ("3.01", 12),     # Beyond the rates of the grid
+    ("1.5", 37),      # Beyond the terms of the grid
+])
+def test_off_grid_input_falls_back_to_the_formula(loaded_table, rate, term):
+    table = AnnuityFactorTable.open(loaded_table)
+    try:
+        assert table.lookup(Decimal(rate), term) is None
+    finally:
+        table.close()
+
+    if Decimal(rate) != 0:
+        percentage = Percentage(Decimal(rate))
+        assert LoanCalculator.annuity_factor(percentage, term) == (
+            LoanCalculator._compute_annuity_factor(percentage, term)
+        )
+
+
+def test_verify_checks_the_whole_grid(table_path):
+    assert verify(table_path) == RATE_STEPS * MAX_TERM_MONTHS
+
+
+def test_verify_detects_a_corrupted_entry(table_path):
+    data = bytearray(table_path.read_bytes())
+    data[-annuity_factor_table.RECORD_SIZE] ^= 0x01
+    table_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="Mismatch"):
+        verify(table_path)
+
+
+def test_incompatible_files_are_not_loaded(table_path, tmp_path):
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(table_path.read_bytes()[:-1])
+
+    assert AnnuityFactorTable.open(truncated) is None
+    assert AnnuityFactorTable.open(tmp_path / "missing.bin") is None
+    assert not LoanCalculator.load_factor_table(str(truncated))
+    assert LoanCalculator._factor_table is None
@@ -0,0 +1,220 @@
+"""
+Bulk loan offer creation: one customer query, one INSERT, one commit (PostgreSQL)
+
+Needs TEST_POSTGRES_URL pointing to a database at `alembic upgrade head`;
+skipped otherwise, since the customer check binds the IDs as a single
+PostgreSQL array (id = ANY(:customer_ids)). Customers created by a test
+are deleted afterwards, their offers with them.
+"""
+import asyncio
+import os
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.application.dtos.customer_dto import CustomerCreateDTO
+from app.application.dtos.loan_offer_dto import LoanOfferBulkCreateDTO, LoanOfferCreateDTO
+from app.application.exceptions import CustomerNotFoundError
+from app.application.use_cases.loan_offer import CreateLoanOffersUseCase
+from app.infrastructure.api.dependencies import get_uow
+from app.infrastructure.database.models import CustomerModel, LoanOfferModel
+from app.infrastructure.database.repositories import CustomerRepository
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.main import app
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL not set")
+
+BULK_URL = "/api/v1/loanoffers/bulk"
+
+
+@pytest.fixture
+def pg_sessionmaker():
+    engine = create_async_engine(POSTGRES_URL, poolclass=NullPool)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def customer_ids(pg_sessionmaker):
+    """Two new customers, deleted (with their offers) after the test"""
+    async def create():
+        async with pg_sessionmaker() as session:
+            repository = CustomerRepository(session)
+            created = [
+                await repository.create(CustomerCreateDTO(
+                    first_name="Bulk",
+                    last_name="Test",
+                    email=f"bulk-{uuid.uuid4().hex}@example.com"
+                ))
+                for _ in range(2)
+            ]
+            await session.commit()
+            return [customer.id for customer in created]
+
+    async def remove(ids):
+        async with pg_sessionmaker() as session:
+            await session.execute(delete(CustomerModel).where(CustomerModel.id.in_(ids)))
+            await session.commit()
+
+    try:
+        ids = asyncio.run(create())
+    except OSError as e:
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+    yield ids
+    asyncio.run(remove(ids))
+
+
+@pytest.fixture
+def sql_log(pg_sessionmaker, customer_ids):
+    """Statements and commits sent after the customers were created"""
+    log = {"statements": [], "commits": 0}
+    sync_engine = pg_sessionmaker.kw["bind"].sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        log["statements"].append(statement)
+
+    @event.listens_for(sync_engine, "commit")
+    def record_commit(conn):
+        log["commits"] += 1
+
+    return log
+
+
+def _offer(customer_id, amount="10000", rate="5", term=12):
+    return LoanOfferCreateDTO(
+        customer_id=customer_id,
+        loan_amount=Decimal(amount),
+        interest_rate=Decimal(rate),
+        term_months=term
+    )
+
+
+def _create(pg_sessionmaker, offers):
+    async def run():
+        uow = UnitOfWork(pg_sessionmaker)
+        try:
+            return await CreateLoanOffersUseCase(uow).execute(
+                LoanOfferBulkCreateDTO(offers=offers)
+            )
+        finally:
+            await uow.close()
+
+    return asyncio.run(run())
+
+
+def _stored_offers(pg_sessionmaker, customer_ids):
+    async def run():
+        async with pg_sessionmaker() as session:
+            result = await session.execute(
+                select(LoanOfferModel.id).where(LoanOfferModel.customer_id.in_(customer_ids))
+            )
+            return result.scalars().all()
+
+    return asyncio.run(run())
+
+
+def test_one_query_one_insert_one_commit(pg_sessionmaker, customer_ids, sql_log):
+    first, second = customer_ids
+    offers = [
+        _offer(second, "1000"),
+        _offer(first, "2000", "0", 24),
+        _offer(second, "3000", "7.5", 360),
+        _offer(first, "4000"),
+    ]
+
+    created = _create(pg_sessionmaker, offers)
+
+    select_customers, insert_offers = sql_log["statements"]
+    assert "= ANY (" in select_customers
+    assert insert_offers.startswith("INSERT INTO loan_offers")
+    assert "RETURNING" in insert_offers
+    assert sql_log["commits"] == 1
+
+    # Request order, with the generated IDs
+    assert [(o.customer_id, o.loan_amount) for o in created] == [
+        (offer.customer_id, offer.loan_amount) for offer in offers
+    ]
+    assert all(o.id is not None for o in created)
+    assert sorted(_stored_offers(pg_sessionmaker, customer_ids)) == sorted(o.id for o in created)
+
+
+def test_rows_come_back_in_request_order(pg_sessionmaker, customer_ids, sql_log):
+    amounts = [str(1000 + (index * 7919) % 5000) for index in range(200)]
+
+    created = _create(
+        pg_sessionmaker,
+        [_offer(customer_ids[index % 2], amount) for index, amount in enumerate(amounts)]
+    )
+
+    assert [o.loan_amount for o in created] == [Decimal(amount) for amount in amounts]
+    assert [o.customer_id for o in created] == [customer_ids[i % 2] for i in range(200)]
+    assert len(sql_log["statements"]) == 2
+
+
+def test_missing_customer_rejects_the_whole_batch(pg_sessionmaker, customer_ids, sql_log):
+    missing_id = 2**31 - 1
+
+    with pytest.raises(CustomerNotFoundError, match=str(missing_id)):
+        _create(pg_sessionmaker, [_offer(customer_ids[0]), _offer(missing_id)])
+
+    assert len(sql_log["statements"]) == 1
+    assert sql_log["commits"] == 0
+    assert _stored_offers(pg_sessionmaker, customer_ids) == []
+
+
+def test_existing_ids_statement_does_not_depend_on_the_id_count(
+    pg_sessionmaker, customer_ids, sql_log
+):
+    async def existing(ids):
+        async with pg_sessionmaker() as session:
+            return await CustomerRepository(session).get_existing_ids(ids)
+
+    assert asyncio.run(existing([customer_ids[0]])) == {customer_ids[0]}
+    assert asyncio.run(existing(customer_ids + [2**31 - 1])) == set(customer_ids)
+
+    one_id, three_ids = sql_log["statements"]
+    assert one_id == three_ids
+
+
+@pytest.fixture
+def client(pg_sessionmaker):
+    async def uow():
+        uow = UnitOfWork(pg_sessionmaker)
+        try:
+            yield uow
+        finally:
+            await uow.close()
+
+    app.dependency_overrides[get_uow] = uow
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_uow)
+
+
+def test_endpoint_returns_offers_in_request_order(client, customer_ids):
+    response = client.post(BULK_URL, json={"offers": [
+        {"customer_id": customer_ids[1], "loan_amount": 5000, "interest_rate": 3, "term_months": 12},
+        {"customer_id": customer_ids[0], "loan_amount": 10000, "interest_rate": 5, "term_months": 12},
+    ]})
+
+    assert response.status_code == 201
+    data = response.json()["data"]
+    assert [offer["customer_id"] for offer in data] == [customer_ids[1], customer_ids[0]]
+    assert Decimal(data[1]["monthly_payment"]) == Decimal("856.07")
+
+
+def test_endpoint_rejects_a_batch_with_a_missing_customer(client, pg_sessionmaker, customer_ids):
+    response = client.post(BULK_URL, json={"offers": [
+        {"customer_id": customer_ids[0], "loan_amount": 5000, "interest_rate": 3, "term_months": 12},
+        {"customer_id": 2**31 - 1, "loan_amount": 5000, "interest_rate": 3, "term_months": 12},
+    ]})
+
+    assert response.status_code == 404
+    assert _stored_offers(pg_sessionmaker, customer_ids) == []
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+BATCH_URL = "/api/v1/loanoffers/calculate/batch"
+
+
+@pytest.fixture
+def client():
+    # Calculations need no database, so the lifespan is not started
+    return TestClient(app)
+
+
+def test_invalid_items_are_reported_per_item(client):
+    response = client.post(BATCH_URL, json={"items": [
+        {"loan_amount": 10000, "interest_rate": 5, "term_months": 12},
+        # Passes gt=0, but rounds to 0.00
+        {"loan_amount": 0.001, "interest_rate": 5, "term_months": 12},
+        {"loan_amount": 10000, "interest_rate": 5, "term_months": 0},
+        {"loan_amount": "abc"},
+        {"loan_amount": 25000, "interest_rate": 0, "term_months": 60},
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert Decimal(results[0]["result"]["monthly_payment"]) == Decimal("856.07")
+    assert results[1]["result"] is None
+    assert "Principal must be positive" in results[1]["error"]
+    assert "term_months" in results[2]["error"]
+    assert "loan_amount" in results[3]["error"]
+    assert Decimal(results[4]["result"]["monthly_payment"]) == Decimal("416.67")
+
+
+def test_batch_of_only_invalid_items(client):
+    response = client.post(BATCH_URL, json={"items": [
+        {"loan_amount": 0.004, "interest_rate": 5, "term_months": 12},
+    ]})
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["error"]
+
+
+def test_request_schema_documents_the_items():
+    schema = app.openapi()["components"]["schemas"]["LoanCalculationBatchDTO"]
+
+    assert {"$ref": "#/components/schemas/LoanCalculationDTO"} in (
+        schema["properties"]["items"]["items"]["anyOf"]
+    )
@@ -0,0 +1,62 @@
+import pytest
+
+from app.application import pagination
+from app.application.pagination import CountCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pagination.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_counts_expire_after_the_ttl(clock):
+    cache = CountCache(ttl_seconds=30)
+    cache.set(("loan_offers", 1), 5)
+
+    clock[0] += 30
+    assert cache.get(("loan_offers", 1)) == 5
+    clock[0] += 1
+    assert cache.get(("loan_offers", 1)) is None
+    assert len(cache) == 0
+
+
+def test_expired_entries_are_swept_on_set(clock):
+    cache = CountCache(ttl_seconds=30)
+    for customer_id in range(1000):
+        cache.set(("loan_offers", customer_id), customer_id)
+
+    clock[0] += 31
+    cache.set(("loan_offers", 1000), 1)
+
+    assert len(cache) == 1
+    assert cache.get(("loan_offers", 1000)) == 1
+
+
+def test_size_is_bounded_oldest_first(clock):
+    cache = CountCache(ttl_seconds=30, maxsize=3)
+    for customer_id in range(5):
+        clock[0] += 1
+        cache.set(("loan_offers", customer_id), customer_id)
+
+    assert len(cache) == 3
+    assert cache.get(("loan_offers", 0)) is None
+    assert cache.get(("loan_offers", 1)) is None
+    assert [cache.get(("loan_offers", i)) for i in (2, 3, 4)] == [2, 3, 4]
+
+
+def test_set_renews_an_entry(clock):
+    cache = CountCache(ttl_seconds=30, maxsize=2)
+    cache.set("customers", 10)
+    cache.set(("loan_offers", 1), 1)
+    cache.set("customers", 11)
+    cache.set(("loan_offers", 2), 2)
+
+    assert cache.get("customers") == 11
+    assert cache.get(("loan_offers", 1)) is None
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        CountCache(maxsize=0)
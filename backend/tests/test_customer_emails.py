@@ -0,0 +1,137 @@
+"""
+Emails are stored normalized and unique regardless of case
+
+Runs against SQLite and, when TEST_POSTGRES_URL is set, against
+PostgreSQL at `alembic upgrade head` (uq_customers_email_lower from the
+migration). Customers created on PostgreSQL are deleted afterwards.
+"""
+import asyncio
+import os
+import uuid
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.application.dtos.customer_dto import CustomerCreateDTO, CustomerUpdateDTO
+from app.application.exceptions import CustomerAlreadyExistsError
+from app.infrastructure.database.models import CustomerModel
+from app.infrastructure.database.repositories import CustomerRepository
+from test_import_customers import _import, _row
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+# Unique per run, so tests don't collide with rows in a shared database
+TAG = uuid.uuid4().hex[:8]
+JANE = f"jane.{TAG}@example.com"
+JOHN = f"john.{TAG}@example.com"
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def db(request):
+    """Session factory of the database under test"""
+    if request.param == "sqlite":
+        yield request.getfixturevalue("sessionmaker")
+        return
+
+    if POSTGRES_URL is None:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    engine = create_async_engine(POSTGRES_URL, poolclass=NullPool)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def remove_test_customers():
+        async with sessionmaker() as session:
+            await session.execute(
+                delete(CustomerModel).where(CustomerModel.email.like(f"%.{TAG}@%"))
+            )
+            await session.commit()
+
+    yield sessionmaker
+    asyncio.run(remove_test_customers())
+    asyncio.run(engine.dispose())
+
+
+def _run(sessionmaker, work):
+    async def run():
+        async with sessionmaker() as session:
+            result = await work(CustomerRepository(session))
+            await session.commit()
+            return result
+
+    return asyncio.run(run())
+
+
+def _create(sessionmaker, email):
+    return _run(sessionmaker, lambda customers: customers.create(
+        CustomerCreateDTO(first_name="Jane", last_name="Doe", email=email)
+    ))
+
+
+def _stored_emails(sessionmaker):
+    async def run():
+        async with sessionmaker() as session:
+            result = await session.execute(
+                select(CustomerModel.email)
+                .where(CustomerModel.email.like(f"%.{TAG}@%"))
+                .order_by(CustomerModel.id)
+            )
+            return result.scalars().all()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("email", [JANE.upper(), f"  Jane.{TAG}@Example.COM  "])
+def test_create_stores_the_normalized_email(db, email):
+    created = _create(db, email)
+
+    assert str(created.email) == JANE
+    assert _stored_emails(db) == [JANE]
+
+
+@pytest.mark.parametrize("lookup", [JANE, JANE.upper(), f"  Jane.{TAG}@Example.COM "])
+def test_lookups_ignore_case_and_padding(db, lookup):
+    created = _create(db, JANE)
+
+    found = _run(db, lambda customers: customers.get_by_email(lookup))
+
+    assert found is not None and found.id == created.id
+    assert _run(db, lambda customers: customers.exists_by_email(lookup))
+    assert not _run(db, lambda customers: customers.exists_by_email(JOHN.upper()))
+
+
+def test_create_rejects_a_case_only_duplicate(db):
+    _create(db, JANE)
+
+    with pytest.raises(CustomerAlreadyExistsError):
+        _create(db, JANE.upper())
+
+    assert _stored_emails(db) == [JANE]
+
+
+def test_import_rejects_case_only_duplicates(db):
+    _create(db, JANE)
+
+    result = _import(db, [
+        _row(email=JANE.upper()),       # Already stored
+        _row(email=JOHN),
+        _row(email=f" {JOHN.title()}"),  # Repeats line 2
+    ], batch_size=10)
+
+    assert result.imported == 1
+    assert sorted(error.line for error in result.errors) == [1, 3]
+    assert _stored_emails(db) == [JANE, JOHN]
+
+
+def test_update_rejects_a_case_only_duplicate(db):
+    if db.kw["bind"].dialect.name != "postgresql":
+        pytest.skip("Duplicates are recognized by their PostgreSQL SQLSTATE")
+    _create(db, JANE)
+    john = _create(db, JOHN)
+
+    with pytest.raises(CustomerAlreadyExistsError):
+        _run(db, lambda customers: customers.update(
+            john.id, CustomerUpdateDTO(email=JANE.upper())
+        ))
+
+    assert _stored_emails(db) == [JANE, JOHN]
@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+from app.application.use_cases.customer import ImportCustomersUseCase
+from app.infrastructure.api.importing import parse_import
+from app.infrastructure.database.unit_of_work import UnitOfWork
+
+
+def _import(sessionmaker, lines, batch_size=1):
+    async def chunks():
+        yield "".join(line + "\n" for line in lines).encode()
+
+    async def run():
+        uow = UnitOfWork(sessionmaker)
+        try:
+            return await ImportCustomersUseCase(uow, batch_size=batch_size).execute(
+                parse_import(chunks(), "ndjson")
+            )
+        finally:
+            await uow.close()
+
+    return asyncio.run(run())
+
+
+def _row(**fields):
+    return json.dumps({"first_name": "Jane", "last_name": "Doe", **fields})
+
+
+def test_non_string_or_missing_emails_are_reported(sessionmaker):
+    result = _import(sessionmaker, [
+        _row(email="first@example.com"),
+        _row(email=123),
+        _row(email=["a@example.com"]),
+        _row(email={"address": "b@example.com"}),
+        _row(email=None),
+        _row(),
+        _row(email=True),
+        _row(email="last@example.com"),
+    ])
+
+    assert result.received == 8
+    assert result.imported == 2
+    assert result.failed == 6
+    assert [(error.line, error.email) for error in result.errors] == [
+        (2, "123"),
+        (3, "['a@example.com']"),
+        (4, "{'address': 'b@example.com'}"),
+        (5, None),
+        (6, None),
+        (7, "True"),
+    ]
+    assert all(error.error for error in result.errors)
@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+GRID_URL = "/api/v1/loanoffers/calculate/grid"
+GRID_PARAMS = {
+    "loan_amount": "10000",
+    "rate_min": "1",
+    "rate_max": "2",
+    "term_min": "12",
+    "term_max": "24",
+}
+
+
+@pytest.fixture
+def client():
+    # The grid needs no database, so the lifespan is not started
+    return TestClient(app)
+
+
+@pytest.fixture
+def etag(client):
+    response = client.get(GRID_URL, params=GRID_PARAMS)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+def _get(client, if_none_match):
+    return client.get(GRID_URL, params=GRID_PARAMS, headers={"If-None-Match": if_none_match})
+
+
+def test_exact_tag_is_not_modified(client, etag):
+    response = _get(client, etag)
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_tag_in_a_list_is_not_modified(client, etag):
+    assert _get(client, f'"other", {etag} ,"another"').status_code == 304
+
+
+def test_weak_tag_is_not_modified(client, etag):
+    assert _get(client, f'"other", W/{etag}').status_code == 304
+
+
+def test_star_is_not_modified(client, etag):
+    assert _get(client, "*").status_code == 304
+
+
+@pytest.mark.parametrize("header", [
+    '"other"',
+    "{unquoted}",
+    '"{bare}0"',
+    '"x{bare}',
+])
+def test_other_tags_get_the_grid(client, etag, header):
+    bare = etag.strip('"')
+    response = _get(client, header.format(unquoted=bare, bare=bare))
+
+    assert response.status_code == 200
+    assert response.json()["data"]
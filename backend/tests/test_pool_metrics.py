@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.infrastructure.database.connection import DatabaseConnection, _check_liveness
+from app.infrastructure.database.pool import MeteredQueuePool
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+
+
+def _engine(url: str, **kwargs):
+    options = {"poolclass": MeteredQueuePool, "pool_size": 1, "max_overflow": 0}
+    return create_async_engine(url, **{**options, **kwargs})
+
+
+def test_checkouts_and_waits_are_counted(database_url):
+    async def run():
+        engine = _engine(database_url)
+        try:
+            for _ in range(3):
+                async with engine.connect() as conn:
+                    await conn.exec_driver_sql("SELECT 1")
+            return engine.pool.snapshot()
+        finally:
+            await engine.dispose()
+
+    snapshot = asyncio.run(run())
+
+    assert snapshot["checkouts"] == 3
+    assert snapshot["timeouts"] == 0
+    assert snapshot["checked_out"] == 0
+    assert snapshot["checked_in"] == 1
+    assert snapshot["wait_seconds_max"] <= snapshot["wait_seconds_total"]
+
+
+def test_checkout_timeouts_are_counted(database_url):
+    async def run():
+        engine = _engine(database_url, pool_timeout=0.05)
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+                return engine.pool.snapshot()
+        finally:
+            await engine.dispose()
+
+    snapshot = asyncio.run(run())
+
+    assert snapshot["timeouts"] == 1
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checked_out"] == 1
+    assert snapshot["wait_seconds_max"] >= 0.05
+
+
+def test_counters_survive_dispose(database_url):
+    async def run():
+        engine = _engine(database_url)
+        try:
+            async with engine.connect():
+                pass
+            await engine.dispose()
+            async with engine.connect():
+                pass
+            return engine.pool.snapshot()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run())["checkouts"] == 2
+
+
+def test_liveness_ping_uses_an_idle_connection(database_url):
+    async def run():
+        engine = _engine(database_url)
+        try:
+            async with engine.connect():
+                pass
+            pool = engine.pool
+            await _check_liveness(engine)
+            return pool, engine.pool
+        finally:
+            await engine.dispose()
+
+    pool, current = asyncio.run(run())
+
+    assert current is pool
+    assert pool.stats.checkouts == 2
+    assert pool.stats.liveness_failures == 0
+    assert pool.stats.liveness_skips == 0
+
+
+def test_starved_pool_is_skipped_not_reset(database_url):
+    async def run():
+        engine = _engine(database_url, pool_timeout=5)
+        try:
+            async with engine.connect():
+                pool = engine.pool
+                started = time.perf_counter()
+                await _check_liveness(engine)
+                elapsed = time.perf_counter() - started
+                return pool, engine.pool, elapsed
+        finally:
+            await engine.dispose()
+
+    pool, current, elapsed = asyncio.run(run())
+
+    assert current is pool
+    assert elapsed < 1
+    assert pool.stats.liveness_failures == 0
+    assert pool.stats.liveness_skips == 1
+    assert pool.stats.timeouts == 0
+
+
+def test_unreachable_database_resets_the_pool(database_url):
+    async def refuse():
+        raise ConnectionRefusedError("Connection refused")
+
+    async def run():
+        engine = _engine(database_url, async_creator=refuse)
+        try:
+            pool = engine.pool
+            await _check_liveness(engine)
+            return pool, engine.pool
+        finally:
+            await engine.dispose()
+
+    pool, current = asyncio.run(run())
+
+    assert current is not pool
+    assert current.stats.liveness_failures == 1
+
+
+def test_liveness_checks_run_in_the_background(database_url, monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_URL", database_url)
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+
+    async def run():
+        await DatabaseConnection.close()
+        engine = DatabaseConnection.get_engine()
+        try:
+            DatabaseConnection.start_liveness_checks(0.01)
+            task = DatabaseConnection._liveness_task
+            await asyncio.sleep(0.2)
+            return engine.pool.stats.checkouts, task
+        finally:
+            await DatabaseConnection.close()
+
+    checkouts, task = asyncio.run(run())
+
+    assert checkouts >= 2
+    assert task.cancelled()
+    assert DatabaseConnection._liveness_task is None
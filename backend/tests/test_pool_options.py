@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.infrastructure.database.pool import MeteredQueuePool, _per_worker, pool_options
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    def set_workers(count: int) -> None:
+        monkeypatch.setattr(settings, "WEB_CONCURRENCY", count)
+    return set_workers
+
+
+@pytest.mark.parametrize("total, workers_count, expected", [
+    (10, 1, 10),
+    (10, 2, 5),
+    (10, 3, 3),   # Rounded down, within the budget
+    (20, 7, 2),
+    (1, 4, 1),    # Never rounded down to 0 (unlimited)
+    (10, 0, 10),  # WEB_CONCURRENCY=0 counts as one worker
+])
+def test_budget_is_split_between_workers(workers, total, workers_count, expected):
+    workers(workers_count)
+
+    assert _per_worker(total) == expected
+
+
+@pytest.mark.parametrize("total", [7, 10, 20, 100])
+@pytest.mark.parametrize("workers_count", [2, 3, 7])
+def test_workers_stay_within_the_budget(workers, total, workers_count):
+    workers(workers_count)
+
+    assert _per_worker(total) * workers_count <= total
+
+
+@pytest.mark.parametrize("total", [0, -1])
+@pytest.mark.parametrize("workers_count", [1, 4])
+def test_zero_and_negative_keep_their_meaning(workers, total, workers_count):
+    workers(workers_count)
+
+    assert _per_worker(total) == total
+
+
+def test_unlimited_overflow_reaches_the_pool(workers, monkeypatch):
+    workers(4)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 10)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", -1)
+
+    options = pool_options()
+    engine = create_async_engine("sqlite+aiosqlite://", **options)
+
+    assert options["pool_size"] == 2
+    assert options["max_overflow"] == -1
+    assert isinstance(engine.pool, MeteredQueuePool)
+    assert engine.pool._max_overflow == -1
@@ -0,0 +1,111 @@
+"""
+Which database and connection options each transaction mode resolves to
+"""
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from app.application.interfaces import TransactionMode
+from app.config import settings
+from app.infrastructure.api.dependencies import get_read_uow, get_snapshot_uow, get_uow
+from app.infrastructure.api.read_your_writes import COOKIE_NAME
+from app.infrastructure.database.connection import DatabaseConnection
+
+PRIMARY_URL = "sqlite+aiosqlite:///primary.db"
+REPLICA_URLS = ["sqlite+aiosqlite:///replica1.db", "sqlite+aiosqlite:///replica2.db"]
+
+EXPECTED_OPTIONS = {
+    TransactionMode.READ_WRITE: {},
+    TransactionMode.READ_ONLY: {"isolation_level": "AUTOCOMMIT"},
+    TransactionMode.SNAPSHOT: {
+        "isolation_level": "REPEATABLE READ",
+        "postgresql_readonly": True,
+    },
+}
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    """Primary and two replicas (engines are created, never connected)"""
+    monkeypatch.setattr(settings, "DATABASE_URL", PRIMARY_URL)
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", REPLICA_URLS)
+    asyncio.run(DatabaseConnection.close())
+    yield
+    asyncio.run(DatabaseConnection.close())
+
+
+def _resolved(sessionmaker):
+    """(database URL, execution options) of a sessionmaker's bind"""
+    bind = sessionmaker.kw["bind"]
+    return str(bind.url), bind.get_execution_options()
+
+
+def _request(pinned: bool) -> Request:
+    headers = [(b"cookie", f"{COOKIE_NAME}=1".encode())] if pinned else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def _uow_bind(dependency, request):
+    uow_generator = dependency(request)
+    uow = await anext(uow_generator)
+    try:
+        bind = uow.customers.session.bind
+        return uow.mode, str(bind.url), bind.get_execution_options()
+    finally:
+        await uow_generator.aclose()
+
+
+@pytest.mark.parametrize("mode", list(TransactionMode))
+def test_primary_sessionmaker_options(replicas, mode):
+    url, options = _resolved(DatabaseConnection.get_sessionmaker(mode))
+
+    assert url == PRIMARY_URL
+    assert dict(options) == EXPECTED_OPTIONS[mode]
+
+
+@pytest.mark.parametrize("mode", [TransactionMode.READ_ONLY, TransactionMode.SNAPSHOT])
+def test_read_sessionmaker_round_robins_replicas(replicas, mode):
+    resolved = [_resolved(DatabaseConnection.get_read_sessionmaker(mode)) for _ in range(4)]
+
+    assert [url for url, _ in resolved] == REPLICA_URLS * 2
+    assert all(dict(options) == EXPECTED_OPTIONS[mode] for _, options in resolved)
+
+
+@pytest.mark.parametrize("mode", [TransactionMode.READ_ONLY, TransactionMode.SNAPSHOT])
+def test_modes_sent_to_replicas_are_allowed_on_hot_standby(replicas, mode):
+    _, options = _resolved(DatabaseConnection.get_read_sessionmaker(mode))
+
+    # PostgreSQL refuses SERIALIZABLE (and so DEFERRABLE) on a hot standby
+    assert options.get("isolation_level") != "SERIALIZABLE"
+    assert not options.get("postgresql_deferrable")
+
+
+def test_read_sessionmaker_without_replicas_uses_primary(replicas, monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+
+    url, options = _resolved(DatabaseConnection.get_read_sessionmaker(TransactionMode.SNAPSHOT))
+
+    assert url == PRIMARY_URL
+    assert dict(options) == EXPECTED_OPTIONS[TransactionMode.SNAPSHOT]
+
+
+@pytest.mark.parametrize("dependency, mode", [
+    (get_read_uow, TransactionMode.READ_ONLY),
+    (get_snapshot_uow, TransactionMode.SNAPSHOT),
+])
+@pytest.mark.parametrize("pinned", [False, True])
+def test_read_dependencies(replicas, dependency, mode, pinned):
+    uow_mode, url, options = asyncio.run(_uow_bind(dependency, _request(pinned)))
+
+    assert uow_mode == mode
+    assert url == (PRIMARY_URL if pinned else REPLICA_URLS[0])
+    assert dict(options) == EXPECTED_OPTIONS[mode]
+
+
+def test_write_dependency_uses_primary(replicas):
+    uow_mode, url, options = asyncio.run(_uow_bind(get_uow, _request(pinned=False)))
+
+    assert uow_mode == TransactionMode.READ_WRITE
+    assert url == PRIMARY_URL
+    assert dict(options) == {}
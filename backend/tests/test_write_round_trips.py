@@ -0,0 +1,132 @@
+"""
+Single-row writes are one statement each (INSERT/UPDATE/DELETE ... RETURNING)
+"""
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.application.dtos.customer_dto import CustomerCreateDTO, CustomerUpdateDTO
+from app.application.exceptions import CustomerAlreadyExistsError
+from app.domain.entities.loan_offer import LoanOffer
+from app.domain.services.loan_calculator import LoanCalculator
+from app.domain.value_objects.money import Money
+from app.domain.value_objects.percentage import Percentage
+from app.infrastructure.database.repositories import CustomerRepository, LoanOfferRepository
+
+
+def _run(sessionmaker, work):
+    async def run():
+        async with sessionmaker() as session:
+            result = await work(session)
+            await session.commit()
+            return result
+
+    return asyncio.run(run())
+
+
+def _customer(email="jane@example.com"):
+    return CustomerCreateDTO(first_name="Jane", last_name="Doe", email=email)
+
+
+def _loan_offer(customer_id):
+    principal = Money(Decimal("10000"), 'EUR')
+    rate = Percentage(Decimal("5"))
+    calculations = LoanCalculator.calculate_all(principal, rate, 12)
+    return LoanOffer.create(
+        customer_id=customer_id,
+        principal=principal,
+        interest_rate=rate,
+        term_months=12,
+        monthly_payment=calculations['monthly_payment'],
+        total_payment=calculations['total_payment'],
+        total_interest=calculations['total_interest']
+    )
+
+
+@pytest.fixture
+def customer(sessionmaker, statements):
+    created = _run(sessionmaker, lambda session: CustomerRepository(session).create(_customer()))
+    statements.clear()
+    return created
+
+
+@pytest.fixture
+def loan_offer(sessionmaker, statements, customer):
+    created = _run(
+        sessionmaker,
+        lambda session: LoanOfferRepository(session).create(_loan_offer(customer.id))
+    )
+    statements.clear()
+    return created
+
+
+def test_create_customer(sessionmaker, statements):
+    created = _run(
+        sessionmaker,
+        lambda session: CustomerRepository(session).create(_customer("New@Example.com"))
+    )
+
+    assert created.id is not None
+    assert str(created.email) == "new@example.com"
+    assert len(statements) == 1
+
+
+def test_create_customer_with_taken_email(sessionmaker, statements, customer):
+    with pytest.raises(CustomerAlreadyExistsError):
+        _run(sessionmaker, lambda session: CustomerRepository(session).create(_customer()))
+
+    assert len(statements) == 1
+
+
+def test_update_customer(sessionmaker, statements, customer):
+    updated = _run(
+        sessionmaker,
+        lambda session: CustomerRepository(session).update(
+            customer.id, CustomerUpdateDTO(last_name="Roe")
+        )
+    )
+
+    assert updated.last_name == "Roe"
+    assert len(statements) == 1
+
+
+def test_update_missing_customer(sessionmaker, statements):
+    updated = _run(
+        sessionmaker,
+        lambda session: CustomerRepository(session).update(9999, CustomerUpdateDTO(last_name="Roe"))
+    )
+
+    assert updated is None
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize("exists", [True, False])
+def test_delete_customer(sessionmaker, statements, customer, exists):
+    customer_id = customer.id if exists else 9999
+
+    deleted = _run(sessionmaker, lambda session: CustomerRepository(session).delete(customer_id))
+
+    assert deleted is exists
+    assert len(statements) == 1
+
+
+def test_create_loan_offer(sessionmaker, statements, customer):
+    created = _run(
+        sessionmaker,
+        lambda session: LoanOfferRepository(session).create(_loan_offer(customer.id))
+    )
+
+    assert created.id is not None
+    assert created.customer_id == customer.id
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize("exists", [True, False])
+def test_delete_loan_offer(sessionmaker, statements, loan_offer, exists):
+    offer_id = loan_offer.id if exists else 9999
+
+    deleted = _run(sessionmaker, lambda session: LoanOfferRepository(session).delete(offer_id))
+
+    assert deleted is exists
+    assert len(statements) == 1
@@ -187,7 +187,9 @@ export default function CustomerDetailClient({
                     </CardTitle>
                     <Badge>{offer.term_months} months</Badge>
                   </div>
-                  <CardDescription>{offer.interest_rate}% APR</CardDescription>
+                  <CardDescription>
+                    {offer.interest_rate}% nominal · {offer.effective_annual_rate}% APR
+                  </CardDescription>
                 </CardHeader>
                 <CardContent className="space-y-3">
                   <div className="space-y-2">
@@ -112,8 +112,10 @@ export default function CustomerListClient() {
     );
   }
 
-  const totalPages = Math.ceil(data.total / pageSize);
-  const hasNextPage = page < totalPages - 1;
+  // total is null only when the API was asked not to count
+  const total = data.total ?? page * pageSize + data.data.length;
+  const totalPages = Math.ceil(total / pageSize);
+  const hasNextPage = data.has_more;
   const hasPrevPage = page > 0;
 
   return (
@@ -124,12 +126,12 @@ export default function CustomerListClient() {
             <div className="flex items-center justify-between">
               <div>
                 <p className="text-sm text-muted-foreground">Total Customers</p>
-                <p className="text-3xl font-bold">{data.total}</p>
+                <p className="text-3xl font-bold">{total}</p>
               </div>
               <div className="text-right">
                 <p className="text-sm text-muted-foreground">
                   Showing {page * pageSize + 1} -{" "}
-                  {Math.min((page + 1) * pageSize, data.total)} of {data.total}
+                  {Math.min((page + 1) * pageSize, total)} of {total}
                 </p>
               </div>
             </div>
@@ -14,6 +14,8 @@ class ApiClient {
         "Content-Type": "application/json",
       },
       timeout: 30000,
+      // Read-your-writes cookie for read replica routing
+      withCredentials: true,
     });
 
     this.setupInterceptors();
@@ -81,7 +81,7 @@ export function useCreateCustomer(): UseMutationResult<
               } as Customer,
               ...old.data,
             ],
-            total: old.total + 1,
+            total: old.total === null ? null : old.total + 1,
           };
         }
       );
@@ -172,7 +172,7 @@ export function useDeleteCustomer(): UseMutationResult<
           return {
             ...old,
             data: old.data.filter((customer) => customer.id !== id),
-            total: old.total - 1,
+            total: old.total === null ? null : old.total - 1,
           };
         }
       );
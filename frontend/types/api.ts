@@ -5,10 +5,11 @@ export interface ApiResponse<T> {
 
 export interface PaginatedResponse<T> {
   data: T[];
-  total: number;
+  total: number | null;
   skip: number;
   limit: number;
   has_more: boolean;
+  next_cursor?: string | null;
 }
 
 export interface ApiError {
@@ -19,6 +20,7 @@ export interface ApiError {
 export interface PaginationParams {
   skip?: number;
   limit?: number;
+  cursor?: string;
 }
 
 export type UnwrapApiResponse<T> = T;
@@ -7,6 +7,7 @@ export interface LoanOffer {
   monthly_payment: number;
   total_payment: number;
   total_interest: number;
+  effective_annual_rate: number;
   created_at: string;
 }
 